@@ -3,6 +3,14 @@
 import random
 import operator  # Utilisé pour trier facilement la population
 
+from croisements import croisement_ox1, obtenir_operateur_croisement
+from selection import selectionner_parents
+from mouvements import calculer_plus_proches_voisins
+from recherche_locale import recherche_locale, est_symetrique, mutation_or_opt, OPERATEURS_MUTATION
+from progression import SuiviProgression
+from instrumentation import SANS_INSTRUMENTATION
+from construction import population_initiale
+
 # --- Données du Problème (Matrice des Distances) ---
 # Matrice représentant les distances entre 10 villes (de 0 à 9).
 # matrice_distances[i][j] donne la distance entre la ville i et la ville j.
@@ -55,69 +63,30 @@ def selection_parents_roulette(population, fitnesses):
     """
     Sélectionne deux parents en utilisant la méthode de la roue de loterie (Roulette Wheel).
     Les individus avec une meilleure fitness ont une plus grande probabilité d'être sélectionnés.
+    Les deux parents sont tirés dans une table d'échantillonnage construite pour l'occasion ;
+    pour tirer tous les parents d'une génération en une fois, voir selection.selectionner_parents.
     """
-    total_fitness = sum(fitnesses)
-    parents = []
-
-    # On effectue deux tours de roue pour sélectionner deux parents
-    for _ in range(2):
-        # On 'lance la bille' sur la roue en choisissant un nombre aléatoire entre 0 et la fitness totale
-        selection = random.uniform(0, total_fitness)
-        somme_actuelle = 0
-
-        # Gérer le cas où total_fitness est 0 pour éviter une boucle infinie
-        if total_fitness == 0:
-            parents.append(random.choice(population))
-            continue
-
-        # On parcourt la roue pour voir où la bille s'arrête
-        for i, fitness_ind in enumerate(fitnesses):
-            somme_actuelle += fitness_ind
-            if somme_actuelle >= selection:
-                parents.append(population[i])
-                break  # Le parent est sélectionné, on sort de la boucle
-    return parents[0], parents[1]
+    parent1, parent2 = selectionner_parents(population, fitnesses, 2, methode="roulette", structure="cumulative")
+    return parent1, parent2
 
 
 def croisement(parent1, parent2):
     """
     Effectue un croisement de type Ordered Crossover (OX1), adapté aux problèmes de permutation.
     Ceci garantit que l'enfant est un parcours valide (chaque ville visitée une seule fois).
+    Construit en O(n) (voir croisements.py).
     """
-    taille = len(parent1)
-    enfant = [None] * taille
-
-    # 1. Choisir une sous-séquence aléatoire du parent1
-    debut, fin = sorted(random.sample(range(taille), 2))
-
-    # 2. Copier cette sous-séquence dans l'enfant aux mêmes positions
-    segment_parent1 = parent1[debut:fin + 1]
-    enfant[debut:fin + 1] = segment_parent1
-
-    # 3. Remplir les positions restantes de l'enfant avec les gènes du parent2,
-    # dans l'ordre où ils apparaissent, en évitant les doublons.
-    index_parent2 = 0
-    index_enfant = 0
-    while None in enfant:
-        # Si on est dans la section déjà remplie, on saute
-        if index_enfant >= debut and index_enfant <= fin:
-            index_enfant += 1
-            continue
+    return croisement_ox1(parent1, parent2)
 
-        ville_parent2 = parent2[index_parent2]
-        if ville_parent2 not in segment_parent1:
-            enfant[index_enfant] = ville_parent2
-            index_enfant += 1
-        index_parent2 += 1
 
-    return enfant
-
-
-def mutation(solution, taux_mutation):
+def mutation(solution, taux_mutation, operateur="echange"):
     """
     Effectue une mutation par échange (Swap Mutation).
     Pour chaque gène de la solution, il y a une petite chance qu'il soit échangé avec un autre.
+    Avec operateur="oropt", mutation par déplacement de segments (voir recherche_locale.mutation_or_opt).
     """
+    if operateur == "oropt":
+        return mutation_or_opt(solution, taux_mutation)
     solution_mutee = solution[:]  # Créer une copie
     for i in range(len(solution_mutee)):
         if random.random() < taux_mutation:
@@ -129,57 +98,248 @@ def mutation(solution, taux_mutation):
 
 # --- Algorithme Génétique Principal ---
 
-def algorithme_genetique(matrice, taille_population, nombre_generations, taux_croisement, taux_mutation, taille_elite):
+def evoluer_population(population, matrice, nombre_generations, taux_croisement, taux_mutation, taille_elite,
+                       operateur_croisement="ox1", methode_selection="roulette", taux_recherche_locale=0.0,
+                       suivi=None, cache=None, arret=None, reprise=None, instrumentation=None,
+                       operateur_mutation="echange", diversite=None):
     """
-    Implémentation complète de l'algorithme génétique pour le TSP.
+    Fait évoluer une population donnée pendant 'nombre_generations' générations.
+    Retourne la population finale ainsi que la meilleure solution rencontrée et sa distance.
+    Utilisée par algorithme_genetique et par le modèle en îles (voir modele_iles.py).
+    Avec 'taux_recherche_locale' > 0, chaque enfant est, avec cette probabilité, amélioré
+    par 2-opt et Or-opt jusqu'à un optimum local (algorithme mémétique, voir recherche_locale.py).
+    'suivi' (optionnel) est appelé à chaque nouvelle meilleure solution avec (generation, meilleure_distance).
+    'cache' (optionnel) : un CacheEvaluations, pour ne pas réévaluer les parcours déjà vus (élites, copies).
+    'arret' (optionnel) : un CriteresArret (voir arret.py), vérifié après chaque génération.
+    'reprise' (optionnel) : un PointReprise (voir reprise.py) ; s'il existe déjà, l'évolution reprend
+    à la population et à la génération sauvegardées.
+    'instrumentation' (optionnel) : une Instrumentation (voir instrumentation.py), qui chronomètre
+    l'évaluation, la sélection, le croisement, la mutation et la recherche locale.
+    'operateur_mutation' : "echange" (par défaut) ou "oropt", le déplacement de segments sans inversion
+    (voir recherche_locale.mutation_or_opt), qui convient mieux aux matrices asymétriques.
+    'diversite' (optionnel) : une DiversitePopulation (voir diversite.py), qui rejette les enfants en double,
+    mesure la diversité de chaque génération et déclenche une immigration quand elle s'effondre.
     """
-    nombre_villes = len(matrice)
-
-    # 1. Création de la population initiale de solutions aléatoires
-    population = [random.sample(range(nombre_villes), nombre_villes) for _ in range(taille_population)]
+    if arret is not None:
+        arret.demarrer()
+    etape = (0, population, None, None, float('inf'))
+    for etape in _etapes_generations(population, matrice, nombre_generations, taux_croisement, taux_mutation,
+                                     taille_elite, operateur_croisement, methode_selection, taux_recherche_locale,
+                                     suivi, cache, reprise, instrumentation, operateur_mutation, diversite):
+        if arret is not None and arret.verifier(etape[0], etape[4]):
+            break
+    generation, population, _, meilleure_solution_globale, meilleure_distance_globale = etape
+    if arret is not None:
+        arret.conclure(generation)
+    return population, meilleure_solution_globale, meilleure_distance_globale
+
+
+def _etapes_generations(population, matrice, nombre_generations, taux_croisement, taux_mutation, taille_elite,
+                        operateur_croisement="ox1", methode_selection="roulette", taux_recherche_locale=0.0,
+                        suivi=None, cache=None, reprise=None, instrumentation=None, operateur_mutation="echange",
+                        diversite=None):
+    """
+    Corps de evoluer_population, sous forme de générateur : produit après chaque génération
+    (generation, nouvelle_population, distances_generation_evaluee, meilleure_solution, meilleure_distance).
+    """
+    operateur = obtenir_operateur_croisement(operateur_croisement)
+    if operateur_mutation not in OPERATEURS_MUTATION:
+        raise ValueError(f"Opérateur de mutation inconnu : {operateur_mutation}")
+    taille_population = len(population)
+    if instrumentation is None:
+        instrumentation = SANS_INSTRUMENTATION
+
+    # Listes de voisins et symétrie de la matrice : calculées une seule fois pour toutes les recherches locales
+    if taux_recherche_locale > 0:
+        plus_proches_voisins = calculer_plus_proches_voisins(matrice, 8)
+        symetrique = est_symetrique(matrice)
 
     meilleure_solution_globale = None
     meilleure_distance_globale = float('inf')
 
+    # Reprise d'une exécution interrompue : la population sauvegardée (et l'état du générateur aléatoire)
+    # remplace la population reçue
+    debut = 0
+    etat = reprise.charger("algorithme_genetique") if reprise is not None else None
+    if etat is not None:
+        debut = etat["generation"].item()
+        population = etat["population"].tolist()
+        meilleure_solution_globale = etat["meilleure_solution"].tolist()
+        meilleure_distance_globale = etat["meilleure_distance"].item()
+        # Étape initiale de la reprise (comme la recherche tabou) : si le point de reprise a été écrit
+        # à la dernière génération, la boucle ne s'exécute pas et c'est cette étape qui porte le résultat
+        yield debut, population, None, meilleure_solution_globale, meilleure_distance_globale
+
+    # Clés de Zobrist de la population (voir diversite.py), transmises d'une génération à l'autre
+    if diversite is not None:
+        diversite.demarrer(matrice)
+        if etat is not None:
+            diversite.restaurer({nom[len("diversite_"):]: valeur for nom, valeur in etat.items()
+                                 if nom.startswith("diversite_")})
+        cles_population = diversite.cles_lot(population)
+
     # 2. Boucle principale sur les générations
-    for generation in range(nombre_generations):
+    for generation in range(debut, nombre_generations):
         # 3. Évaluation de chaque individu de la population
-        fitnesses = [calculer_fitness(ind, matrice) for ind in population]
+        # Chaque distance n'est calculée qu'une fois (ou lue dans le cache) ; la fitness
+        # en est déduite comme dans calculer_fitness, et le meilleur n'est pas réévalué.
+        with instrumentation.phase("evaluation"):
+            if cache is not None:
+                succes_avant = cache.succes
+                distances = cache.distances(population)
+                instrumentation.compter("succes_cache", cache.succes - succes_avant)
+            else:
+                distances = [calculer_distance_totale(ind, matrice) for ind in population]
+            fitnesses = [1.0 / distance if distance != 0 else float('inf') for distance in distances]
+        instrumentation.compter("evaluations", len(population))
 
         # Mettre à jour la meilleure solution trouvée jusqu'à présent
-        max_fitness_gen = max(fitnesses)
-        index_meilleur_gen = fitnesses.index(max_fitness_gen)
-        distance_generation = calculer_distance_totale(population[index_meilleur_gen], matrice)
+        distance_generation = min(distances)
+        index_meilleur_gen = distances.index(distance_generation)
 
         if distance_generation < meilleure_distance_globale:
             meilleure_solution_globale = population[index_meilleur_gen]
             meilleure_distance_globale = distance_generation
+            if suivi is not None:
+                suivi(generation + 1, meilleure_distance_globale)
+
+        if diversite is not None:
+            with instrumentation.phase("diversite"):
+                mesure = diversite.mesurer(generation + 1, population, cles_population)
 
         # 4. Création de la nouvelle génération
         nouvelle_population = []
 
         # 5. Élitism: Conserver les meilleurs individus de la génération actuelle
         # On trie la population par fitness décroissante et on garde les 'taille_elite' meilleurs
-        population_avec_fitness = sorted(zip(population, fitnesses), key=operator.itemgetter(1), reverse=True)
-        elite = [individu for individu, fitness in population_avec_fitness[:taille_elite]]
+        with instrumentation.phase("selection"):
+            population_avec_fitness = sorted(zip(population, fitnesses), key=operator.itemgetter(1), reverse=True)
+            elite = [individu for individu, fitness in population_avec_fitness[:taille_elite]]
         nouvelle_population.extend(elite)
 
-        # 6. Remplir le reste de la nouvelle population par croisement et mutation
-        while len(nouvelle_population) < taille_population:
-            parent1, parent2 = selection_parents_roulette(population, fitnesses)
+        # 6. Remplir le reste de la nouvelle population par croisement et mutation.
+        # Tous les parents de la génération sont tirés en un seul lot (une seule roue par génération).
+        nombre_enfants = taille_population - len(nouvelle_population)
+        with instrumentation.phase("selection"):
+            parents = selectionner_parents(population, fitnesses, 2 * nombre_enfants, methode=methode_selection)
+        for k in range(nombre_enfants):
+            parent1, parent2 = parents[2 * k], parents[2 * k + 1]
 
-            enfant = croisement(parent1, parent2) if random.random() < taux_croisement else parent1[:]
+            with instrumentation.phase("croisement"):
+                enfant = operateur(parent1, parent2, matrice) if random.random() < taux_croisement else parent1[:]
 
-            enfant_mute = mutation(enfant, taux_mutation)
+            with instrumentation.phase("mutation"):
+                enfant_mute = mutation(enfant, taux_mutation, operateur_mutation)
+            if taux_recherche_locale > 0 and random.random() < taux_recherche_locale:
+                with instrumentation.phase("recherche_locale"):
+                    enfant_mute, _ = recherche_locale(enfant_mute, matrice, plus_proches_voisins,
+                                                      symetrique=symetrique)
 
             nouvelle_population.append(enfant_mute)
 
+        if diversite is not None:
+            # Rejet des doublons parmi les enfants et immigration éventuelle
+            doublons_avant, immigrants_avant = diversite.doublons_rejetes, diversite.immigrants_introduits
+            with instrumentation.phase("diversite"):
+                enfants, cles_population = diversite.renouveler(generation + 1, mesure, diversite.cles_lot(elite),
+                                                                nouvelle_population[len(elite):])
+                nouvelle_population[len(elite):] = enfants
+            instrumentation.compter("doublons_rejetes", diversite.doublons_rejetes - doublons_avant)
+            instrumentation.compter("immigrants", diversite.immigrants_introduits - immigrants_avant)
+
         # 7. Remplacer l'ancienne population par la nouvelle
         population = nouvelle_population
 
+        if reprise is not None and reprise.doit_ecrire():
+            etat_diversite = {} if diversite is None else {"diversite_" + nom: valeur
+                                                           for nom, valeur in diversite.etat().items()}
+            reprise.ecrire("algorithme_genetique", generation=generation + 1, population=population,
+                           meilleure_solution=meilleure_solution_globale, meilleure_distance=meilleure_distance_globale,
+                           **etat_diversite)
+        yield generation + 1, population, distances, meilleure_solution_globale, meilleure_distance_globale
+
+
+def algorithme_genetique(matrice, taille_population, nombre_generations, taux_croisement, taux_mutation, taille_elite,
+                         backend="python", operateur_croisement="ox1", methode_selection="roulette",
+                         taux_recherche_locale=0.0, suivi=None, cache=None, arret=None, reprise=None,
+                         instrumentation=None, part_construite=0.0, operateur_mutation="echange", diversite=None,
+                         graine=None):
+    """
+    Implémentation complète de l'algorithme génétique pour le TSP.
+    Avec backend="numpy", la population est un tableau NumPy contigu et chaque
+    génération est traitée en lot (voir population_numpy.py).
+    'operateur_croisement' choisit l'opérateur : "ox1", "pmx", "erx" ou "eax" (voir croisements.py).
+    'methode_selection' choisit la sélection : "rang", "roulette", "tournoi" ou "sus" (voir selection.py).
+    'taux_recherche_locale' : probabilité d'améliorer chaque enfant par recherche locale (voir evoluer_population).
+    'suivi' : fonction appelée avec (generation, meilleure_distance) à chaque amélioration (voir benchmark.py).
+    'cache' : CacheEvaluations partagé par les générations ; ses compteurs restent consultables après l'appel.
+    'arret' : CriteresArret (voir arret.py) ; son attribut 'critere' indique ensuite le critère déclenché.
+    'reprise' : PointReprise (voir reprise.py) ; la population est sauvegardée périodiquement, et l'exécution
+    reprend à la dernière génération sauvegardée si le fichier existe.
+    'instrumentation' : Instrumentation (voir instrumentation.py) ; temps par phase et compteurs de l'exécution.
+    'part_construite' : part de la population initiale construite par des variantes aléatoires des
+    heuristiques de construction (voir construction.py), le reste étant aléatoire.
+    'operateur_mutation' : "echange" (par défaut) ou "oropt" (déplacement de segments sans inversion).
+    'diversite' : DiversitePopulation (voir diversite.py) ; rejet des doublons, mesures de diversité et immigration.
+    'graine' : si elle est donnée, réinitialise le module random ; le générateur NumPy du backend "numpy" en est
+    toujours dérivé, si bien que random.seed suffit aussi à rendre reproductible une exécution vectorisée.
+    """
+    if graine is not None:
+        random.seed(graine)
+    if backend == "numpy":
+        from population_numpy import algorithme_genetique_numpy
+        return algorithme_genetique_numpy(matrice, taille_population, nombre_generations, taux_croisement,
+                                          taux_mutation, taille_elite, selection=methode_selection,
+                                          operateur_croisement=operateur_croisement,
+                                          taux_recherche_locale=taux_recherche_locale, suivi=suivi, arret=arret,
+                                          reprise=reprise, instrumentation=instrumentation,
+                                          part_construite=part_construite, operateur_mutation=operateur_mutation,
+                                          diversite=diversite, graine=random.getrandbits(64))
+    if backend != "python":
+        raise ValueError(f"Backend de population inconnu : {backend}")
+
+    # 1. Création de la population initiale de solutions aléatoires (et construites, si part_construite > 0)
+    population = population_initiale(matrice, taille_population, part_construite)
+
+    _, meilleure_solution_globale, meilleure_distance_globale = evoluer_population(
+        population, matrice, nombre_generations, taux_croisement, taux_mutation, taille_elite,
+        operateur_croisement, methode_selection, taux_recherche_locale, suivi, cache, arret, reprise,
+        instrumentation, operateur_mutation, diversite
+    )
     return meilleure_solution_globale, meilleure_distance_globale
 
 
+def iterer_algorithme_genetique(matrice, taille_population, nombre_generations, taux_croisement, taux_mutation,
+                                taille_elite, operateur_croisement="ox1", methode_selection="roulette",
+                                taux_recherche_locale=0.0, cache=None, intervalle=1, periode=0.0, part_construite=0.0,
+                                operateur_mutation="echange", diversite=None):
+    """
+    Variante de algorithme_genetique (backend "python") sous forme de générateur (voir progression.py) :
+    un événement toutes les 'intervalle' générations, et au plus un toutes les 'periode' secondes.
+    Chaque événement contient la génération, la meilleure distance de la génération (distance_actuelle),
+    la meilleure distance globale, la distance moyenne et la pire distance de la génération.
+    Le dernier événement (termine=True) contient la meilleure solution.
+    Avec une DiversitePopulation ('diversite'), chaque événement contient aussi le nombre de parcours
+    distincts et l'entropie des arêtes de la génération.
+    """
+    population = population_initiale(matrice, taille_population, part_construite)
+    progression = SuiviProgression(intervalle, periode)
+
+    etapes = _etapes_generations(population, matrice, nombre_generations, taux_croisement, taux_mutation,
+                                 taille_elite, operateur_croisement, methode_selection, taux_recherche_locale,
+                                 cache=cache, operateur_mutation=operateur_mutation, diversite=diversite)
+    for generation, _, distances, meilleure_solution, meilleure_distance in etapes:
+        final = generation == nombre_generations
+        if progression.doit_emettre(generation, final):
+            mesures = {}
+            if diversite is not None:
+                mesures = {"parcours_uniques": diversite.historique[-1]["parcours_uniques"],
+                           "entropie_aretes": diversite.historique[-1]["entropie_aretes"]}
+            yield progression.evenement(min(distances), meilleure_distance, meilleure_solution, final,
+                                        generation=generation, distance_moyenne=sum(distances) / len(distances),
+                                        distance_pire=max(distances), **mesures)
+
+
 # --- Bloc d'Exécution ---
 if __name__ == "__main__":
     # Hyperparamètres de l'algorithme génétique
@@ -4,6 +4,12 @@
 import random
 import math
 
+from recherche_locale import est_symetrique, fonctions_mouvement
+from progression import SuiviProgression
+from instrumentation import SANS_INSTRUMENTATION
+from construction import parcours_initial
+from refroidissement import SEUIL_ACCEPTATION, calibrer_temperature, obtenir_refroidissement
+
 # --- Données du Problème (Matrice des Distances) ---
 # Matrice représentant les distances entre 10 villes (de 0 à 9)
 matrice_distances = [
@@ -56,57 +62,313 @@ def generer_voisin(solution):
 
 # --- Algorithme Principal : Recuit Simulé ---
 
-def recuit_simule(matrice, temperature_initiale, taux_refroidissement, iterations_max):
+def _fonctions_palier(type_mouvement, nombre_villes, matrice, symetrique):
     """
-    Implémente l'algorithme du recuit simulé pour résoudre le problème du voyageur de commerce.
+    Fonctions (tirer, evaluer, appliquer) du voisinage d'un palier.
     """
-    nombre_villes = len(matrice)
+    if type_mouvement != "echange" and nombre_villes < 5:
+        type_mouvement = "echange"  # 2-opt et Or-opt n'ont pas de mouvement utile sur de si petits parcours
+    if type_mouvement == "2opt" and symetrique is None:
+        symetrique = est_symetrique(matrice)
+    return fonctions_mouvement(type_mouvement, symetrique)
 
-    # 1. Générer une solution initiale aléatoire
-    solution_actuelle = list(range(nombre_villes))
-    random.shuffle(solution_actuelle)
 
-    # 2. Initialiser la meilleure solution trouvée
+def palier_recuit(solution_actuelle, distance_actuelle, matrice, temperature, taux_refroidissement, iterations,
+                  rng=random, type_mouvement="echange", symetrique=None, suivi=None, instrumentation=None):
+    """
+    Exécute 'iterations' itérations du recuit à partir de la solution courante, modifiée sur place.
+    Retourne (distance_actuelle, temperature, meilleure_solution, meilleure_distance) en fin de palier.
+    Avec taux_refroidissement = 1, la température reste fixe (utile au recuit parallèle, voir recuit_parallele.py).
+    'rng' permet de donner à chaque chaîne son propre générateur aléatoire.
+    'type_mouvement' choisit le voisinage : "echange", "2opt", "oropt" ou "or3opt" (voir recherche_locale.py).
+    'suivi' (optionnel) est appelé à chaque nouvelle meilleure solution avec (iteration, meilleure_distance).
+    'instrumentation' (optionnel) reçoit, en fin de palier, le nombre de mouvements proposés et acceptés.
+    """
+    nombre_villes = len(solution_actuelle)
+    tirer_mouvement, evaluer_mouvement, appliquer_mouvement = _fonctions_palier(type_mouvement, nombre_villes,
+                                                                                matrice, symetrique)
     meilleure_solution = solution_actuelle[:]
-    meilleure_distance = calculer_distance_totale(meilleure_solution, matrice)
+    meilleure_distance = distance_actuelle
+    acceptes = 0
 
-    # 3. Initialiser la température
-    temperature = temperature_initiale
-
-    # 4. Boucle principale de l'algorithme
-    for i in range(iterations_max):
-        # Générer un voisin
-        voisin = generer_voisin(solution_actuelle)
-
-        # Calculer les "énergies" (distances)
-        distance_actuelle = calculer_distance_totale(solution_actuelle, matrice)
-        distance_voisin = calculer_distance_totale(voisin, matrice)
+    for i in range(iterations):
+        # Tirer un mouvement (par exemple l'échange de deux positions) sans copier la solution
+        mouvement = tirer_mouvement(nombre_villes, rng)
 
-        # Calculer la différence d'énergie
-        delta_energie = distance_voisin - distance_actuelle
+        # Calculer par delta la différence d'énergie (distance) produite par le mouvement
+        delta_energie = evaluer_mouvement(solution_actuelle, matrice, *mouvement)
 
-        # 5. Critère d'acceptation
-        # Si le voisin est meilleur, on l'accepte toujours
+        # Critère d'acceptation
+        # Si le voisin est meilleur, on l'accepte toujours.
+        # S'il est moins bon, on l'accepte avec une certaine probabilité.
+        # Au-delà de SEUIL_ACCEPTATION * temperature, exp(-delta / T) est inférieure à 2**-53 : le tirage est
+        # conservé (même flux aléatoire) mais comparé à 0, sans exponentielle ni division par une température nulle.
         if delta_energie < 0:
-            solution_actuelle = voisin[:]
-        # Si le voisin est moins bon, on l'accepte avec une certaine probabilité
+            accepte = True
         else:
-            probabilite_acceptation = math.exp(-delta_energie / temperature)
-            if random.random() < probabilite_acceptation:
-                solution_actuelle = voisin[:]
+            tirage = rng.random()
+            accepte = delta_energie == 0 or (delta_energie <= SEUIL_ACCEPTATION * temperature
+                                             and tirage < math.exp(-delta_energie / temperature))
+        if accepte:
+            # Le mouvement n'est appliqué (sur place) que s'il est accepté
+            appliquer_mouvement(solution_actuelle, *mouvement)
+            distance_actuelle += delta_energie
+            acceptes += 1
 
-        # Mettre à jour la meilleure solution si nécessaire
-        distance_courante_mise_a_jour = calculer_distance_totale(solution_actuelle, matrice)
-        if distance_courante_mise_a_jour < meilleure_distance:
-            meilleure_solution = solution_actuelle[:]
-            meilleure_distance = distance_courante_mise_a_jour
+            # Mettre à jour la meilleure solution si nécessaire
+            if distance_actuelle < meilleure_distance:
+                meilleure_solution = solution_actuelle[:]
+                meilleure_distance = distance_actuelle
+                if suivi is not None:
+                    suivi(i + 1, meilleure_distance)
 
-        # 6. Refroidir la température
+        # Refroidir la température
         temperature *= taux_refroidissement
 
+    if instrumentation is not None:
+        instrumentation.compter("mouvements_proposes", iterations)
+        instrumentation.compter("evaluations_delta", iterations)
+        instrumentation.compter("mouvements_acceptes", acceptes)
+    return distance_actuelle, temperature, meilleure_solution, meilleure_distance
+
+
+def palier_temperature_fixe(solution_actuelle, distance_actuelle, matrice, temperature, iterations, rng=random,
+                            type_mouvement="echange", symetrique=None, suivi=None, instrumentation=None):
+    """
+    Exécute un palier de 'iterations' itérations à température fixe (programmes de refroidissement,
+    voir refroidissement.py), en modifiant la solution courante sur place.
+    Retourne (distance_actuelle, meilleure_solution, meilleure_distance, acceptes).
+    Un mouvement dont le delta dépasse SEUIL_ACCEPTATION * temperature ne peut pas être accepté :
+    il est rejeté sans tirage aléatoire ni calcul de l'exponentielle.
+    """
+    nombre_villes = len(solution_actuelle)
+    tirer_mouvement, evaluer_mouvement, appliquer_mouvement = _fonctions_palier(type_mouvement, nombre_villes,
+                                                                                matrice, symetrique)
+    meilleure_solution = solution_actuelle[:]
+    meilleure_distance = distance_actuelle
+    acceptes = 0
+    seuil = SEUIL_ACCEPTATION * temperature
+    inverse_temperature = 1.0 / temperature if temperature > 0 else 0.0
+
+    for i in range(iterations):
+        mouvement = tirer_mouvement(nombre_villes, rng)
+        delta_energie = evaluer_mouvement(solution_actuelle, matrice, *mouvement)
+
+        # Critère d'acceptation (Metropolis), sans exponentielle pour les mouvements trop dégradants
+        if delta_energie < 0 or (delta_energie < seuil
+                                 and rng.random() < math.exp(-delta_energie * inverse_temperature)):
+            appliquer_mouvement(solution_actuelle, *mouvement)
+            distance_actuelle += delta_energie
+            acceptes += 1
+            if distance_actuelle < meilleure_distance:
+                meilleure_solution = solution_actuelle[:]
+                meilleure_distance = distance_actuelle
+                if suivi is not None:
+                    suivi(i + 1, meilleure_distance)
+
+    if instrumentation is not None:
+        instrumentation.compter("mouvements_proposes", iterations)
+        instrumentation.compter("evaluations_delta", iterations)
+        instrumentation.compter("mouvements_acceptes", acceptes)
+    return distance_actuelle, meilleure_solution, meilleure_distance, acceptes
+
+
+def recuit_simule(matrice, temperature_initiale, taux_refroidissement, iterations_max, type_mouvement="echange",
+                  suivi=None, arret=None, reprise=None, instrumentation=None, solution_initiale=None,
+                  refroidissement=None):
+    """
+    Implémente l'algorithme du recuit simulé pour résoudre le problème du voyageur de commerce.
+    'type_mouvement' : "echange" (par défaut), "2opt", "oropt" ou "or3opt". Sur une matrice asymétrique,
+    les mouvements sans inversion ("oropt", "or3opt") sont évalués en O(1) ; le 2-opt aussi, mais chaque
+    mouvement accepté recalcule en O(n) les sommes préfixes des coûts d'inversion (voir recherche_locale.py).
+    'suivi' : fonction appelée avec (iteration, meilleure_distance) à chaque amélioration (voir benchmark.py).
+    'arret' (optionnel) : un CriteresArret (voir arret.py), vérifié toutes les 'intervalle_verification' itérations.
+    'reprise' (optionnel) : un PointReprise (voir reprise.py) ; s'il existe déjà, l'exécution reprend
+    à l'état sauvegardé (parcours courant, température, itération, générateur aléatoire).
+    'instrumentation' (optionnel) : une Instrumentation (voir instrumentation.py) ; chaque palier est une phase.
+    'solution_initiale' (optionnel) : parcours de départ, ou nom d'une heuristique de construction
+    ("plus_proche_voisin", "glouton", "courbe", "christofides" : voir construction.py) ; aléatoire par défaut.
+    'temperature_initiale' = None : la température est calibrée sur l'instance (voir refroidissement.py).
+    'refroidissement' (optionnel) : un programme de refroidissement par paliers ou son nom ("geometrique",
+    "lundy_mees", "adaptatif", "rechauffage" : voir refroidissement.py), qui remplace 'taux_refroidissement'.
+    """
+    nombre_villes = len(matrice)
+    if instrumentation is None:
+        instrumentation = SANS_INSTRUMENTATION
+    if refroidissement is not None:
+        refroidissement = obtenir_refroidissement(refroidissement)
+
+    nom_reprise = "recuit_simule" if refroidissement is None else "recuit_simule_paliers"
+    etat = reprise.charger(nom_reprise) if reprise is not None else None
+    if etat is not None:
+        # Reprise d'une exécution interrompue : l'état sauvegardé remplace l'initialisation
+        solution_actuelle = etat["solution_actuelle"].tolist()
+        distance_actuelle = etat["distance_actuelle"].item()
+    else:
+        # 1. Générer une solution initiale aléatoire (ou partir de la solution initiale fournie)
+        if solution_initiale is not None:
+            solution_actuelle = parcours_initial(matrice, solution_initiale)
+        else:
+            solution_actuelle = list(range(nombre_villes))
+            random.shuffle(solution_actuelle)
+
+        # 2. Initialiser la distance courante.
+        # Elle est ensuite tenue à jour par deltas, sans recalcul complet.
+        distance_actuelle = calculer_distance_totale(solution_actuelle, matrice)
+        if temperature_initiale is None:
+            temperature_initiale = calibrer_temperature(matrice, type_mouvement=type_mouvement,
+                                                        solution=solution_actuelle)
+
+    if refroidissement is not None:
+        return _recuit_par_paliers(matrice, solution_actuelle, distance_actuelle, temperature_initiale,
+                                   iterations_max, refroidissement, type_mouvement, suivi, arret, reprise,
+                                   instrumentation, etat)
+
+    # 3. Boucle principale de l'algorithme, à partir de la température initiale
+    if arret is None and reprise is None:
+        with instrumentation.phase("palier"):
+            _, _, meilleure_solution, meilleure_distance = palier_recuit(
+                solution_actuelle, distance_actuelle, matrice, temperature_initiale, taux_refroidissement,
+                iterations_max, type_mouvement=type_mouvement, suivi=suivi, instrumentation=instrumentation
+            )
+        return meilleure_solution, meilleure_distance
+
+    # Avec des critères d'arrêt ou des points de reprise, les itérations sont exécutées par paliers ;
+    # les critères sont vérifiés, et l'état sauvegardé, entre deux paliers
+    if arret is not None:
+        arret.demarrer()
+    if etat is not None:
+        meilleure_solution, meilleure_distance = etat["meilleure_solution"].tolist(), etat["meilleure_distance"].item()
+        temperature, iteration = etat["temperature"].item(), etat["iteration"].item()
+    else:
+        meilleure_solution, meilleure_distance = solution_actuelle[:], distance_actuelle
+        temperature, iteration = temperature_initiale, 0
+    symetrique = est_symetrique(matrice) if type_mouvement == "2opt" else None
+    intervalle = min(objet.intervalle_verification for objet in (arret, reprise) if objet is not None)
+
+    def suivi_palier(i, distance):
+        # Les itérations du palier sont numérotées depuis son début, et sa meilleure distance n'est
+        # une amélioration que si elle bat la meilleure distance des paliers précédents
+        if distance < meilleure_distance:
+            suivi(iteration + i, distance)
+
+    while iteration < iterations_max:
+        taille_palier = min(intervalle, iterations_max - iteration)
+        with instrumentation.phase("palier"):
+            distance_actuelle, temperature, solution_palier, distance_palier = palier_recuit(
+                solution_actuelle, distance_actuelle, matrice, temperature, taux_refroidissement, taille_palier,
+                type_mouvement=type_mouvement, symetrique=symetrique,
+                suivi=suivi_palier if suivi is not None else None, instrumentation=instrumentation
+            )
+        iteration += taille_palier
+        if distance_palier < meilleure_distance:
+            meilleure_solution, meilleure_distance = solution_palier, distance_palier
+        if reprise is not None and reprise.doit_ecrire():
+            reprise.ecrire("recuit_simule", solution_actuelle=solution_actuelle, distance_actuelle=distance_actuelle,
+                           meilleure_solution=meilleure_solution, meilleure_distance=meilleure_distance,
+                           temperature=temperature, iteration=iteration)
+        if arret is not None and arret.verifier(iteration, meilleure_distance, temperature):
+            break
+    if arret is not None:
+        arret.conclure(iteration)
+
     return meilleure_solution, meilleure_distance
 
 
+def _recuit_par_paliers(matrice, solution_actuelle, distance_actuelle, temperature_initiale, iterations_max,
+                        refroidissement, type_mouvement, suivi, arret, reprise, instrumentation, etat):
+    """
+    Boucle du recuit simulé avec un programme de refroidissement : une suite de paliers à température fixe,
+    dont le programme choisit les températures. Les critères d'arrêt sont vérifiés à chaque palier.
+    """
+    longueur = refroidissement.longueur_palier(len(matrice))
+    if arret is not None:
+        arret.demarrer()
+    if etat is not None:
+        temperature_initiale = etat["temperature_initiale"].item()
+        meilleure_solution, meilleure_distance = etat["meilleure_solution"].tolist(), etat["meilleure_distance"].item()
+        temperature, iteration, palier = etat["temperature"].item(), etat["iteration"].item(), etat["palier"].item()
+    else:
+        meilleure_solution, meilleure_distance = solution_actuelle[:], distance_actuelle
+        temperature, iteration, palier = temperature_initiale, 0, 0
+    refroidissement.demarrer(temperature_initiale, math.ceil(iterations_max / longueur))
+    if etat is not None:
+        refroidissement.restaurer({nom[len("programme_"):]: valeur.item() for nom, valeur in etat.items()
+                                   if nom.startswith("programme_")})
+    symetrique = est_symetrique(matrice) if type_mouvement == "2opt" else None
+
+    def suivi_palier(i, distance):
+        if distance < meilleure_distance:
+            suivi(iteration + i, distance)
+
+    while iteration < iterations_max:
+        taille_palier = min(longueur, iterations_max - iteration)
+        with instrumentation.phase("palier"):
+            distance_actuelle, solution_palier, distance_palier, acceptes = palier_temperature_fixe(
+                solution_actuelle, distance_actuelle, matrice, temperature, taille_palier,
+                type_mouvement=type_mouvement, symetrique=symetrique,
+                suivi=suivi_palier if suivi is not None else None, instrumentation=instrumentation
+            )
+        iteration += taille_palier
+        palier += 1
+        amelioration = distance_palier < meilleure_distance
+        if amelioration:
+            meilleure_solution, meilleure_distance = solution_palier, distance_palier
+
+        # Le programme choisit la température du palier suivant
+        temperature = refroidissement.suivante(temperature, palier, acceptes / taille_palier, amelioration)
+
+        if reprise is not None and reprise.doit_ecrire():
+            etat_programme = {"programme_" + nom: valeur for nom, valeur in refroidissement.etat().items()}
+            reprise.ecrire("recuit_simule_paliers", solution_actuelle=solution_actuelle,
+                           distance_actuelle=distance_actuelle, meilleure_solution=meilleure_solution,
+                           meilleure_distance=meilleure_distance, temperature_initiale=temperature_initiale,
+                           temperature=temperature, iteration=iteration, palier=palier, **etat_programme)
+        if arret is not None and arret.verifier(iteration, meilleure_distance, temperature):
+            break
+    if arret is not None:
+        arret.conclure(iteration)
+
+    return meilleure_solution, meilleure_distance
+
+
+def iterer_recuit_simule(matrice, temperature_initiale, taux_refroidissement, iterations_max,
+                         type_mouvement="echange", intervalle=1000, periode=0.0):
+    """
+    Variante de recuit_simule sous forme de générateur (voir progression.py) : un événement
+    (iteration, distances courante et meilleure, température) toutes les 'intervalle' itérations,
+    et au plus un toutes les 'periode' secondes. Le dernier événement contient la meilleure solution.
+    """
+    progression = SuiviProgression(intervalle, periode)
+    nombre_villes = len(matrice)
+    solution_actuelle = list(range(nombre_villes))
+    random.shuffle(solution_actuelle)
+    distance_actuelle = calculer_distance_totale(solution_actuelle, matrice)
+    meilleure_solution, meilleure_distance = solution_actuelle[:], distance_actuelle
+    symetrique = est_symetrique(matrice) if type_mouvement == "2opt" else None
+
+    temperature = temperature_initiale
+    iteration = 0
+    while True:
+        # Les itérations sont exécutées par paliers : la boucle interne ne produit aucun événement
+        taille_palier = min(progression.intervalle, iterations_max - iteration)
+        if taille_palier > 0:
+            distance_actuelle, temperature, solution_palier, distance_palier = palier_recuit(
+                solution_actuelle, distance_actuelle, matrice, temperature, taux_refroidissement, taille_palier,
+                type_mouvement=type_mouvement, symetrique=symetrique
+            )
+            iteration += taille_palier
+            if distance_palier < meilleure_distance:
+                meilleure_solution, meilleure_distance = solution_palier, distance_palier
+
+        final = iteration >= iterations_max
+        if progression.doit_emettre(iteration, final):
+            yield progression.evenement(distance_actuelle, meilleure_distance, meilleure_solution, final,
+                                        iteration=iteration, temperature=temperature)
+        if final:
+            return
+
+
 # --- Bloc d'Exécution ---
 
 if __name__ == "__main__":
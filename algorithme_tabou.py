@@ -3,6 +3,16 @@
 import random
 from collections import deque
 
+from mouvements import (delta_echange, appliquer_echange, calculer_plus_proches_voisins,
+                        calculer_positions, generer_echanges_candidats)
+from recherche_locale import (est_symetrique, delta_2opt, appliquer_2opt, generer_2opt_candidats, CoutsInversion,
+                              delta_or_opt, appliquer_or_opt, generer_or_opt_candidats)
+from structure_parcours import ParcoursDeuxNiveaux
+from progression import SuiviProgression
+from instrumentation import SANS_INSTRUMENTATION
+from construction import parcours_initial
+from tabou_reactif import TabouReactif
+
 # --- Données du Problème (Matrice des Distances) ---
 # Matrice représentant les distances entre 10 villes (de 0 à 9).
 # matrice_distances[i][j] donne la distance entre la ville i et la ville j.
@@ -55,19 +65,115 @@ def generer_voisins(solution):
 
 # --- Algorithme Principal : Recherche Tabou ---
 
-def tabu_search(matrice_distances, nombre_iterations, taille_tabu):
+def tabu_search(matrice_distances, nombre_iterations, taille_tabu, mode="complet", k_voisins=10,
+                voisinage="echange", structure="liste", suivi=None, arret=None, reprise=None, instrumentation=None,
+                solution_initiale=None, reactif=None):
     """
     Implémente l'algorithme de Recherche Tabou pour le Problème du Voyageur de Commerce (TSP).
+    Le mode "complet" explore tout le voisinage par échange ; le mode "candidats"
+    délègue à tabu_search_candidats (listes de k plus proches voisins), adapté aux grandes instances.
+    Le voisinage du mode "candidats" est "echange", "2opt" ou "oropt", sur une liste ou un parcours à deux niveaux.
+    'suivi' : fonction appelée avec (iteration, meilleure_distance) à chaque amélioration (voir benchmark.py).
+    'arret' (optionnel) : un CriteresArret (voir arret.py), vérifié à chaque itération.
+    'reprise' (optionnel) : un PointReprise (voir reprise.py) ; s'il existe déjà, la recherche reprend
+    à l'état sauvegardé (solution courante, mémoire tabou, itération, générateur aléatoire).
+    'instrumentation' (optionnel) : une Instrumentation (voir instrumentation.py), qui chronomètre
+    la génération des voisins, le filtrage tabou et l'évaluation des mouvements.
+    'solution_initiale' (optionnel) : parcours de départ, ou nom d'une heuristique de construction
+    (voir construction.py) ; aléatoire par défaut.
+    'reactif' (optionnel) : un TabouReactif (voir tabou_reactif.py), ou True pour ses réglages par défaut :
+    aspiration, durée tabou réactive, diversification par fréquences d'arêtes et intensification sur une élite.
+    Sa mémoire à long terme n'est pas sauvegardée par 'reprise' : une reprise repart d'une mémoire vide.
+    """
+    if reactif is True:
+        reactif = TabouReactif()
+    if mode == "candidats":
+        return tabu_search_candidats(matrice_distances, nombre_iterations, taille_tabu, k_voisins, voisinage,
+                                     structure, suivi, arret, reprise, instrumentation, solution_initiale, reactif)
+    if mode != "complet":
+        raise ValueError(f"Mode de recherche tabou inconnu : {mode}")
+    return _resultat_final(_etapes_tabu_complet(matrice_distances, nombre_iterations, taille_tabu, suivi, reprise,
+                                                instrumentation, solution_initiale, reactif),
+                           nombre_iterations, arret)
+
+
+def _resultat_final(etapes, nombre_iterations, arret=None):
+    """
+    Exécute les étapes d'une recherche et retourne (meilleure_solution, meilleure_distance) de la dernière.
+    Avec des critères d'arrêt, la recherche s'arrête dès que l'un d'eux se déclenche.
+    """
+    if arret is not None:
+        arret.demarrer()
+    for etape in etapes:
+        if arret is not None and arret.verifier(etape[0], etape[3]):
+            break
+    iteration, _, meilleure_solution, meilleure_distance, _ = etape
+    if arret is not None:
+        # Sans critère déclenché, la recherche s'est arrêtée d'elle-même avant la dernière itération
+        # si elle n'a plus trouvé de mouvement non-tabou
+        arret.conclure(iteration, "iterations_max" if iteration >= nombre_iterations else "voisinage_epuise")
+    return meilleure_solution, meilleure_distance
+
+
+def _aretes(solution):
+    """
+    Ensemble des arêtes (non orientées) d'un parcours.
+    """
+    nombre_villes = len(solution)
+    return {_paire(solution[k], solution[(k + 1) % nombre_villes]) for k in range(nombre_villes)}
+
+
+def _meilleur_voisin_reactif(voisins, tabu_list, matrice_distances, iteration, meilleure_distance, reactif,
+                             instrumentation):
+    """
+    Choix du voisin en mode complet avec un TabouReactif : un voisin tabou n'est admis que s'il bat la meilleure
+    distance (aspiration), ou si tous les voisins sont tabous ; pendant une diversification, chaque voisin est
+    pénalisé selon la fréquence de ses arêtes. Retourne (voisin, distance).
+    """
+    with instrumentation.phase("filtrage_tabou"):
+        tabous = [tuple(v) in tabu_list for v in voisins]
+    instrumentation.compter("mouvements_proposes", len(voisins))
+    instrumentation.compter("mouvements_tabous", sum(tabous))
+
+    with instrumentation.phase("evaluation"):
+        distances = [calculer_distance_totale(v, matrice_distances) for v in voisins]
+        admis = [k for k in range(len(voisins))
+                 if not tabous[k] or (reactif.aspiration and distances[k] < meilleure_distance)]
+        if not admis:
+            admis = range(len(voisins))  # Aspiration par défaut : tous les voisins sont tabous
+        if reactif.en_diversification(iteration):
+            scores = {k: distances[k] + reactif.penalite(_aretes(voisins[k])) for k in admis}
+            choix = min(admis, key=scores.__getitem__)
+        else:
+            choix = min(admis, key=distances.__getitem__)
+    instrumentation.compter("evaluations", len(voisins))
+    instrumentation.compter("mouvements_acceptes")
+    if tabous[choix]:
+        reactif.aspirations += 1
+    return voisins[choix], distances[choix]
+
+
+def _etapes_tabu_complet(matrice_distances, nombre_iterations, taille_tabu, suivi=None, reprise=None,
+                         instrumentation=None, solution_initiale=None, reactif=None):
+    """
+    Recherche Tabou à voisinage complet, sous forme de générateur : produit après chaque itération
+    (iteration, distance_actuelle, meilleure_solution, meilleure_distance, taille_liste_tabou).
     """
     nombre_villes = len(matrice_distances)
+    if instrumentation is None:
+        instrumentation = SANS_INSTRUMENTATION
 
-    # 1. Commencer avec une solution aléatoire
-    solution_actuelle = list(range(nombre_villes))
-    random.shuffle(solution_actuelle)
+    # 1. Commencer avec une solution aléatoire (ou avec la solution initiale fournie)
+    if solution_initiale is not None:
+        solution_actuelle = parcours_initial(matrice_distances, solution_initiale)
+    else:
+        solution_actuelle = list(range(nombre_villes))
+        random.shuffle(solution_actuelle)
 
     # 2. Initialiser la meilleure solution comme étant la solution de départ
     meilleure_solution = solution_actuelle[:]
     meilleure_distance = calculer_distance_totale(meilleure_solution, matrice_distances)
+    distance_actuelle = meilleure_distance
 
     # 3. Initialiser la liste tabou.
     # deque(maxlen=...) est une file de taille fixe très efficace.
@@ -75,35 +181,478 @@ def tabu_search(matrice_distances, nombre_iterations, taille_tabu):
     tabu_list = deque(maxlen=taille_tabu)
     tabu_list.append(tuple(solution_actuelle))  # On stocke des tuples car ils sont "hashable" (utilisable dans un set)
 
+    # Reprise d'une exécution interrompue : l'état sauvegardé (y compris celui du générateur aléatoire)
+    # remplace l'initialisation, et la liste tabou est restaurée dans le même ordre
+    debut = 0
+    etat = reprise.charger("tabu_search") if reprise is not None else None
+    if etat is not None:
+        debut = etat["iteration"].item()
+        solution_actuelle = etat["solution_actuelle"].tolist()
+        distance_actuelle = etat["distance_actuelle"].item()
+        meilleure_solution = etat["meilleure_solution"].tolist()
+        meilleure_distance = etat["meilleure_distance"].item()
+        tabu_list = deque((tuple(solution) for solution in etat["tabu_list"].tolist()), maxlen=taille_tabu)
+    iteration_amelioration = debut
+    if reactif is not None:
+        reactif.demarrer(nombre_villes, taille_tabu)
+    yield debut, distance_actuelle, meilleure_solution, meilleure_distance, len(tabu_list)
+
     # 4. Boucle principale de l'algorithme
-    for _ in range(nombre_iterations):
+    for iteration in range(debut, nombre_iterations):
         # Générer le voisinage de la solution actuelle
-        voisins = generer_voisins(solution_actuelle)
+        with instrumentation.phase("generation_voisins"):
+            voisins = generer_voisins(solution_actuelle)
+        nombre_voisins = len(voisins)
 
-        # Filtrer les voisins qui sont dans la liste tabou pour éviter les cycles
-        # L'utilisation d'un set pour la recherche est beaucoup plus rapide que de chercher dans une liste.
-        voisins = [v for v in voisins if tuple(v) not in tabu_list]
+        if reactif is not None:
+            # 5-7. Avec la mémoire réactive : choisir le voisin (aspiration, pénalités de fréquence),
+            # noter ses arêtes ajoutées et sa visite, qui règle la durée tabou (taille de la liste)
+            if not voisins:
+                break
+            solution_precedente = solution_actuelle
+            solution_actuelle, distance_actuelle = _meilleur_voisin_reactif(
+                voisins, tabu_list, matrice_distances, iteration, meilleure_distance, reactif, instrumentation
+            )
+            reactif.noter_aretes(_aretes(solution_actuelle) - _aretes(solution_precedente))
+            echappement = reactif.visiter(hash(tuple(solution_actuelle)), iteration + 1)
+            if reactif.duree != tabu_list.maxlen:
+                tabu_list = deque(tabu_list, maxlen=reactif.duree)
+            tabu_list.append(tuple(solution_actuelle))
+        else:
+            # Filtrer les voisins qui sont dans la liste tabou pour éviter les cycles
+            # L'utilisation d'un set pour la recherche est beaucoup plus rapide que de chercher dans une liste.
+            with instrumentation.phase("filtrage_tabou"):
+                voisins = [v for v in voisins if tuple(v) not in tabu_list]
+            instrumentation.compter("mouvements_proposes", nombre_voisins)
+            instrumentation.compter("mouvements_tabous", nombre_voisins - len(voisins))
+
+            # S'il n'y a plus de voisins non-tabous, on est potentiellement bloqué.
+            if not voisins:
+                break
+
+            # 5. Sélectionner le meilleur voisin parmi les non-tabous
+            with instrumentation.phase("evaluation"):
+                meilleur_voisin = min(voisins, key=lambda v: calculer_distance_totale(v, matrice_distances))
+            instrumentation.compter("evaluations", len(voisins) + 1)  # + la distance de la nouvelle solution
+            instrumentation.compter("mouvements_acceptes")
+
+            # 6. Mettre à jour la solution actuelle pour le prochain tour de boucle
+            solution_actuelle = meilleur_voisin
+
+            # 7. Ajouter la nouvelle solution (maintenant l'actuelle) à la liste tabou
+            tabu_list.append(tuple(solution_actuelle))
+            distance_actuelle = calculer_distance_totale(solution_actuelle, matrice_distances)
+
+        # 8. Mettre à jour la meilleure solution globale si la solution actuelle est meilleure
+        if distance_actuelle < meilleure_distance:
+            meilleure_solution = solution_actuelle[:]
+            meilleure_distance = distance_actuelle
+            iteration_amelioration = iteration + 1
+            if suivi is not None:
+                suivi(iteration + 1, meilleure_distance)
+
+        if reactif is not None:
+            # Relance après une stagnation : repartir d'un parcours d'élite (mémoire tabou vidée), ou diversifier
+            reactif.noter(solution_actuelle, distance_actuelle)
+            relance = reactif.relance(iteration + 1, iteration_amelioration, meilleure_distance, echappement)
+            if relance is not None and relance[0] == "intensification":
+                solution_actuelle = relance[1]
+                distance_actuelle = calculer_distance_totale(solution_actuelle, matrice_distances)
+                tabu_list.clear()
+
+        if reprise is not None and reprise.doit_ecrire():
+            reprise.ecrire("tabu_search", iteration=iteration + 1, solution_actuelle=solution_actuelle,
+                           distance_actuelle=distance_actuelle, meilleure_solution=meilleure_solution,
+                           meilleure_distance=meilleure_distance, tabu_list=list(tabu_list))
+        yield iteration + 1, distance_actuelle, meilleure_solution, meilleure_distance, len(tabu_list)
+
+
+
+# --- Variante à Listes de Candidats : Recherche Tabou pour les Grandes Instances ---
+
+def _paire(ville_a, ville_b):
+    """
+    Clé non orientée d'une paire de villes (ou d'une arête).
+    """
+    return (ville_a, ville_b) if ville_a < ville_b else (ville_b, ville_a)
+
+
+def tabu_search_candidats(matrice_distances, nombre_iterations, taille_tabu, k_voisins=10, voisinage="echange",
+                          structure="liste", suivi=None, arret=None, reprise=None, instrumentation=None,
+                          solution_initiale=None, reactif=None):
+    """
+    Recherche Tabou dont le voisinage est restreint par des listes de candidats.
+    - Seuls les mouvements qui rapprochent une ville de l'une de ses k plus proches voisines sont évalués.
+    - Chaque mouvement est évalué par son delta, sans copier le parcours.
+    - Le statut tabou porte sur des attributs du mouvement, interdits pendant 'taille_tabu'
+      itérations (table de hachage des échéances) :
+      - "echange" : la paire de villes échangées ne peut plus être échangée ;
+      - "2opt" : les deux arêtes retirées ne peuvent plus être réintroduites ;
+      - "oropt" : un segment de 1 à 3 villes est déplacé sans être inversé (mouvement adapté aux matrices
+        asymétriques) ; les trois arêtes retirées ne peuvent plus être réintroduites.
+    - Matrice asymétrique en 2-opt : le coût d'inversion du segment est lu dans des sommes préfixes
+      (CoutsInversion, voir recherche_locale.py), en O(1) par candidat et O(n) par mouvement appliqué.
+    - structure="deux_niveaux" remplace la liste par un ParcoursDeuxNiveaux (voir structure_parcours.py),
+      dont les inversions 2-opt coûtent O(√n) au lieu de O(n).
+    - 'arret' (optionnel) : un CriteresArret (voir arret.py), vérifié à chaque itération.
+    - 'reprise' (optionnel) : un PointReprise (voir reprise.py), qui sauvegarde aussi la mémoire tabou.
+    - 'instrumentation' (optionnel) : une Instrumentation (voir instrumentation.py). Les candidats étant
+      générés, filtrés et évalués au fil d'une même boucle, ces trois étapes forment une seule phase.
+    - 'solution_initiale' (optionnel) : parcours de départ, ou nom d'une heuristique de construction.
+    - 'reactif' (optionnel) : un TabouReactif (voir tabou_reactif.py). Les parcours visités sont identifiés
+      par une clé de hachage de leurs arêtes, tenue à jour en O(1) à chaque mouvement.
+    """
+    if reactif is True:
+        reactif = TabouReactif()
+    return _resultat_final(_etapes_tabu_candidats(matrice_distances, nombre_iterations, taille_tabu, k_voisins,
+                                                  voisinage, structure, suivi, reprise, instrumentation,
+                                                  solution_initiale, reactif), nombre_iterations, arret)
 
-        # S'il n'y a plus de voisins non-tabous, on est potentiellement bloqué.
-        if not voisins:
+
+def _cle_aretes(aretes):
+    """
+    Clé de hachage d'un ensemble d'arêtes (ou-exclusif de leurs hachages) : retirer ou ajouter une arête
+    met la clé d'un parcours à jour sans le parcourir.
+    """
+    cle = 0
+    for arete in aretes:
+        cle ^= hash(arete)
+    return cle
+
+
+def _aretes_echange(solution, i, j, nombre_villes):
+    """
+    Arêtes (retirées, ajoutées) par l'échange des villes aux positions i et j.
+    """
+    if 3 <= (j - i) % nombre_villes <= nombre_villes - 3:
+        # Villes éloignées (aucune voisine commune) : chacune prend la place de l'autre entre ses deux voisines
+        x, y = solution[i], solution[j]
+        avant_i, apres_i = solution[(i - 1) % nombre_villes], solution[(i + 1) % nombre_villes]
+        avant_j, apres_j = solution[(j - 1) % nombre_villes], solution[(j + 1) % nombre_villes]
+        return ((_paire(avant_i, x), _paire(x, apres_i), _paire(avant_j, y), _paire(y, apres_j)),
+                (_paire(avant_i, y), _paire(y, apres_i), _paire(avant_j, x), _paire(x, apres_j)))
+
+    def ville(k):
+        k %= nombre_villes
+        return solution[j] if k == i else solution[i] if k == j else solution[k]
+
+    debuts = {(i - 1) % nombre_villes, i, (j - 1) % nombre_villes, j}
+    avant = {_paire(solution[k], solution[(k + 1) % nombre_villes]) for k in debuts}
+    apres = {_paire(ville(k), ville(k + 1)) for k in debuts}
+    return avant - apres, apres - avant
+
+
+def _aretes_or_opt(solution, i, longueur, j, nombre_villes):
+    """
+    Arêtes (retirées, ajoutées) par le déplacement Or-opt du segment solution[i..i+longueur-1] après solution[j].
+    """
+    premiere, derniere = solution[i], solution[(i + longueur - 1) % nombre_villes]
+    precedente, suivante = solution[(i - 1) % nombre_villes], solution[(i + longueur) % nombre_villes]
+    c, e = solution[j], solution[(j + 1) % nombre_villes]
+    return ((_paire(precedente, premiere), _paire(derniere, suivante), _paire(c, e)),
+            (_paire(precedente, suivante), _paire(c, premiere), _paire(derniere, e)))
+
+
+def _meilleur_candidat_reactif(solution, positions, matrice_distances, plus_proches_voisins, voisinage, symetrique,
+                               tabu_jusqua, iteration, distance_actuelle, meilleure_distance, reactif,
+                               couts_inversion=None):
+    """
+    Choix du mouvement parmi les candidats avec un TabouReactif : un mouvement tabou est admis s'il bat
+    la meilleure distance (aspiration) ; si aucun mouvement n'est admis, le meilleur mouvement tabou est joué.
+    Pendant une diversification, le delta est pénalisé par la fréquence des arêtes ajoutées.
+    Retourne (mouvement, delta, tabous, evalues, aspiration).
+    """
+    nombre_villes = len(solution)
+    diversifier = reactif.en_diversification(iteration)
+    # Un mouvement tabou n'est admis que si son delta est inférieur à ce seuil (aspiration)
+    seuil_aspiration = meilleure_distance - distance_actuelle if reactif.aspiration else float('-inf')
+    meilleur_mouvement, meilleur_delta, meilleur_score, aspiration = None, float('inf'), float('inf'), False
+    tabous_evalues = []
+    evalues = 0
+
+    if voisinage == "echange":
+        for i, j in generer_echanges_candidats(solution, positions, plus_proches_voisins):
+            tabou = tabu_jusqua.get(_paire(solution[i], solution[j]), -1) >= iteration
+            delta = delta_echange(solution, matrice_distances, i, j)
+            evalues += 1
+            if tabou and delta >= seuil_aspiration:
+                tabous_evalues.append(((i, j), delta))
+                continue
+            score = delta
+            if diversifier:
+                score += reactif.penalite(_aretes_echange(solution, i, j, nombre_villes)[1])
+            if score < meilleur_score:
+                meilleur_mouvement, meilleur_delta, meilleur_score, aspiration = (i, j), delta, score, tabou
+    elif voisinage == "2opt":
+        for p, q in generer_2opt_candidats(solution, positions, plus_proches_voisins):
+            a, b = solution[p], solution[p + 1]
+            c, d = solution[q], solution[(q + 1) % nombre_villes]
+            tabou = tabu_jusqua.get(_paire(a, c), -1) >= iteration or tabu_jusqua.get(_paire(b, d), -1) >= iteration
+            delta = delta_2opt(solution, matrice_distances, p, q, symetrique, couts_inversion)
+            evalues += 1
+            if tabou and delta >= seuil_aspiration:
+                tabous_evalues.append(((p, q), delta))
+                continue
+            score = delta
+            if diversifier:
+                score += reactif.penalite((_paire(a, c), _paire(b, d)))
+            if score < meilleur_score:
+                meilleur_mouvement, meilleur_delta, meilleur_score, aspiration = (p, q), delta, score, tabou
+    else:
+        for i, longueur, j in generer_or_opt_candidats(solution, positions, plus_proches_voisins):
+            _, ajoutees = _aretes_or_opt(solution, i, longueur, j, nombre_villes)
+            tabou = any(tabu_jusqua.get(arete, -1) >= iteration for arete in ajoutees)
+            delta = delta_or_opt(solution, matrice_distances, i, longueur, j)
+            evalues += 1
+            if tabou and delta >= seuil_aspiration:
+                tabous_evalues.append(((i, longueur, j), delta))
+                continue
+            score = delta
+            if diversifier:
+                score += reactif.penalite(ajoutees)
+            if score < meilleur_score:
+                meilleur_mouvement, meilleur_delta, meilleur_score, aspiration = (i, longueur, j), delta, score, tabou
+
+    if meilleur_mouvement is None and tabous_evalues:
+        # Aspiration par défaut : tous les mouvements sont tabous
+        meilleur_mouvement, meilleur_delta = min(tabous_evalues, key=lambda mouvement: mouvement[1])
+        aspiration = True
+    tabous = len(tabous_evalues) + aspiration
+    return meilleur_mouvement, meilleur_delta, tabous, evalues - tabous, aspiration
+
+
+def _etapes_tabu_candidats(matrice_distances, nombre_iterations, taille_tabu, k_voisins=10, voisinage="echange",
+                           structure="liste", suivi=None, reprise=None, instrumentation=None, solution_initiale=None,
+                           reactif=None):
+    """
+    Recherche Tabou à listes de candidats, sous forme de générateur : produit après chaque itération
+    (iteration, distance_actuelle, meilleure_solution, meilleure_distance, nombre_attributs_tabous).
+    """
+    if voisinage not in ("echange", "2opt", "oropt"):
+        raise ValueError(f"Voisinage de recherche tabou inconnu : {voisinage}")
+    if structure not in ("liste", "deux_niveaux"):
+        raise ValueError(f"Structure de parcours inconnue : {structure}")
+    nombre_villes = len(matrice_distances)
+    if voisinage != "echange" and nombre_villes < 5:
+        voisinage = "echange"  # Pas de mouvement 2-opt ou Or-opt utile sur de si petits parcours
+    symetrique = voisinage == "2opt" and est_symetrique(matrice_distances)
+    if instrumentation is None:
+        instrumentation = SANS_INSTRUMENTATION
+
+    # 1. Pré-calculer les listes de candidats (une seule fois)
+    plus_proches_voisins = calculer_plus_proches_voisins(matrice_distances, k_voisins)
+
+    # 2. Commencer avec une solution aléatoire (ou fournie), et son index inverse ville -> position
+    if solution_initiale is not None:
+        solution_actuelle = parcours_initial(matrice_distances, solution_initiale)
+    else:
+        solution_actuelle = list(range(nombre_villes))
+        random.shuffle(solution_actuelle)
+    if structure == "deux_niveaux":
+        solution_actuelle = ParcoursDeuxNiveaux(solution_actuelle)
+        positions = solution_actuelle.positions
+    else:
+        positions = calculer_positions(solution_actuelle)
+    distance_actuelle = calculer_distance_totale(solution_actuelle, matrice_distances)
+
+    meilleure_solution = solution_actuelle[:]
+    meilleure_distance = distance_actuelle
+
+    # 3. Mémoire tabou par attributs : attribut -> dernière itération où il reste interdit.
+    # La file 'echeances' permet d'oublier les attributs expirés, la mémoire reste bornée par 'taille_tabu'.
+    tabu_jusqua = {}
+    echeances = deque()
+
+    # Reprise d'une exécution interrompue : la mémoire tabou est sauvegardée sous forme de triplets
+    # (ville, ville, échéance), dans l'ordre de la table et de la file
+    debut = 0
+    etat = reprise.charger("tabu_search_candidats") if reprise is not None else None
+    if etat is not None:
+        debut = etat["iteration"].item()
+        solution_actuelle = etat["solution_actuelle"].tolist()
+        if structure == "deux_niveaux":
+            solution_actuelle = ParcoursDeuxNiveaux(solution_actuelle)
+            positions = solution_actuelle.positions
+        else:
+            positions = calculer_positions(solution_actuelle)
+        distance_actuelle = etat["distance_actuelle"].item()
+        meilleure_solution = etat["meilleure_solution"].tolist()
+        meilleure_distance = etat["meilleure_distance"].item()
+        tabu_jusqua = {(a, b): echeance for a, b, echeance in etat["tabu_jusqua"].reshape(-1, 3).tolist()}
+        echeances = deque((echeance, (a, b)) for a, b, echeance in etat["echeances"].reshape(-1, 3).tolist())
+    duree_tabou = taille_tabu
+    iteration_amelioration = debut
+    couts_inversion = None
+    if voisinage == "2opt" and not symetrique:
+        couts_inversion = CoutsInversion(solution_actuelle, matrice_distances)
+    if reactif is not None:
+        reactif.demarrer(nombre_villes, taille_tabu)
+        cle_parcours = _cle_aretes(_aretes(solution_actuelle))
+    yield debut, distance_actuelle, meilleure_solution, meilleure_distance, len(tabu_jusqua)
+
+    # 4. Boucle principale de l'algorithme
+    for iteration in range(debut, nombre_iterations):
+        # 5. Sélectionner le meilleur mouvement non-tabou parmi les candidats, d'après son delta
+        meilleur_mouvement = None
+        meilleur_delta = float('inf')
+        tabous = evalues = 0  # Compteurs locaux : l'instrumentation n'est appelée qu'une fois par itération
+        with instrumentation.phase("evaluation_candidats"):
+            if reactif is not None:
+                meilleur_mouvement, meilleur_delta, tabous, evalues, aspiration = _meilleur_candidat_reactif(
+                    solution_actuelle, positions, matrice_distances, plus_proches_voisins, voisinage, symetrique,
+                    tabu_jusqua, iteration, distance_actuelle, meilleure_distance, reactif, couts_inversion
+                )
+            elif voisinage == "echange":
+                for i, j in generer_echanges_candidats(solution_actuelle, positions, plus_proches_voisins):
+                    paire = _paire(solution_actuelle[i], solution_actuelle[j])
+                    if tabu_jusqua.get(paire, -1) >= iteration:
+                        tabous += 1
+                        continue
+                    evalues += 1
+                    delta = delta_echange(solution_actuelle, matrice_distances, i, j)
+                    if delta < meilleur_delta:
+                        meilleur_delta = delta
+                        meilleur_mouvement = (i, j)
+            elif voisinage == "2opt":
+                for p, q in generer_2opt_candidats(solution_actuelle, positions, plus_proches_voisins):
+                    # Arêtes ajoutées par le mouvement : (a, c) et (b, d)
+                    a, b = solution_actuelle[p], solution_actuelle[p + 1]
+                    c, d = solution_actuelle[q], solution_actuelle[(q + 1) % nombre_villes]
+                    if (tabu_jusqua.get(_paire(a, c), -1) >= iteration
+                            or tabu_jusqua.get(_paire(b, d), -1) >= iteration):
+                        tabous += 1
+                        continue
+                    evalues += 1
+                    delta = delta_2opt(solution_actuelle, matrice_distances, p, q, symetrique, couts_inversion)
+                    if delta < meilleur_delta:
+                        meilleur_delta = delta
+                        meilleur_mouvement = (p, q)
+            else:
+                for i, longueur, j in generer_or_opt_candidats(solution_actuelle, positions, plus_proches_voisins):
+                    _, ajoutees = _aretes_or_opt(solution_actuelle, i, longueur, j, nombre_villes)
+                    if any(tabu_jusqua.get(arete, -1) >= iteration for arete in ajoutees):
+                        tabous += 1
+                        continue
+                    evalues += 1
+                    delta = delta_or_opt(solution_actuelle, matrice_distances, i, longueur, j)
+                    if delta < meilleur_delta:
+                        meilleur_delta = delta
+                        meilleur_mouvement = (i, longueur, j)
+        instrumentation.compter("mouvements_proposes", tabous + evalues)
+        instrumentation.compter("mouvements_tabous", tabous)
+        instrumentation.compter("evaluations_delta", evalues)
+
+        # S'il n'y a plus de mouvement non-tabou, on est potentiellement bloqué.
+        if meilleur_mouvement is None:
             break
 
-        # 5. Sélectionner le meilleur voisin parmi les non-tabous
-        meilleur_voisin = min(voisins, key=lambda v: calculer_distance_totale(v, matrice_distances))
+        # 6. Appliquer le mouvement sur place et mettre à jour la distance courante
+        with instrumentation.phase("application"):
+            if voisinage == "echange":
+                i, j = meilleur_mouvement
+                attributs = [_paire(solution_actuelle[i], solution_actuelle[j])]
+                if reactif is not None:
+                    retirees, ajoutees = _aretes_echange(solution_actuelle, i, j, nombre_villes)
+                appliquer_echange(solution_actuelle, i, j, positions)
+            elif voisinage == "2opt":
+                p, q = meilleur_mouvement
+                attributs = [_paire(solution_actuelle[p], solution_actuelle[p + 1]),
+                             _paire(solution_actuelle[q], solution_actuelle[(q + 1) % nombre_villes])]
+                if reactif is not None:
+                    retirees = attributs
+                    ajoutees = [_paire(solution_actuelle[p], solution_actuelle[q]),
+                                _paire(solution_actuelle[p + 1], solution_actuelle[(q + 1) % nombre_villes])]
+                appliquer_2opt(solution_actuelle, p, q, positions, symetrique, couts_inversion)
+            else:
+                i, longueur, j = meilleur_mouvement
+                retirees, ajoutees = _aretes_or_opt(solution_actuelle, i, longueur, j, nombre_villes)
+                attributs = list(retirees)
+                appliquer_or_opt(solution_actuelle, i, longueur, j, positions)
+        distance_actuelle += meilleur_delta
+        instrumentation.compter("mouvements_acceptes")
 
-        # 6. Mettre à jour la solution actuelle pour le prochain tour de boucle
-        solution_actuelle = meilleur_voisin
+        if reactif is not None:
+            # Mémoire à long terme : arêtes ajoutées, visite du parcours et durée tabou qui en découle
+            reactif.aspirations += aspiration
+            reactif.noter_aretes(ajoutees)
+            cle_parcours ^= _cle_aretes(retirees) ^ _cle_aretes(ajoutees)
+            echappement = reactif.visiter(cle_parcours, iteration + 1)
+            duree_tabou = reactif.duree
 
-        # 7. Ajouter la nouvelle solution (maintenant l'actuelle) à la liste tabou
-        tabu_list.append(tuple(solution_actuelle))
+        # 7. Rendre les attributs du mouvement tabous, et oublier ceux dont l'interdiction a expiré
+        with instrumentation.phase("mise_a_jour_tabou"):
+            for attribut in attributs:
+                tabu_jusqua[attribut] = iteration + duree_tabou
+                echeances.append((iteration + duree_tabou, attribut))
+            while echeances and echeances[0][0] < iteration:
+                echeance, attribut_expire = echeances.popleft()
+                if tabu_jusqua.get(attribut_expire) == echeance:
+                    del tabu_jusqua[attribut_expire]
 
         # 8. Mettre à jour la meilleure solution globale si la solution actuelle est meilleure
-        distance_actuelle = calculer_distance_totale(solution_actuelle, matrice_distances)
         if distance_actuelle < meilleure_distance:
             meilleure_solution = solution_actuelle[:]
             meilleure_distance = distance_actuelle
+            iteration_amelioration = iteration + 1
+            if suivi is not None:
+                suivi(iteration + 1, meilleure_distance)
 
-    return meilleure_solution, meilleure_distance
+        if reactif is not None:
+            # Relance après une stagnation : repartir d'un parcours d'élite (mémoire tabou vidée), ou diversifier
+            reactif.noter(solution_actuelle, distance_actuelle)
+            relance = reactif.relance(iteration + 1, iteration_amelioration, meilleure_distance, echappement)
+            if relance is not None and relance[0] == "intensification":
+                solution_actuelle = relance[1]
+                if structure == "deux_niveaux":
+                    solution_actuelle = ParcoursDeuxNiveaux(solution_actuelle)
+                    positions = solution_actuelle.positions
+                else:
+                    positions = calculer_positions(solution_actuelle)
+                distance_actuelle = calculer_distance_totale(solution_actuelle, matrice_distances)
+                cle_parcours = _cle_aretes(_aretes(solution_actuelle))
+                if couts_inversion is not None:
+                    couts_inversion.actualiser(solution_actuelle)
+                tabu_jusqua.clear()
+                echeances.clear()
+
+        if reprise is not None and reprise.doit_ecrire():
+            reprise.ecrire("tabu_search_candidats", iteration=iteration + 1, solution_actuelle=solution_actuelle[:],
+                           distance_actuelle=distance_actuelle, meilleure_solution=meilleure_solution,
+                           meilleure_distance=meilleure_distance,
+                           tabu_jusqua=[(a, b, echeance) for (a, b), echeance in tabu_jusqua.items()],
+                           echeances=[(a, b, echeance) for echeance, (a, b) in echeances])
+        yield iteration + 1, distance_actuelle, meilleure_solution, meilleure_distance, len(tabu_jusqua)
+
+
+# --- Flux de Progression ---
+
+def iterer_tabu_search(matrice_distances, nombre_iterations, taille_tabu, mode="complet", k_voisins=10,
+                       voisinage="echange", structure="liste", intervalle=1, periode=0.0, reactif=None):
+    """
+    Variante de tabu_search sous forme de générateur (voir progression.py) : un événement
+    (iteration, distances courante et meilleure, taille de la mémoire tabou) toutes les
+    'intervalle' itérations, et au plus un toutes les 'periode' secondes.
+    Le dernier événement (termine=True) contient la meilleure solution.
+    'reactif' (optionnel) : un TabouReactif (voir tabou_reactif.py), ou True.
+    """
+    if reactif is True:
+        reactif = TabouReactif()
+    if mode == "candidats":
+        etapes = _etapes_tabu_candidats(matrice_distances, nombre_iterations, taille_tabu, k_voisins, voisinage,
+                                        structure, reactif=reactif)
+    elif mode == "complet":
+        etapes = _etapes_tabu_complet(matrice_distances, nombre_iterations, taille_tabu, reactif=reactif)
+    else:
+        raise ValueError(f"Mode de recherche tabou inconnu : {mode}")
+
+    progression = SuiviProgression(intervalle, periode)
+    for iteration, distance_actuelle, meilleure_solution, meilleure_distance, taille in etapes:
+        if progression.doit_emettre(iteration):
+            yield progression.evenement(distance_actuelle, meilleure_distance, meilleure_solution,
+                                        iteration=iteration, taille_tabou=taille)
+    progression.doit_emettre(iteration, final=True)
+    yield progression.evenement(distance_actuelle, meilleure_distance, meilleure_solution, final=True,
+                                iteration=iteration, taille_tabou=taille)
 
 
 # --- Bloc d'Exécution ---
@@ -0,0 +1,103 @@
+# Fichier: arret.py
+
+import time
+
+# --- Critères d'Arrêt Communs aux Algorithmes ---
+# Par défaut, les algorithmes s'arrêtent après un nombre fixe d'itérations ou de générations.
+# Un objet CriteresArret, passé en paramètre 'arret', ajoute des critères d'arrêt anticipé :
+# - un budget de temps (en secondes, depuis le début de l'exécution) ;
+# - une distance cible (on s'arrête dès qu'elle est atteinte) ;
+# - une stagnation : aucune amélioration de la meilleure distance pendant K étapes ;
+# - une température minimale (recuit simulé) ;
+# - une borne inférieure de la distance optimale (voir exact.py) : atteindre la borne prouve que
+#   la solution est optimale, il est inutile de continuer. Le rapport indique alors aussi l'écart
+#   relatif entre la meilleure distance trouvée et la borne (écart d'optimalité).
+# Après l'exécution, l'attribut 'critere' indique le critère qui a mis fin à l'exécution :
+# l'un des cinq ci-dessus ("optimum_prouve" pour la borne), "iterations_max" si aucun ne s'est
+# déclenché, ou "voisinage_epuise" si la recherche tabou n'a plus trouvé de mouvement autorisé.
+
+CRITERES = ("duree_max", "distance_cible", "stagnation", "temperature_min", "optimum_prouve", "iterations_max",
+            "voisinage_epuise")
+TOLERANCE_BORNE = 1e-9  # Une borne calculée en flottants peut dépasser l'optimum d'un arrondi
+
+
+class CriteresArret:
+    """
+    Critères d'arrêt anticipé, vérifiés par l'algorithme à chaque étape (itération ou génération).
+    Le recuit simulé, dont les itérations sont très courtes, ne les vérifie que toutes les
+    'intervalle_verification' itérations.
+    'borne_inferieure' : distance en dessous de laquelle aucun parcours n'existe (exact.borne_inferieure).
+    """
+
+    def __init__(self, duree_max=None, distance_cible=None, stagnation_max=None, temperature_min=None,
+                 intervalle_verification=1000, borne_inferieure=None):
+        self.duree_max = duree_max
+        self.distance_cible = distance_cible
+        self.stagnation_max = stagnation_max
+        self.temperature_min = temperature_min
+        self.borne_inferieure = borne_inferieure
+        self.intervalle_verification = intervalle_verification
+        self.demarrer()
+
+    def demarrer(self):
+        """
+        (Ré)initialise le chronomètre et l'état ; appelée par l'algorithme au début de l'exécution.
+        """
+        self.debut = time.perf_counter()
+        self.critere = None
+        self.etape_arret = None
+        self.duree = 0.0
+        self._meilleure_distance = float('inf')
+        self._etape_amelioration = 0
+
+    def verifier(self, etape, meilleure_distance, temperature=None):
+        """
+        Retourne True si l'exécution doit s'arrêter après cette étape, et note le critère déclenché.
+        """
+        if meilleure_distance < self._meilleure_distance:
+            self._meilleure_distance = meilleure_distance
+            self._etape_amelioration = etape
+
+        if self.borne_inferieure is not None and meilleure_distance <= self.borne_inferieure + TOLERANCE_BORNE:
+            critere = "optimum_prouve"
+        elif self.distance_cible is not None and meilleure_distance <= self.distance_cible:
+            critere = "distance_cible"
+        elif self.stagnation_max is not None and etape - self._etape_amelioration >= self.stagnation_max:
+            critere = "stagnation"
+        elif self.temperature_min is not None and temperature is not None and temperature < self.temperature_min:
+            critere = "temperature_min"
+        elif self.duree_max is not None and time.perf_counter() - self.debut >= self.duree_max:
+            critere = "duree_max"
+        else:
+            return False
+        self.critere = critere
+        self.etape_arret = etape
+        self.duree = time.perf_counter() - self.debut
+        return True
+
+    def conclure(self, etape, critere="iterations_max"):
+        """
+        Appelée en fin d'exécution : si aucun critère ne s'est déclenché, c'est 'critere' qui a mis fin
+        à l'exécution (par défaut, le nombre maximal d'étapes a été atteint).
+        """
+        if self.critere is None:
+            self.critere = critere
+            self.etape_arret = etape
+            self.duree = time.perf_counter() - self.debut
+
+    def ecart(self):
+        """
+        Écart d'optimalité de la meilleure distance vue par verifier() : (distance - borne) / borne.
+        La distance optimale est au plus à cet écart relatif de la meilleure distance trouvée.
+        """
+        if self.borne_inferieure is None or self._meilleure_distance == float('inf'):
+            return None
+        if self.borne_inferieure <= 0:
+            return 0.0 if self._meilleure_distance <= self.borne_inferieure + TOLERANCE_BORNE else float('inf')
+        return max(0.0, (self._meilleure_distance - self.borne_inferieure) / self.borne_inferieure)
+
+    def rapport(self):
+        rapport = {"critere": self.critere, "etape": self.etape_arret, "duree": self.duree}
+        if self.borne_inferieure is not None:
+            rapport.update({"borne_inferieure": self.borne_inferieure, "ecart": self.ecart()})
+        return rapport
@@ -0,0 +1,326 @@
+# Fichier: benchmark.py
+
+import argparse
+import csv
+import importlib
+import json
+import math
+import multiprocessing
+import platform
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource  # Mesure du pic mémoire (indisponible sous Windows)
+except ImportError:
+    resource = None
+
+from instances import InstanceTSP, creer_matrice
+from mouvements import tirer_echange, delta_echange
+
+# --- Banc d'Essai : Qualité en Fonction du Temps ---
+# Lance les quatre métaheuristiques sur des instances générées (graine fixe) et mesure,
+# pour chaque exécution : le temps total, le nombre d'évaluations par seconde, le pic
+# mémoire du processus et la courbe "meilleure distance en fonction du temps".
+# Chaque exécution a lieu dans un processus neuf, pour que le pic mémoire lui soit propre.
+# Les résultats sont écrits en JSON (complets, avec les courbes) et en CSV (une ligne par
+# exécution) ; l'option --reference compare une exécution à un fichier JSON précédent et
+# signale les régressions (temps ou distance).
+#
+# Les évaluations sont comptées en mouvements ou individus évalués :
+# - recuit : une évaluation (delta) par itération ;
+# - tabou : la taille du voisinage exploré à chaque itération ;
+# - génétique : un individu évalué par membre de la population et par génération.
+
+COTE = 1000.0  # Les villes sont placées dans le carré [0, COTE] x [0, COTE]
+ALGORITHMES = ("recuit", "tabou", "genetique_rang", "genetique_roulette")
+
+
+# --- Générateurs d'Instances ---
+
+def generer_uniforme(nombre_villes, rng):
+    """
+    Villes tirées uniformément dans le carré.
+    """
+    return [(rng.uniform(0, COTE), rng.uniform(0, COTE)) for _ in range(nombre_villes)]
+
+
+def generer_groupes(nombre_villes, rng):
+    """
+    Villes regroupées autour d'environ √n centres tirés au hasard (distribution normale autour de chaque centre).
+    """
+    nombre_groupes = max(1, int(math.sqrt(nombre_villes)))
+    centres = [(rng.uniform(0, COTE), rng.uniform(0, COTE)) for _ in range(nombre_groupes)]
+    ecart_type = COTE / (4 * nombre_groupes)
+    villes = []
+    for _ in range(nombre_villes):
+        x, y = rng.choice(centres)
+        villes.append((min(max(rng.gauss(x, ecart_type), 0.0), COTE), min(max(rng.gauss(y, ecart_type), 0.0), COTE)))
+    return villes
+
+
+def generer_grille(nombre_villes, rng):
+    """
+    Villes placées sur une grille régulière (les dernières lignes peuvent être incomplètes),
+    puis numérotées dans un ordre aléatoire.
+    """
+    colonnes = math.ceil(math.sqrt(nombre_villes))
+    pas = COTE / colonnes
+    villes = [((k % colonnes) * pas, (k // colonnes) * pas) for k in range(nombre_villes)]
+    rng.shuffle(villes)
+    return villes
+
+
+GENERATEURS = {
+    "uniforme": generer_uniforme,
+    "groupes": generer_groupes,
+    "grille": generer_grille,
+}
+
+
+def generer_instance(type_instance, nombre_villes, graine):
+    """
+    Construit une instance (distances EUC_2D de TSPLIB) reproductible à partir de la graine.
+    """
+    rng = random.Random(graine)
+    coordonnees = GENERATEURS[type_instance](nombre_villes, rng)
+    return InstanceTSP(f"{type_instance}-{nombre_villes}-{graine}", "EUC_2D", coordonnees=coordonnees)
+
+
+# --- Paramètres et Lancement des Algorithmes ---
+
+def temperature_initiale_estimee(matrice, rng, echantillon=100):
+    """
+    Température initiale de l'ordre de l'écart moyen produit par un échange aléatoire.
+    """
+    nombre_villes = len(matrice)
+    solution = list(range(nombre_villes))
+    rng.shuffle(solution)
+    ecarts = [abs(delta_echange(solution, matrice, *tirer_echange(nombre_villes, rng))) for _ in range(echantillon)]
+    return max(sum(ecarts) / echantillon, 1.0)
+
+
+def _lancer(algorithme, matrice, echelle, mode_tabou, suivi):
+    """
+    Lance un algorithme avec des paramètres proportionnés à la taille de l'instance.
+    Retourne (meilleure_distance, etapes, evaluations_par_etape) : les étapes sont les itérations
+    ou les générations exécutées (celles que reçoit 'suivi'), converties ensuite en évaluations.
+    """
+    nombre_villes = len(matrice)
+    if algorithme == "recuit":
+        from algorithme_recuit_simulé import recuit_simule
+        iterations = max(10000, int(echelle * 200 * nombre_villes))
+        temperature = temperature_initiale_estimee(matrice, random.Random(0))
+        # La température est divisée par 10 000 au cours de l'exécution
+        taux = 1e-4 ** (1.0 / iterations)
+        _, distance = recuit_simule(matrice, temperature, taux, iterations, suivi=suivi)
+        return distance, iterations, 1
+
+    if algorithme == "tabou":
+        from algorithme_tabou import tabu_search
+        if mode_tabou == "auto":
+            mode_tabou = "complet" if nombre_villes <= 150 else "candidats"
+        k_voisins = 8
+        iterations = max(10, int(echelle * 100))
+        _, distance = tabu_search(matrice, iterations, 15, mode=mode_tabou, k_voisins=k_voisins, suivi=suivi)
+        if mode_tabou == "complet":
+            return distance, iterations, nombre_villes * (nombre_villes - 1) // 2
+        return distance, iterations, 2 * nombre_villes * min(k_voisins, nombre_villes - 1)
+
+    if algorithme in ("genetique_rang", "genetique_roulette"):
+        module = importlib.import_module("algorithme_" + algorithme)
+        taille_population = 50
+        generations = max(10, int(echelle * 100))
+        _, distance = module.algorithme_genetique(matrice, taille_population, generations, 0.8,
+                                                  1.0 / nombre_villes, 2, suivi=suivi)
+        return distance, generations, taille_population
+
+    raise ValueError(f"Algorithme inconnu : {algorithme}")
+
+
+def _memoire_pic_mo():
+    """
+    Pic de mémoire résidente du processus courant, en Mo (None si non mesurable).
+    """
+    if resource is None:
+        return None
+    pic = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss est en octets sous macOS, en kilo-octets ailleurs
+    return pic / (1024 * 1024) if sys.platform == "darwin" else pic / 1024
+
+
+def executer_cas(cas):
+    """
+    Exécute un cas du banc d'essai (instance, algorithme, graine) et retourne ses mesures.
+    Prévu pour tourner dans un processus neuf (voir executer_banc).
+    """
+    instance = generer_instance(cas["type"], cas["nombre_villes"], cas["graine"])
+    matrice = creer_matrice(instance, cas["stockage"])
+    memoire_instance = _memoire_pic_mo()
+
+    courbe = []
+    debut = time.perf_counter()
+
+    def suivi(etape, meilleure_distance):
+        courbe.append([time.perf_counter() - debut, etape, meilleure_distance])
+
+    random.seed(cas["graine"])
+    distance, etapes, evaluations_par_etape = _lancer(cas["algorithme"], matrice, cas["echelle"],
+                                                      cas["mode_tabou"], suivi)
+    duree = time.perf_counter() - debut
+
+    # Les étapes de la courbe sont converties en évaluations ; la courbe se termine à la fin de l'exécution
+    for point in courbe:
+        point[1] *= evaluations_par_etape
+    evaluations = etapes * evaluations_par_etape
+    courbe.append([duree, evaluations, distance])
+    return {
+        "instance": instance.nom,
+        "type": cas["type"],
+        "nombre_villes": cas["nombre_villes"],
+        "graine": cas["graine"],
+        "algorithme": cas["algorithme"],
+        "stockage": cas["stockage"],
+        "meilleure_distance": distance,
+        "temps": duree,
+        "evaluations": evaluations,
+        "evaluations_par_seconde": evaluations / duree if duree > 0 else None,
+        "memoire_instance_mo": memoire_instance,
+        "memoire_pic_mo": _memoire_pic_mo(),
+        "courbe": courbe,
+    }
+
+
+def executer_banc(cas_liste):
+    """
+    Exécute chaque cas, l'un après l'autre, dans un processus neuf (les temps ne sont pas faussés
+    par des exécutions concurrentes, et chaque pic mémoire est mesuré isolément).
+    """
+    contexte = multiprocessing.get_context("spawn")
+    resultats = []
+    for cas in cas_liste:
+        with ProcessPoolExecutor(max_workers=1, mp_context=contexte) as pool:
+            resultat = pool.submit(executer_cas, cas).result()
+        print(f"{resultat['instance']:>22} {resultat['algorithme']:>18} "
+              f"distance={resultat['meilleure_distance']:<12.1f} temps={resultat['temps']:8.2f}s "
+              f"eval/s={resultat['evaluations_par_seconde'] or 0:12.0f} pic={resultat['memoire_pic_mo'] or 0:8.1f}Mo")
+        resultats.append(resultat)
+    return resultats
+
+
+# --- Sorties et Comparaison ---
+
+COLONNES_CSV = ("instance", "type", "nombre_villes", "graine", "algorithme", "stockage", "meilleure_distance",
+                "temps", "evaluations", "evaluations_par_seconde", "memoire_instance_mo", "memoire_pic_mo")
+
+
+def ecrire_json(chemin, resultats, parametres):
+    """
+    Écrit les résultats complets (avec les courbes) et le contexte d'exécution.
+    """
+    document = {
+        "contexte": {
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "plateforme": platform.platform(),
+            "processeur": platform.processor(),
+            "parametres": parametres,
+        },
+        "resultats": resultats,
+    }
+    with open(chemin, "w", encoding="utf-8") as fichier:
+        json.dump(document, fichier, indent=2, ensure_ascii=False)
+
+
+def ecrire_csv(chemin, resultats):
+    """
+    Écrit une ligne par exécution (sans les courbes).
+    """
+    with open(chemin, "w", newline="", encoding="utf-8") as fichier:
+        ecrivain = csv.DictWriter(fichier, fieldnames=COLONNES_CSV, extrasaction="ignore")
+        ecrivain.writeheader()
+        ecrivain.writerows(resultats)
+
+
+def comparer(resultats, reference, tolerance):
+    """
+    Compare les résultats à ceux d'un fichier de référence (même instance, algorithme et graine).
+    Retourne la liste des régressions : temps ou distance dépassant la référence de plus de 'tolerance' (relatif).
+    """
+    references = {(r["instance"], r["algorithme"], r["graine"]): r for r in reference["resultats"]}
+    regressions = []
+    for resultat in resultats:
+        ancien = references.get((resultat["instance"], resultat["algorithme"], resultat["graine"]))
+        if ancien is None:
+            continue
+        for mesure in ("temps", "meilleure_distance"):
+            if resultat[mesure] > ancien[mesure] * (1 + tolerance):
+                regressions.append({"instance": resultat["instance"], "algorithme": resultat["algorithme"],
+                                    "mesure": mesure, "reference": ancien[mesure], "actuel": resultat[mesure]})
+    return regressions
+
+
+# --- Interface en Ligne de Commande ---
+
+def construire_cas(arguments):
+    """
+    Produit cartésien des types d'instances, tailles, graines et algorithmes demandés.
+    """
+    cas_liste = []
+    for type_instance in arguments.types:
+        for nombre_villes in arguments.tailles:
+            stockage = arguments.stockage
+            if stockage == "auto":
+                # Au-delà de quelques milliers de villes, une matrice complète devient trop coûteuse en mémoire
+                stockage = "liste" if nombre_villes <= 2000 else "coordonnees"
+            for graine in arguments.graines:
+                for algorithme in arguments.algorithmes:
+                    cas_liste.append({"type": type_instance, "nombre_villes": nombre_villes, "graine": graine,
+                                      "algorithme": algorithme, "stockage": stockage, "echelle": arguments.echelle,
+                                      "mode_tabou": arguments.mode_tabou})
+    return cas_liste
+
+
+def analyser_arguments(arguments=None):
+    parseur = argparse.ArgumentParser(description="Banc d'essai des métaheuristiques pour le TSP.")
+    parseur.add_argument("--tailles", type=int, nargs="+", default=[100, 1000, 10000])
+    parseur.add_argument("--types", nargs="+", choices=sorted(GENERATEURS), default=["uniforme", "groupes", "grille"])
+    parseur.add_argument("--algorithmes", nargs="+", choices=ALGORITHMES, default=list(ALGORITHMES))
+    parseur.add_argument("--graines", type=int, nargs="+", default=[0])
+    parseur.add_argument("--echelle", type=float, default=1.0,
+                         help="Multiplie le budget (itérations, générations) de chaque algorithme")
+    parseur.add_argument("--stockage", choices=["auto", "liste", "compacte", "coordonnees"], default="auto")
+    parseur.add_argument("--mode-tabou", choices=["auto", "complet", "candidats"], default="auto")
+    parseur.add_argument("--json", default="benchmark.json", help="Fichier de résultats complets")
+    parseur.add_argument("--csv", default=None, help="Fichier de résultats résumés (optionnel)")
+    parseur.add_argument("--reference", default=None, help="Fichier JSON d'une exécution précédente à comparer")
+    parseur.add_argument("--tolerance", type=float, default=0.10,
+                         help="Écart relatif toléré avant de signaler une régression")
+    return parseur.parse_args(arguments)
+
+
+def main(arguments=None):
+    arguments = analyser_arguments(arguments)
+    resultats = executer_banc(construire_cas(arguments))
+
+    ecrire_json(arguments.json, resultats, vars(arguments))
+    if arguments.csv:
+        ecrire_csv(arguments.csv, resultats)
+
+    if arguments.reference:
+        with open(arguments.reference, encoding="utf-8") as fichier:
+            regressions = comparer(resultats, json.load(fichier), arguments.tolerance)
+        for regression in regressions:
+            print(f"RÉGRESSION {regression['instance']} {regression['algorithme']} {regression['mesure']}: "
+                  f"{regression['reference']:.4g} -> {regression['actuel']:.4g}")
+        if regressions:
+            return 1
+    return 0
+
+
+# --- Bloc d'Exécution ---
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+# Fichier: cache_evaluations.py
+
+from collections import OrderedDict
+
+from mouvements import calculer_distance_totale
+from recherche_locale import est_symetrique
+from diversite import HachageZobrist
+
+# --- Cache des Évaluations (Mémoïsation des Distances) ---
+# D'une génération à l'autre, un algorithme génétique réévalue beaucoup de parcours
+# identiques : les élites recopiées telles quelles, et les enfants qui ne sont que des
+# copies de leur premier parent (pas de croisement, pas de mutation).
+# Le cache associe à chaque parcours sa distance. La clé est un hachage de Zobrist de 64 bits
+# (voir diversite.py), le même pour toutes les rotations du parcours (et, si la matrice est
+# symétrique, pour ses deux sens), qui ont toutes la même distance : une entrée occupe une taille
+# fixe quel que soit le nombre de villes, et les clés d'une population sont calculées en lot (NumPy).
+# Deux parcours distincts ne partagent une clé qu'avec une probabilité de l'ordre de m² / 2**65
+# pour m parcours mémorisés ; les parcours eux-mêmes ne sont pas conservés.
+# Le nombre d'entrées est borné : au-delà, la moins récemment utilisée est oubliée (LRU).
+
+
+class CacheEvaluations:
+    """
+    Cache LRU borné des distances de parcours, avec compteurs de succès et d'échecs.
+    Le sens de parcours n'est ignoré que pour une matrice symétrique : sur une matrice
+    asymétrique, un parcours et son inverse n'ont pas la même distance.
+    """
+
+    def __init__(self, matrice, taille_max=10000, symetrique=None):
+        self.matrice = matrice
+        self.taille_max = taille_max
+        self.symetrique = est_symetrique(matrice) if symetrique is None else symetrique
+        self.hachage = HachageZobrist(len(matrice), self.symetrique)
+        self._distances = OrderedDict()
+        self.succes = 0
+        self.echecs = 0
+
+    def __len__(self):
+        return len(self._distances)
+
+    def _distance(self, solution, cle):
+        distance = self._distances.get(cle)
+        if distance is not None:
+            self._distances.move_to_end(cle)
+            self.succes += 1
+            return distance
+
+        self.echecs += 1
+        distance = calculer_distance_totale(solution, self.matrice)
+        self._distances[cle] = distance
+        if len(self._distances) > self.taille_max:
+            self._distances.popitem(last=False)  # Oublier l'entrée la moins récemment utilisée
+        return distance
+
+    def distance(self, solution):
+        """
+        Distance du parcours : lue dans le cache si possible, sinon calculée puis mémorisée.
+        """
+        return self._distance(solution, self.hachage.cles_lot([solution])[0].item())
+
+    def distances(self, population):
+        """
+        Distances de tous les parcours d'une population, dont les clés sont calculées en un seul lot.
+        """
+        cles = self.hachage.cles_lot(population).tolist()
+        return [self._distance(solution, cle) for solution, cle in zip(population, cles)]
+
+    def vider(self):
+        self._distances.clear()
+        self.succes = 0
+        self.echecs = 0
+
+    def statistiques(self):
+        """
+        Compteurs du cache : succès, échecs, taux de succès et nombre d'entrées.
+        """
+        total = self.succes + self.echecs
+        return {
+            "succes": self.succes,
+            "echecs": self.echecs,
+            "taux_succes": self.succes / total if total else 0.0,
+            "entrees": len(self._distances),
+        }
@@ -0,0 +1,507 @@
+# Fichier: construction.py
+
+import heapq
+import math
+import random
+
+from mouvements import calculer_plus_proches_voisins
+
+# --- Heuristiques de Construction (Parcours Initiaux) ---
+# Par défaut, les algorithmes partent d'un parcours aléatoire, très loin d'un bon parcours :
+# une bonne partie de l'exécution ne sert qu'à en sortir. Ce module construit en une passe
+# des parcours initiaux de bien meilleure qualité :
+# - plus_proche_voisin : on se rend toujours à la ville non visitée la plus proche ;
+# - glouton : on ajoute les arêtes de la plus courte à la plus longue, sans jamais créer
+#   de ville de degré 3 ni de cycle prématuré, puis on relie les fragments obtenus ;
+# - courbe_remplissage : les villes sont visitées dans l'ordre d'une courbe de Hilbert ;
+# - christofides : arbre couvrant minimal, couplage des villes de degré impair, circuit
+#   eulérien puis raccourcis. Le couplage est glouton (et non parfait de poids minimal) :
+#   c'est une variante approchée, sans la garantie 3/2 de l'algorithme exact.
+# Pour une instance à coordonnées, une grille spatiale (GrilleSpatiale) remplace les recherches
+# en O(n) par des recherches locales, et la construction est proche de O(n log n).
+# Sans coordonnées, on s'appuie sur les listes de plus proches voisins de la matrice (O(n²) une fois).
+# Les variantes aléatoires (départ tiré au hasard, longueurs d'arêtes bruitées, courbe tournée)
+# diversifient la population initiale de l'algorithme génétique (voir construire_population).
+
+NOMBRE_VOISINS = 10  # Arêtes candidates par ville (glouton, arbre couvrant, couplage)
+BRUIT_GLOUTON = 0.1  # Bruit relatif sur la longueur des arêtes pour les variantes aléatoires
+
+
+# --- Index Spatial ---
+
+class GrilleSpatiale:
+    """
+    Index spatial : les villes (toutes, ou le sous-ensemble 'villes') sont réparties dans une grille
+    de cases carrées contenant chacune environ 'villes_par_case' villes. La recherche des plus proches
+    parcourt les cases par anneaux autour du point, et s'arrête dès qu'aucun anneau plus lointain
+    ne peut contenir de ville plus proche. Les villes peuvent être retirées au fil de la construction.
+    """
+
+    def __init__(self, points, villes=None, villes_par_case=2):
+        self._points = points
+        villes = list(range(len(points)) if villes is None else villes)
+        self.taille = len(villes)
+
+        self._xmin = min((points[v][0] for v in villes), default=0.0)
+        self._ymin = min((points[v][1] for v in villes), default=0.0)
+        etendue = max(max((points[v][0] for v in villes), default=0.0) - self._xmin,
+                      max((points[v][1] for v in villes), default=0.0) - self._ymin)
+        self._colonnes = max(1, int(math.sqrt(len(villes) / villes_par_case)))
+        self._cote = etendue / self._colonnes or 1.0
+        self._cases = [[] for _ in range(self._colonnes * self._colonnes)]
+        for ville in villes:
+            cx, cy = self._case(*points[ville])
+            self._cases[cx * self._colonnes + cy].append(ville)
+
+    def _case(self, x, y):
+        cx = min(self._colonnes - 1, max(0, int((x - self._xmin) / self._cote)))
+        cy = min(self._colonnes - 1, max(0, int((y - self._ymin) / self._cote)))
+        return cx, cy
+
+    def _anneau(self, cx, cy, rayon):
+        """
+        Cases situées exactement à 'rayon' cases (au sens de Tchebychev) de la case (cx, cy).
+        """
+        for i in range(max(0, cx - rayon), min(self._colonnes, cx + rayon + 1)):
+            if rayon == 0 or i in (cx - rayon, cx + rayon):
+                colonnes = range(max(0, cy - rayon), min(self._colonnes, cy + rayon + 1))
+            else:
+                colonnes = [j for j in (cy - rayon, cy + rayon) if 0 <= j < self._colonnes]
+            for j in colonnes:
+                yield i * self._colonnes + j
+
+    def retirer(self, ville):
+        cx, cy = self._case(*self._points[ville])
+        self._cases[cx * self._colonnes + cy].remove(ville)
+        self.taille -= 1
+
+    def plus_proches(self, x, y, k=1):
+        """
+        Les k villes de la grille les plus proches du point (x, y), de la plus proche à la plus lointaine.
+        """
+        k = min(k, self.taille)
+        if k == 0:
+            return []
+        cx, cy = self._case(x, y)
+        meilleures = []  # Tas des k meilleures : (-distance², ville)
+        rayon = 0
+        while rayon <= self._colonnes:
+            for case in self._anneau(cx, cy, rayon):
+                for ville in self._cases[case]:
+                    dx = self._points[ville][0] - x
+                    dy = self._points[ville][1] - y
+                    distance2 = dx * dx + dy * dy
+                    if len(meilleures) < k:
+                        heapq.heappush(meilleures, (-distance2, ville))
+                    elif distance2 < -meilleures[0][0]:
+                        heapq.heapreplace(meilleures, (-distance2, ville))
+            # Toute case de l'anneau suivant est à au moins rayon * cote du point
+            if len(meilleures) == k and (rayon * self._cote) ** 2 >= -meilleures[0][0]:
+                break
+            rayon += 1
+        return [ville for _, ville in sorted(meilleures, reverse=True)]
+
+
+def _points(matrice, coordonnees=None):
+    """
+    Coordonnées des villes sous forme de liste de couples (x, y) : celles fournies,
+    sinon celles d'une MatriceCoordonnees (voir instances.py), sinon None.
+    """
+    if coordonnees is None:
+        coordonnees = getattr(matrice, "coordonnees", None)
+        if coordonnees is None:
+            return None
+    if hasattr(coordonnees, "tolist"):
+        coordonnees = coordonnees.tolist()
+    return [(float(point[0]), float(point[1])) for point in coordonnees]
+
+
+def _voisins(matrice, points, k=NOMBRE_VOISINS):
+    """
+    Les k plus proches voisines de chaque ville : par la grille si l'on a des coordonnées,
+    sinon d'après la matrice (voir mouvements.calculer_plus_proches_voisins).
+    """
+    if points is None:
+        return calculer_plus_proches_voisins(matrice, k)
+    grille = GrilleSpatiale(points)
+    return [[autre for autre in grille.plus_proches(x, y, k + 1) if autre != ville][:k]
+            for ville, (x, y) in enumerate(points)]
+
+
+def _aretes_candidates(matrice, plus_proches_voisins, bruit=0.0, rng=random):
+    """
+    Arêtes (a, b) vers les plus proches voisines, triées par longueur croissante
+    (longueur multipliée par un facteur aléatoire entre 1 et 1 + bruit pour les variantes aléatoires).
+    """
+    longueurs = {}
+    for a, voisines in enumerate(plus_proches_voisins):
+        ligne = matrice[a]
+        for b in voisines:
+            arete = (a, b) if a < b else (b, a)
+            if arete not in longueurs:
+                longueurs[arete] = ligne[b] * (1.0 + bruit * rng.random()) if bruit else ligne[b]
+    return sorted(longueurs, key=longueurs.__getitem__)
+
+
+def _racine(parent, ville):
+    """
+    Représentant de la composante de 'ville' (union-find, avec compression de chemin par moitiés).
+    """
+    while parent[ville] != ville:
+        parent[ville] = parent[parent[ville]]
+        ville = parent[ville]
+    return ville
+
+
+def _plus_proche_parmi(matrice, points, grille, restantes, ville):
+    """
+    Ville de 'restantes' (ou de la grille, si elle est fournie) la plus proche de 'ville'.
+    """
+    if grille is not None:
+        return grille.plus_proches(*points[ville])[0]
+    ligne = matrice[ville]
+    return min(restantes, key=ligne.__getitem__)
+
+
+# --- Heuristiques de Construction ---
+
+def plus_proche_voisin(matrice, depart=0, coordonnees=None, plus_proches_voisins=None):
+    """
+    Parcours du plus proche voisin à partir de la ville 'depart'.
+    Avec des coordonnées, la ville la plus proche est cherchée dans une grille (distance euclidienne) ;
+    sinon, d'abord parmi les k plus proches voisines, puis parmi toutes les villes restantes.
+    """
+    nombre_villes = len(matrice)
+    points = _points(matrice, coordonnees)
+    parcours = [depart]
+
+    if points is not None:
+        grille = GrilleSpatiale(points)
+        grille.retirer(depart)
+        ville = depart
+        while grille.taille:
+            ville = grille.plus_proches(*points[ville])[0]
+            grille.retirer(ville)
+            parcours.append(ville)
+        return parcours
+
+    if plus_proches_voisins is None:
+        plus_proches_voisins = calculer_plus_proches_voisins(matrice, NOMBRE_VOISINS)
+    restantes = set(range(nombre_villes))
+    restantes.discard(depart)
+    ville = depart
+    while restantes:
+        # Les voisines sont triées : la première non visitée est la plus proche de toutes les restantes
+        suivante = next((autre for autre in plus_proches_voisins[ville] if autre in restantes), None)
+        if suivante is None:
+            suivante = _plus_proche_parmi(matrice, None, None, restantes, ville)
+        restantes.discard(suivante)
+        parcours.append(suivante)
+        ville = suivante
+    return parcours
+
+
+def _relier_fragments(matrice, points, adjacence):
+    """
+    Relie en un parcours les chaînes décrites par 'adjacence' (chaque ville a 0, 1 ou 2 voisines) :
+    au bout de chaque chaîne, on rejoint l'extrémité libre la plus proche.
+    """
+    extremites = [ville for ville, voisines in enumerate(adjacence) if len(voisines) < 2]
+    grille = GrilleSpatiale(points, extremites) if points is not None else None
+    restantes = set(extremites)
+
+    parcours = []
+    debut = extremites[0]
+    while True:
+        # Parcourir la chaîne depuis 'debut' jusqu'à son autre extrémité
+        precedente, ville = None, debut
+        while True:
+            parcours.append(ville)
+            suivantes = [autre for autre in adjacence[ville] if autre != precedente]
+            if not suivantes:
+                break
+            precedente, ville = ville, suivantes[0]
+        for extremite in {debut, ville}:
+            restantes.discard(extremite)
+            if grille is not None:
+                grille.retirer(extremite)
+        if not restantes:
+            return parcours
+        debut = _plus_proche_parmi(matrice, points, grille, restantes, ville)
+
+
+def glouton(matrice, coordonnees=None, plus_proches_voisins=None, bruit=0.0, rng=random):
+    """
+    Heuristique gloutonne des arêtes : les arêtes candidates (vers les k plus proches voisines)
+    sont ajoutées de la plus courte à la plus longue si aucune des deux villes n'a déjà deux voisines
+    et si elles ne ferment pas de cycle ; les chaînes obtenues sont ensuite reliées.
+    Avec bruit > 0, les longueurs sont légèrement perturbées (variante aléatoire).
+    """
+    nombre_villes = len(matrice)
+    if nombre_villes < 3:
+        return list(range(nombre_villes))
+    points = _points(matrice, coordonnees)
+    if plus_proches_voisins is None:
+        plus_proches_voisins = _voisins(matrice, points)
+
+    parent = list(range(nombre_villes))
+    adjacence = [[] for _ in range(nombre_villes)]
+    for a, b in _aretes_candidates(matrice, plus_proches_voisins, bruit, rng):
+        if len(adjacence[a]) < 2 and len(adjacence[b]) < 2:
+            racine_a, racine_b = _racine(parent, a), _racine(parent, b)
+            if racine_a != racine_b:
+                parent[racine_a] = racine_b
+                adjacence[a].append(b)
+                adjacence[b].append(a)
+    return _relier_fragments(matrice, points, adjacence)
+
+
+def _indice_hilbert(x, y, ordre):
+    """
+    Position du point entier (x, y), 0 <= x, y < 2**ordre, le long de la courbe de Hilbert.
+    """
+    cote = 1 << ordre
+    indice = 0
+    s = cote >> 1
+    while s:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        indice += s * s * ((3 * rx) ^ ry)
+        if ry == 0:
+            if rx == 1:
+                x, y = cote - 1 - x, cote - 1 - y
+            x, y = y, x
+        s >>= 1
+    return indice
+
+
+def courbe_remplissage(matrice, coordonnees=None, rng=None, ordre=16):
+    """
+    Parcours des villes dans l'ordre de la courbe de Hilbert (tri en O(n log n)).
+    Avec 'rng', le plan est d'abord tourné d'un angle aléatoire (variante aléatoire).
+    """
+    points = _points(matrice, coordonnees)
+    if points is None:
+        raise ValueError("La courbe de remplissage nécessite les coordonnées des villes")
+    if rng is not None:
+        angle = 2 * math.pi * rng.random()
+        cosinus, sinus = math.cos(angle), math.sin(angle)
+        points = [(x * cosinus - y * sinus, x * sinus + y * cosinus) for x, y in points]
+
+    xmin = min(x for x, _ in points)
+    ymin = min(y for _, y in points)
+    etendue = max(max(x for x, _ in points) - xmin, max(y for _, y in points) - ymin) or 1.0
+    echelle = ((1 << ordre) - 1) / etendue
+    indices = [_indice_hilbert(int((x - xmin) * echelle), int((y - ymin) * echelle), ordre) for x, y in points]
+    return sorted(range(len(points)), key=indices.__getitem__)
+
+
+def _relier_composantes(matrice, points, parent, adjacence):
+    """
+    Relie les composantes d'une forêt couvrante (le graphe des arêtes candidates n'est pas
+    toujours connexe) : chaque composante est reliée à la ville la plus proche hors d'elle,
+    jusqu'à n'en avoir plus qu'une.
+    """
+    nombre_villes = len(adjacence)
+    grille = GrilleSpatiale(points) if points is not None else None
+    while True:
+        representants = [ville for ville in range(nombre_villes) if _racine(parent, ville) == ville]
+        if len(representants) == 1:
+            return
+        for ville in representants:
+            racine = _racine(parent, ville)
+            if grille is not None:
+                k = NOMBRE_VOISINS
+                while True:
+                    dehors = [autre for autre in grille.plus_proches(*points[ville], k)
+                              if _racine(parent, autre) != racine]
+                    if dehors or k >= nombre_villes:
+                        break
+                    k *= 4
+                if not dehors:
+                    continue
+                autre = dehors[0]
+            else:
+                ligne = matrice[ville]
+                autre = min((autre for autre in range(nombre_villes) if _racine(parent, autre) != racine),
+                            key=ligne.__getitem__, default=None)
+                if autre is None:
+                    continue
+            parent[racine] = _racine(parent, autre)
+            adjacence[ville].append(autre)
+            adjacence[autre].append(ville)
+
+
+def _coupler_impairs(matrice, points, impairs, plus_proches_voisins):
+    """
+    Couplage glouton des villes de degré impair : paires candidates de la plus courte à la plus longue,
+    puis les villes restées seules sont couplées à leur plus proche voisine encore libre.
+    """
+    if points is not None:
+        grille = GrilleSpatiale(points, impairs)
+        candidates = {ville: [autre for autre in grille.plus_proches(*points[ville], NOMBRE_VOISINS + 1)
+                              if autre != ville] for ville in impairs}
+    else:
+        ensemble = set(impairs)
+        candidates = {ville: [autre for autre in plus_proches_voisins[ville] if autre in ensemble]
+                      for ville in impairs}
+
+    paires = {}
+    for a, voisines in candidates.items():
+        for b in voisines:
+            paires[(a, b) if a < b else (b, a)] = matrice[a][b]
+    libres = set(impairs)
+    couplage = []
+    for a, b in sorted(paires, key=paires.__getitem__):
+        if a in libres and b in libres:
+            libres.discard(a)
+            libres.discard(b)
+            couplage.append((a, b))
+
+    # Villes sans candidate libre : couplage au plus proche (leur nombre est faible)
+    restantes = sorted(libres)
+    libres = set(restantes)
+    for a in restantes:
+        if a in libres:
+            libres.discard(a)
+            b = _plus_proche_parmi(matrice, None, None, libres, a)
+            libres.discard(b)
+            couplage.append((a, b))
+    return couplage
+
+
+def _circuit_eulerien(adjacence, depart=0):
+    """
+    Circuit eulérien (algorithme de Hierholzer) d'un multigraphe connexe dont tous les degrés sont pairs.
+    'adjacence[v]' est la liste des (voisine, numéro d'arête).
+    """
+    utilisee = set()
+    prochaine = [0] * len(adjacence)
+    pile = [depart]
+    circuit = []
+    while pile:
+        ville = pile[-1]
+        aretes = adjacence[ville]
+        while prochaine[ville] < len(aretes) and aretes[prochaine[ville]][1] in utilisee:
+            prochaine[ville] += 1
+        if prochaine[ville] < len(aretes):
+            autre, numero = aretes[prochaine[ville]]
+            utilisee.add(numero)
+            pile.append(autre)
+        else:
+            circuit.append(pile.pop())
+    return circuit
+
+
+def christofides(matrice, coordonnees=None, plus_proches_voisins=None):
+    """
+    Construction dans l'esprit de Christofides : arbre couvrant minimal (Kruskal sur les arêtes candidates),
+    couplage glouton des villes de degré impair, circuit eulérien, puis raccourcis (chaque ville n'est
+    gardée qu'à sa première visite).
+    """
+    nombre_villes = len(matrice)
+    if nombre_villes < 3:
+        return list(range(nombre_villes))
+    points = _points(matrice, coordonnees)
+    if plus_proches_voisins is None:
+        plus_proches_voisins = _voisins(matrice, points)
+
+    # 1. Arbre couvrant minimal
+    parent = list(range(nombre_villes))
+    arbre = [[] for _ in range(nombre_villes)]
+    for a, b in _aretes_candidates(matrice, plus_proches_voisins):
+        racine_a, racine_b = _racine(parent, a), _racine(parent, b)
+        if racine_a != racine_b:
+            parent[racine_a] = racine_b
+            arbre[a].append(b)
+            arbre[b].append(a)
+    _relier_composantes(matrice, points, parent, arbre)
+
+    # 2. Couplage des villes de degré impair
+    impairs = [ville for ville in range(nombre_villes) if len(arbre[ville]) % 2]
+    aretes = [(a, b) for a in range(nombre_villes) for b in arbre[a] if a < b]
+    aretes.extend(_coupler_impairs(matrice, points, impairs, plus_proches_voisins))
+
+    # 3. Circuit eulérien du multigraphe (arbre + couplage), puis raccourcis
+    adjacence = [[] for _ in range(nombre_villes)]
+    for numero, (a, b) in enumerate(aretes):
+        adjacence[a].append((b, numero))
+        adjacence[b].append((a, numero))
+    visitees = set()
+    parcours = []
+    for ville in _circuit_eulerien(adjacence):
+        if ville not in visitees:
+            visitees.add(ville)
+            parcours.append(ville)
+    return parcours
+
+
+# --- Parcours et Population Initiaux des Algorithmes ---
+
+CONSTRUCTIONS = {
+    "plus_proche_voisin": plus_proche_voisin,
+    "glouton": glouton,
+    "courbe": courbe_remplissage,
+    "christofides": christofides,
+}
+
+
+def construire_parcours(matrice, methode="glouton", coordonnees=None):
+    """
+    Construit un parcours initial avec l'heuristique 'methode' (voir CONSTRUCTIONS).
+    """
+    if methode not in CONSTRUCTIONS:
+        raise ValueError(f"Heuristique de construction inconnue : {methode}")
+    return CONSTRUCTIONS[methode](matrice, coordonnees=coordonnees)
+
+
+def parcours_initial(matrice, solution_initiale):
+    """
+    Parcours de départ d'un algorithme : 'solution_initiale' est soit le nom d'une heuristique
+    de construction, soit un parcours (vérifié : chaque ville y apparaît exactement une fois).
+    """
+    if isinstance(solution_initiale, str):
+        return construire_parcours(matrice, solution_initiale)
+    parcours = list(solution_initiale)
+    if sorted(parcours) != list(range(len(matrice))):
+        raise ValueError("La solution initiale doit contenir chaque ville exactement une fois")
+    return parcours
+
+
+def construire_population(matrice, nombre, rng=random, coordonnees=None):
+    """
+    Construit 'nombre' parcours initiaux variés pour un algorithme génétique : un parcours de
+    Christofides, puis, en alternance, des variantes aléatoires du plus proche voisin (ville de
+    départ tirée au hasard), de l'heuristique gloutonne (arêtes bruitées) et, avec des
+    coordonnées, de la courbe de remplissage (plan tourné).
+    """
+    if nombre <= 0:
+        return []
+    nombre_villes = len(matrice)
+    points = _points(matrice, coordonnees)
+    voisins = _voisins(matrice, points)
+    variantes = ["plus_proche_voisin", "glouton"] + (["courbe"] if points is not None else [])
+
+    population = [christofides(matrice, points, voisins)]
+    for k in range(nombre - 1):
+        variante = variantes[k % len(variantes)]
+        if variante == "plus_proche_voisin":
+            population.append(plus_proche_voisin(matrice, rng.randrange(nombre_villes), points, voisins))
+        elif variante == "glouton":
+            population.append(glouton(matrice, points, voisins, BRUIT_GLOUTON, rng))
+        else:
+            population.append(courbe_remplissage(matrice, points, rng))
+    return population
+
+
+def population_initiale(matrice, taille_population, part_construite=0.0, rng=random):
+    """
+    Population initiale d'un algorithme génétique : une part 'part_construite' (entre 0 et 1)
+    de parcours construits (voir construire_population), complétée par des permutations aléatoires.
+    """
+    nombre_villes = len(matrice)
+    nombre_construits = min(taille_population, round(part_construite * taille_population))
+    population = construire_population(matrice, nombre_construits, rng)
+    population.extend(rng.sample(range(nombre_villes), nombre_villes)
+                      for _ in range(taille_population - nombre_construits))
+    return population
@@ -0,0 +1,272 @@
+# Fichier: croisements.py
+
+import random
+
+# --- Opérateurs de Croisement pour les Permutations ---
+# Tous les opérateurs partagent la même interface :
+#     operateur(parent1, parent2, matrice) -> enfant
+# La matrice n'est utilisée que par les opérateurs qui exploitent le coût des arêtes (EAX).
+# Chaque opérateur construit un enfant en O(n) (ou presque) grâce à des tableaux
+# indexés par ville, au lieu de tests d'appartenance sur des listes.
+
+
+def croisement_ox1(parent1, parent2, matrice=None):
+    """
+    Ordered Crossover (OX1) en temps linéaire.
+    Le segment [debut, fin] de parent1 est recopié aux mêmes positions, puis les positions
+    restantes sont remplies avec les villes de parent2, dans leur ordre d'apparition.
+    L'appartenance au segment est testée par un masque booléen indexé par ville.
+    """
+    taille = len(parent1)
+    debut, fin = sorted(random.sample(range(taille), 2))
+
+    # 1. Copier parent1 : seules les positions hors du segment seront réécrites
+    enfant = parent1[:]
+    dans_segment = [False] * taille
+    for ville in parent1[debut:fin + 1]:
+        dans_segment[ville] = True
+
+    # 2. Remplir les positions hors segment avec les villes de parent2, en sautant le segment
+    index_enfant = 0
+    for ville in parent2:
+        if dans_segment[ville]:
+            continue
+        if index_enfant == debut:
+            index_enfant = fin + 1
+        enfant[index_enfant] = ville
+        index_enfant += 1
+    return enfant
+
+
+def croisement_pmx(parent1, parent2, matrice=None):
+    """
+    Partially Mapped Crossover (PMX).
+    Le segment de parent1 est recopié, les autres positions reprennent la ville de parent2
+    en suivant la correspondance du segment (parent1[k] -> parent2[k]) en cas de conflit.
+    """
+    taille = len(parent1)
+    debut, fin = sorted(random.sample(range(taille), 2))
+
+    enfant = parent2[:]
+    enfant[debut:fin + 1] = parent1[debut:fin + 1]
+    dans_segment = [False] * taille
+    correspondance = [-1] * taille
+    for k in range(debut, fin + 1):
+        dans_segment[parent1[k]] = True
+        correspondance[parent1[k]] = parent2[k]
+
+    # Chaque chaîne de correspondance est parcourue une seule fois : coût total O(n)
+    for k in list(range(debut)) + list(range(fin + 1, taille)):
+        ville = parent2[k]
+        while dans_segment[ville]:
+            ville = correspondance[ville]
+        enfant[k] = ville
+    return enfant
+
+
+def _adjacences(parcours):
+    """
+    Retourne, pour chaque ville, ses deux voisines (précédente, suivante) dans le parcours.
+    """
+    taille = len(parcours)
+    adjacences = [None] * taille
+    for k, ville in enumerate(parcours):
+        adjacences[ville] = [parcours[k - 1], parcours[(k + 1) % taille]]
+    return adjacences
+
+
+def croisement_erx(parent1, parent2, matrice=None):
+    """
+    Edge Recombination Crossover (ERX).
+    L'enfant est construit ville par ville en réutilisant au maximum les arêtes des parents :
+    on va vers la voisine (dans l'union des arêtes) qui a le moins de voisines restantes,
+    et vers une ville non visitée au hasard si aucune arête n'est disponible.
+    """
+    taille = len(parent1)
+    adjacences1 = _adjacences(parent1)
+    adjacences2 = _adjacences(parent2)
+    carte_aretes = [set(adjacences1[ville]) | set(adjacences2[ville]) for ville in range(taille)]
+
+    # Ensemble des villes non visitées avec retrait en O(1) (échange avec la dernière)
+    non_visitees = list(range(taille))
+    index_non_visitees = list(range(taille))
+
+    def retirer(ville):
+        k = index_non_visitees[ville]
+        derniere = non_visitees[-1]
+        non_visitees[k] = derniere
+        index_non_visitees[derniere] = k
+        non_visitees.pop()
+        for voisine in carte_aretes[ville]:
+            carte_aretes[voisine].discard(ville)
+
+    ville = parent1[0]
+    enfant = [ville]
+    retirer(ville)
+    while non_visitees:
+        voisines = carte_aretes[ville]
+        if voisines:
+            plus_petit_degre = min(len(carte_aretes[v]) for v in voisines)
+            ville = random.choice([v for v in voisines if len(carte_aretes[v]) == plus_petit_degre])
+        else:
+            ville = random.choice(non_visitees)
+        enfant.append(ville)
+        retirer(ville)
+    return enfant
+
+
+def _cycles_ab(adjacences1, adjacences2):
+    """
+    Décompose les arêtes propres à chaque parent en cycles AB : des cycles qui alternent
+    une arête présente seulement dans parent1 (A) et une arête présente seulement dans parent2 (B).
+    Chaque cycle est une liste d'arêtes (u, v, vient_de_A).
+    """
+    taille = len(adjacences1)
+    restes = (
+        [[v for v in adjacences1[u] if v not in adjacences2[u]] for u in range(taille)],
+        [[v for v in adjacences2[u] if v not in adjacences1[u]] for u in range(taille)],
+    )
+    cycles = []
+    for depart in range(taille):
+        while restes[0][depart]:
+            # Marche alternée : l'arête d'indice k du chemin vient de A si k est pair
+            chemin = [depart]
+            occurrences = {depart: [0]}
+            ville = depart
+            while True:
+                type_arete = (len(chemin) - 1) % 2
+                candidates = restes[type_arete][ville]
+                if not candidates:
+                    break
+                suivante = random.choice(candidates)
+                candidates.remove(suivante)
+                restes[type_arete][suivante].remove(ville)
+                chemin.append(suivante)
+                fin = len(chemin) - 1
+
+                # Fermeture d'un cycle : la ville a déjà été atteinte avec la même parité
+                fermeture = None
+                for i in reversed(occurrences.get(suivante, [])):
+                    if (fin - i) % 2 == 0:
+                        fermeture = i
+                        break
+                if fermeture is None:
+                    occurrences.setdefault(suivante, []).append(fin)
+                    ville = suivante
+                    continue
+
+                cycles.append([(chemin[k], chemin[k + 1], k % 2 == 0) for k in range(fermeture, fin)])
+                for ville_retiree in chemin[fermeture + 1:fin]:
+                    occurrences[ville_retiree].pop()
+                    if not occurrences[ville_retiree]:
+                        del occurrences[ville_retiree]
+                del chemin[fermeture + 1:]
+                ville = suivante
+    return cycles
+
+
+def _sous_tours(adjacences):
+    """
+    Extrait les sous-tours d'un graphe où chaque ville a exactement deux voisines.
+    """
+    taille = len(adjacences)
+    visitee = [False] * taille
+    sous_tours = []
+    for depart in range(taille):
+        if visitee[depart]:
+            continue
+        sous_tour = [depart]
+        visitee[depart] = True
+        precedente, ville = depart, adjacences[depart][0]
+        while ville != depart:
+            sous_tour.append(ville)
+            visitee[ville] = True
+            a, b = adjacences[ville]
+            precedente, ville = ville, (b if a == precedente else a)
+        sous_tours.append(sous_tour)
+    return sous_tours
+
+
+def _fusionner_sous_tours(sous_tours, matrice):
+    """
+    Fusionne les sous-tours un par un : le plus petit est relié à un autre en remplaçant
+    deux arêtes (u, v) et (w, x) par la paire d'arêtes de reconnexion la moins coûteuse.
+    """
+    while len(sous_tours) > 1:
+        sous_tours.sort(key=len)
+        petit = sous_tours[0]
+        meilleur = None
+        for index_autre in range(1, len(sous_tours)):
+            autre = sous_tours[index_autre]
+            for a in range(len(petit)):
+                u, v = petit[a], petit[(a + 1) % len(petit)]
+                cout_uv = matrice[u][v]
+                for b in range(len(autre)):
+                    w, x = autre[b], autre[(b + 1) % len(autre)]
+                    retrait = cout_uv + matrice[w][x]
+                    for croise in (False, True):
+                        ajout = matrice[u][x] + matrice[w][v] if croise else matrice[u][w] + matrice[x][v]
+                        if meilleur is None or ajout - retrait < meilleur[0]:
+                            meilleur = (ajout - retrait, index_autre, a, b, croise)
+
+        _, index_autre, a, b, croise = meilleur
+        autre = sous_tours[index_autre]
+        # Chemin v ... u dans le petit sous-tour, chemin x ... w dans l'autre
+        chemin_petit = petit[a + 1:] + petit[:a + 1]
+        chemin_autre = autre[b + 1:] + autre[:b + 1]
+        if not croise:
+            chemin_autre.reverse()  # u -> w ... x -> v
+        fusion = chemin_petit + chemin_autre
+        sous_tours = [fusion] + [t for k, t in enumerate(sous_tours) if k not in (0, index_autre)]
+    return sous_tours[0]
+
+
+def croisement_eax(parent1, parent2, matrice):
+    """
+    Croisement de type Edge Assembly Crossover (EAX, stratégie à un seul cycle AB).
+    1. Les arêtes qui diffèrent entre les parents sont décomposées en cycles AB.
+    2. Un cycle AB tiré au hasard est appliqué à parent1 : ses arêtes A sont retirées,
+       ses arêtes B ajoutées, ce qui peut produire plusieurs sous-tours.
+    3. Les sous-tours sont fusionnés par la reconnexion la moins coûteuse.
+    Les arêtes sont traitées comme non orientées ; le coût final est évalué par l'algorithme.
+    """
+    taille = len(parent1)
+    if taille < 5:
+        return croisement_ox1(parent1, parent2)
+
+    adjacences1 = _adjacences(parent1)
+    adjacences2 = _adjacences(parent2)
+    cycles = _cycles_ab(adjacences1, adjacences2)
+    if not cycles:
+        return parent1[:]  # Parents identiques (au sens des arêtes)
+
+    # Appliquer un cycle AB à parent1
+    adjacences = [list(voisines) for voisines in adjacences1]
+    for u, v, vient_de_a in random.choice(cycles):
+        if vient_de_a:
+            adjacences[u].remove(v)
+            adjacences[v].remove(u)
+        else:
+            adjacences[u].append(v)
+            adjacences[v].append(u)
+
+    return _fusionner_sous_tours(_sous_tours(adjacences), matrice)
+
+
+# --- Sélection de l'Opérateur ---
+
+OPERATEURS_CROISEMENT = {
+    "ox1": croisement_ox1,
+    "pmx": croisement_pmx,
+    "erx": croisement_erx,
+    "eax": croisement_eax,
+}
+
+
+def obtenir_operateur_croisement(nom):
+    """
+    Retourne l'opérateur de croisement correspondant à son nom ("ox1", "pmx", "erx" ou "eax").
+    """
+    if nom not in OPERATEURS_CROISEMENT:
+        raise ValueError(f"Opérateur de croisement inconnu : {nom}")
+    return OPERATEURS_CROISEMENT[nom]
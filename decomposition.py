@@ -0,0 +1,320 @@
+# Fichier: decomposition.py
+
+import argparse
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from construction import GrilleSpatiale, courbe_remplissage, glouton
+from instances import TAILLE_BLOC, InstanceTSP, MatriceCoordonnees, k_plus_proches_par_blocs, creer_matrice
+from instrumentation import SANS_INSTRUMENTATION
+from recherche_locale import recherche_locale
+from service_lots import ALGORITHMES, resoudre
+
+# --- Décomposition des Très Grandes Instances (Diviser pour Régner) ---
+# Les quatre algorithmes travaillent sur le parcours complet et sur une matrice de n² distances :
+# au-delà de quelques milliers de villes, ni le temps ni la mémoire ne suffisent.
+# Pour 100 000 à 1 000 000 de villes (tournées de livraison), on procède en quatre étapes :
+# 1. Partition : les villes sont réparties en clusters d'environ 'taille_cluster' villes, par
+#    k-means (clusters compacts) ou le long de la courbe de Hilbert (plus rapide) ;
+# 2. Résolution : chaque cluster est résolu indépendamment, dans un pool de processus, par l'un
+#    des algorithmes existants (voir service_lots.resoudre), puis amélioré par 2-opt / Or-opt ;
+# 3. Assemblage : les clusters sont ordonnés par un parcours de leurs centres ; chaque cycle est
+#    coupé à l'arête qui le relie le mieux au cluster précédent et au suivant, puis les chemins
+#    obtenus sont mis bout à bout ;
+# 4. Réparation des coutures : une recherche locale 2-opt / Or-opt sur le parcours global, qui
+#    n'examine au départ que les villes proches des jonctions entre clusters.
+# Mémoire : chaque processus ne construit que la matrice de son cluster (taille_cluster²) ;
+# le processus principal n'a que des structures en O(n) (coordonnées, parcours, index spatial),
+# et les distances globales sont calculées à la volée (MatriceCoordonnees).
+
+TAILLE_MIN_RESOLUTION = 8  # En dessous, un cluster est seulement amélioré par recherche locale
+LARGEUR_COUTURE = 10  # Villes examinées de part et d'autre de chaque jonction lors de la réparation
+
+
+# --- Partition des Villes ---
+
+def _ordre_hilbert(points):
+    return np.asarray(courbe_remplissage(None, points), dtype=np.int64)
+
+
+def _decouper_hilbert(points, villes, taille_cluster):
+    """
+    Découpe les villes en morceaux consécutifs d'environ 'taille_cluster' villes le long de la courbe de Hilbert.
+    """
+    ordre = villes[_ordre_hilbert(points[villes])]
+    nombre = max(1, round(len(ordre) / taille_cluster))
+    return [morceau for morceau in np.array_split(ordre, nombre) if len(morceau)]
+
+
+def partition_courbe(points, taille_cluster):
+    """
+    Clusters de villes consécutives le long de la courbe de Hilbert : O(n log n), clusters de taille égale.
+    """
+    return _decouper_hilbert(points, np.arange(len(points)), taille_cluster)
+
+
+def partition_kmeans(points, taille_cluster, iterations_max=10, centres_candidats=8):
+    """
+    Clusters compacts par k-means (algorithme de Lloyd), avec k = n / taille_cluster.
+    Les centres sont initialisés sur les morceaux de la courbe de Hilbert. Chaque ville ne compare
+    que son centre actuel et les 'centres_candidats' centres les plus proches de celui-ci (et non les k),
+    par blocs vectorisés. Les clusters plus de deux fois trop grands sont redécoupés le long de la courbe.
+    """
+    nombre_villes = len(points)
+    nombre_clusters = max(1, math.ceil(nombre_villes / taille_cluster))
+    if nombre_clusters == 1:
+        return [np.arange(nombre_villes)]
+
+    # 1. Initialisation : un cluster par morceau de la courbe de Hilbert
+    affectation = np.empty(nombre_villes, dtype=np.int64)
+    affectation[_ordre_hilbert(points)] = np.arange(nombre_villes) * nombre_clusters // nombre_villes
+    centres = np.zeros((nombre_clusters, 2))
+
+    # 2. Itérations de Lloyd
+    taille_bloc = TAILLE_BLOC * 64
+    for _ in range(iterations_max):
+        effectifs = np.bincount(affectation, minlength=nombre_clusters)
+        non_vides = effectifs > 0  # Un cluster vidé garde son centre précédent
+        for axe in range(2):
+            sommes = np.bincount(affectation, weights=points[:, axe], minlength=nombre_clusters)
+            centres[non_vides, axe] = sommes[non_vides] / effectifs[non_vides]
+
+        voisins_centres = np.array(k_plus_proches_par_blocs(
+            lambda debut, fin: np.hypot(*(centres[debut:fin, None, :] - centres[None, :, :]).transpose(2, 0, 1)),
+            nombre_clusters, centres_candidats), dtype=np.int64)
+        candidats = np.concatenate([affectation[:, None], voisins_centres[affectation]], axis=1)
+        nouvelle = np.empty_like(affectation)
+        for debut in range(0, nombre_villes, taille_bloc):
+            bloc = candidats[debut:debut + taille_bloc]
+            ecarts = points[debut:debut + taille_bloc, None, :] - centres[bloc]
+            distances2 = (ecarts * ecarts).sum(axis=2)
+            nouvelle[debut:debut + taille_bloc] = bloc[np.arange(len(bloc)), distances2.argmin(axis=1)]
+
+        changements = np.count_nonzero(nouvelle != affectation)
+        affectation = nouvelle
+        if changements <= nombre_villes // 1000:
+            break
+
+    # 3. Clusters, en redécoupant ceux qui dépassent deux fois la taille visée
+    ordre = np.argsort(affectation, kind="stable")
+    bornes = np.cumsum(np.bincount(affectation, minlength=nombre_clusters))[:-1]
+    clusters = []
+    for cluster in np.split(ordre, bornes):
+        if len(cluster) > 2 * taille_cluster:
+            clusters.extend(_decouper_hilbert(points, cluster, taille_cluster))
+        elif len(cluster):
+            clusters.append(cluster)
+    return clusters
+
+
+PARTITIONS = {
+    "kmeans": partition_kmeans,
+    "courbe": partition_courbe,
+}
+
+
+# --- Résolution d'un Cluster (dans un processus du pool) ---
+
+def _resoudre_cluster(tache):
+    """
+    Résout un cluster (tâche au format de service_lots.resoudre) puis l'améliore par 2-opt / Or-opt.
+    Retourne le cycle obtenu, en indices locaux au cluster.
+    """
+    coordonnees = tache["coordonnees"]
+    matrice = creer_matrice(InstanceTSP(str(tache["id"]), tache["type_distance"], coordonnees=coordonnees), "liste")
+    if len(coordonnees) < TAILLE_MIN_RESOLUTION:
+        cycle = list(range(len(coordonnees)))
+    else:
+        resultat = resoudre(tache)
+        if resultat["statut"] != "ok":
+            raise RuntimeError(f"Échec de la résolution du cluster {tache['id']} : {resultat['erreur']}")
+        cycle = resultat["solution"]
+    return recherche_locale(cycle, matrice)[0]
+
+
+def _resoudre_clusters(taches, nombre_processus):
+    if nombre_processus == 1:
+        return [_resoudre_cluster(tache) for tache in taches]
+    with ProcessPoolExecutor(max_workers=nombre_processus) as pool:
+        return list(pool.map(_resoudre_cluster, taches))
+
+
+# --- Ordre des Clusters et Assemblage ---
+
+def _ordre_clusters(centres):
+    """
+    Ordre de visite des clusters : parcours glouton de leurs centres, amélioré par 2-opt / Or-opt.
+    """
+    if len(centres) <= 3:
+        return list(range(len(centres)))
+    matrice_centres = MatriceCoordonnees(centres, "EXACT_2D")
+    return recherche_locale(glouton(matrice_centres), matrice_centres)[0]
+
+
+def _assembler(points, cycles, ordre, centres):
+    """
+    Met bout à bout les cycles des clusters dans l'ordre 'ordre'. Chaque cycle est ouvert à l'arête (a, b)
+    qui minimise d(sortie du cluster précédent, entrée) + d(sortie, centre du cluster suivant) - d(a, b),
+    dans un sens ou dans l'autre (distances euclidiennes sur les coordonnées).
+    Retourne le parcours et les positions des jonctions entre clusters.
+    """
+    chemins = []
+    jonctions = []
+    precedent = centres[ordre[-1]]
+    position = 0
+    for rang, cluster in enumerate(ordre):
+        cycle = cycles[cluster]
+        suivant = centres[ordre[(rang + 1) % len(ordre)]]
+        if len(cycle) > 1:
+            a = points[cycle]
+            b = np.roll(a, -1, axis=0)  # Arête e : cycle[e] -> cycle[e + 1]
+            longueurs = np.hypot(*(a - b).T)
+            # Sens direct : entrée en cycle[e + 1], sortie en cycle[e] ; sens inverse : l'opposé
+            direct = np.hypot(*(b - precedent).T) + np.hypot(*(a - suivant).T) - longueurs
+            inverse = np.hypot(*(a - precedent).T) + np.hypot(*(b - suivant).T) - longueurs
+            e_direct, e_inverse = int(direct.argmin()), int(inverse.argmin())
+            if direct[e_direct] <= inverse[e_inverse]:
+                cycle = np.roll(cycle, -(e_direct + 1))
+            else:
+                cycle = np.roll(cycle, -(e_inverse + 1))[::-1]
+        chemins.append(cycle)
+        jonctions.append(position)
+        position += len(cycle)
+        precedent = points[cycle[-1]]
+    return np.concatenate(chemins), jonctions
+
+
+# --- Réparation des Coutures ---
+
+class _VoisinsGrille:
+    """
+    Listes de plus proches voisines calculées à la demande par la grille spatiale, puis conservées :
+    la réparation n'examine qu'une petite partie des villes, inutile de calculer les n listes.
+    """
+
+    def __init__(self, points, k):
+        self._points = points
+        self._grille = GrilleSpatiale(points)
+        self._k = k
+        self._listes = {}
+
+    def __getitem__(self, ville):
+        liste = self._listes.get(ville)
+        if liste is None:
+            x, y = self._points[ville]
+            liste = [autre for autre in self._grille.plus_proches(x, y, self._k + 1) if autre != ville][:self._k]
+            self._listes[ville] = liste
+        return liste
+
+
+def _villes_coutures(parcours, jonctions, largeur):
+    nombre_villes = len(parcours)
+    villes = []
+    for jonction in jonctions:
+        villes.extend(parcours[(jonction + decalage) % nombre_villes] for decalage in range(-largeur, largeur))
+    return villes
+
+
+def distance_parcours(parcours, matrice):
+    """
+    Longueur d'un parcours sur une MatriceCoordonnees, calculée de façon vectorisée.
+    """
+    parcours = np.asarray(parcours)
+    return matrice.distances_lot(parcours, np.roll(parcours, -1)).sum().item()
+
+
+# --- Algorithme Complet ---
+
+def resoudre_par_decomposition(coordonnees, type_distance="EUC_2D", algorithme="tabou", taille_cluster=200,
+                               partition="kmeans", parametres=None, duree_max_cluster=None, reparation="coutures",
+                               k_voisins=8, nombre_processus=None, graine=None, instrumentation=None):
+    """
+    Résout une très grande instance définie par ses coordonnées, par décomposition en clusters.
+    - 'algorithme' : l'algorithme appliqué à chaque cluster (voir service_lots.ALGORITHMES), avec
+      les 'parametres' donnés (par défaut, ceux de service_lots, proportionnés à la taille du cluster)
+      et, si 'duree_max_cluster' est fixée, une limite de temps par cluster (en secondes) ;
+    - 'partition' : "kmeans" ou "courbe" (voir PARTITIONS) ;
+    - 'reparation' : "coutures" (villes proches des jonctions), "complete" (toutes les villes) ou None ;
+    - 'nombre_processus' : taille du pool (par défaut, un par cœur ; 1 pour tout résoudre sur place) ;
+    - 'graine' : chaque cluster reçoit sa propre graine, dérivée de celle-ci.
+    'instrumentation' (optionnel) mesure la durée de chaque étape.
+    Retourne (meilleure_solution, meilleure_distance).
+    """
+    if algorithme not in ALGORITHMES:
+        raise ValueError(f"Algorithme inconnu : {algorithme}")
+    if partition not in PARTITIONS:
+        raise ValueError(f"Partition inconnue : {partition}")
+    if reparation not in ("coutures", "complete", None):
+        raise ValueError(f"Réparation inconnue : {reparation}")
+    if instrumentation is None:
+        instrumentation = SANS_INSTRUMENTATION
+    points = np.asarray(coordonnees, dtype=np.float64)
+    generateur = random.Random(graine)
+
+    # 1. Partition
+    with instrumentation.phase("partition"):
+        clusters = PARTITIONS[partition](points, taille_cluster)
+        centres = np.array([points[cluster].mean(axis=0) for cluster in clusters])
+    instrumentation.compter("clusters", len(clusters))
+
+    # 2. Résolution des clusters en parallèle (seules les coordonnées du cluster sont transmises)
+    with instrumentation.phase("resolution_clusters"):
+        taches = [{"id": indice, "algorithme": algorithme, "coordonnees": points[cluster].tolist(),
+                   "type_distance": type_distance, "parametres": dict(parametres or {}),
+                   "duree_max": duree_max_cluster, "graine": generateur.getrandbits(64)}
+                  for indice, cluster in enumerate(clusters)]
+        cycles = [cluster[cycle] for cluster, cycle in zip(clusters, _resoudre_clusters(taches, nombre_processus))]
+
+    # 3. Ordre des clusters et assemblage
+    with instrumentation.phase("assemblage"):
+        ordre = _ordre_clusters(centres)
+        parcours, jonctions = _assembler(points, cycles, ordre, centres)
+        parcours = parcours.tolist()
+
+    # 4. Réparation des coutures, sur les distances calculées à la volée
+    matrice = MatriceCoordonnees(points, type_distance)
+    if reparation is not None and len(parcours) >= 5:
+        with instrumentation.phase("reparation"):
+            villes = None if reparation == "complete" else _villes_coutures(parcours, jonctions, LARGEUR_COUTURE)
+            parcours, _ = recherche_locale(parcours, matrice, _VoisinsGrille(points.tolist(), k_voisins),
+                                           symetrique=True, structure="deux_niveaux", villes_a_examiner=villes)
+    return parcours, distance_parcours(parcours, matrice)
+
+
+# --- Bloc d'Exécution ---
+
+def analyser_arguments(arguments=None):
+    parseur = argparse.ArgumentParser(description="Résolution d'une très grande instance du TSP par décomposition.")
+    parseur.add_argument("--tsp", default=None, help="Instance TSPLIB (.tsp) à coordonnées")
+    parseur.add_argument("--villes", type=int, default=20000, help="Sans --tsp : nombre de villes aléatoires")
+    parseur.add_argument("--algorithme", default="tabou", choices=sorted(ALGORITHMES))
+    parseur.add_argument("--taille-cluster", type=int, default=200)
+    parseur.add_argument("--partition", default="kmeans", choices=sorted(PARTITIONS))
+    parseur.add_argument("--duree-max-cluster", type=float, default=None, help="Limite de temps par cluster (s)")
+    parseur.add_argument("--processus", type=int, default=None, help="Nombre de processus (par défaut : un par cœur)")
+    parseur.add_argument("--graine", type=int, default=0)
+    return parseur.parse_args(arguments)
+
+
+if __name__ == "__main__":
+    from instances import lire_tsplib
+
+    arguments = analyser_arguments()
+    if arguments.tsp is not None:
+        instance = lire_tsplib(arguments.tsp)
+        coordonnees, type_distance = instance.coordonnees, instance.type_distance
+    else:
+        rng = random.Random(arguments.graine)
+        coordonnees = [(rng.uniform(0, 100000), rng.uniform(0, 100000)) for _ in range(arguments.villes)]
+        type_distance = "EUC_2D"
+
+    debut = time.perf_counter()
+    solution, distance = resoudre_par_decomposition(
+        coordonnees, type_distance, arguments.algorithme, arguments.taille_cluster, arguments.partition,
+        duree_max_cluster=arguments.duree_max_cluster, nombre_processus=arguments.processus, graine=arguments.graine
+    )
+    print(f"{len(solution)} villes, distance {distance} en {time.perf_counter() - debut:.1f} s")
@@ -0,0 +1,297 @@
+# Fichier: diversite.py
+
+import itertools
+import math
+import random
+
+import numpy as np
+
+from recherche_locale import est_symetrique, tirer_or_opt, appliquer_or_opt
+from construction import population_initiale
+
+# --- Diversité de la Population d'un Algorithme Génétique ---
+# Avec un faible taux de mutation et de l'élitisme, la population d'un algorithme génétique se réduit
+# vite à quelques parcours recopiés : chaque génération réévalue et recroise les mêmes individus.
+# Un objet DiversitePopulation, passé en paramètre 'diversite' à l'algorithme génétique, ajoute :
+# - un hachage de Zobrist des parcours : la clé d'un parcours est le ou-exclusif des valeurs de ses arêtes,
+#   donc la même pour toutes ses rotations (et ses deux sens si la matrice est symétrique), et mise à jour
+#   en O(1) par mouvement (les arêtes retirées et ajoutées sont "xorées"). Une table aléatoire par arête
+#   coûterait O(n²) en mémoire : la valeur d'une arête est dérivée de deux valeurs aléatoires par ville,
+#   mélangées par le finaliseur de splitmix64 ;
+# - le rejet des doublons : un enfant dont la clé est déjà dans la nouvelle population est perturbé
+#   par des déplacements Or-opt aléatoires jusqu'à devenir nouveau ;
+# - des mesures de diversité à chaque génération : nombre de parcours distincts et entropie des arêtes
+#   (normalisée : 0 pour une population de copies, 1 si aucune arête n'est partagée) ;
+# - une immigration : quand l'entropie passe sous un seuil, une part des enfants est remplacée par
+#   de nouveaux parcours (aléatoires ou construits, voir construction.py).
+
+MASQUE_64 = (1 << 64) - 1
+
+
+def _melanger(valeur):
+    """
+    Finaliseur de splitmix64 : mélange les bits d'un entier de 64 bits.
+    """
+    valeur = ((valeur ^ (valeur >> 30)) * 0xBF58476D1CE4E5B9) & MASQUE_64
+    valeur = ((valeur ^ (valeur >> 27)) * 0x94D049BB133111EB) & MASQUE_64
+    return valeur ^ (valeur >> 31)
+
+
+def _melanger_lot(valeurs):
+    """
+    Même mélange que _melanger, sur un tableau NumPy d'entiers non signés de 64 bits.
+    """
+    valeurs = (valeurs ^ (valeurs >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    valeurs = (valeurs ^ (valeurs >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return valeurs ^ (valeurs >> np.uint64(31))
+
+
+def _aretes_deplacement(solution, i, longueur, j):
+    """
+    Arêtes orientées (retirées, ajoutées) par le déplacement Or-opt (i, longueur, j) (voir recherche_locale.py).
+    """
+    n = len(solution)
+    premiere, derniere = solution[i], solution[(i + longueur - 1) % n]
+    precedente, suivante = solution[(i - 1) % n], solution[(i + longueur) % n]
+    c, e = solution[j], solution[(j + 1) % n]
+    return (((precedente, premiere), (derniere, suivante), (c, e)),
+            ((precedente, suivante), (c, premiere), (derniere, e)))
+
+
+class HachageZobrist:
+    """
+    Clés de 64 bits des parcours, invariantes par rotation (et par inversion si 'symetrique').
+    """
+
+    def __init__(self, nombre_villes, symetrique=True, graine=0):
+        rng = random.Random(graine)
+        self.symetrique = symetrique
+        self.depart = [rng.getrandbits(64) for _ in range(nombre_villes)]
+        self.arrivee = [rng.getrandbits(64) for _ in range(nombre_villes)]
+        self._depart_lot = np.array(self.depart, dtype=np.uint64)
+        self._arrivee_lot = np.array(self.arrivee, dtype=np.uint64)
+
+    def arete(self, ville_a, ville_b):
+        if self.symetrique and ville_a > ville_b:
+            ville_a, ville_b = ville_b, ville_a
+        return _melanger(self.depart[ville_a] ^ self.arrivee[ville_b])
+
+    def cle(self, solution):
+        cle = 0
+        precedente = solution[-1]
+        for ville in solution:
+            cle ^= self.arete(precedente, ville)
+            precedente = ville
+        return cle
+
+    def actualiser(self, cle, retirees, ajoutees):
+        """
+        Clé du parcours après un mouvement qui retire les arêtes 'retirees' et ajoute les arêtes 'ajoutees'.
+        """
+        for ville_a, ville_b in retirees:
+            cle ^= self.arete(ville_a, ville_b)
+        for ville_a, ville_b in ajoutees:
+            cle ^= self.arete(ville_a, ville_b)
+        return cle
+
+    def cles_lot(self, population):
+        """
+        Clés de tous les individus d'une population (liste de parcours ou tableau NumPy, une ligne par individu),
+        calculées en lot : tableau de np.uint64, mêmes valeurs que cle.
+        """
+        nombre_villes = len(self.depart)
+        if isinstance(population, list):
+            # Une liste de parcours est mise à plat sans passer par des lignes intermédiaires (conversion plus rapide)
+            population = np.fromiter(itertools.chain.from_iterable(population), dtype=np.int64,
+                                     count=len(population) * nombre_villes)
+        population = np.asarray(population, dtype=np.int64).reshape(-1, nombre_villes)
+        depart, arrivee = population, np.roll(population, -1, axis=1)
+        if self.symetrique:
+            depart, arrivee = np.minimum(depart, arrivee), np.maximum(depart, arrivee)
+        valeurs = _melanger_lot(self._depart_lot[depart] ^ self._arrivee_lot[arrivee])
+        return np.bitwise_xor.reduce(valeurs, axis=1)
+
+
+def entropie_aretes(population, symetrique=True):
+    """
+    Entropie de la fréquence des arêtes dans la population, divisée par son maximum n * log(taille_population) :
+    0 si tous les individus sont identiques, 1 si aucune arête n'apparaît deux fois.
+    Accepte une liste de parcours ou un tableau NumPy (une ligne par individu).
+    """
+    taille_population = len(population)
+    if taille_population < 2:
+        return 0.0
+    population = np.asarray(population, dtype=np.int64)
+    nombre_villes = population.shape[1]
+    depart, arrivee = population, np.roll(population, -1, axis=1)
+    if symetrique:
+        depart, arrivee = np.minimum(depart, arrivee), np.maximum(depart, arrivee)
+    # Chaque arête (a, b) est codée par l'entier a * n + b
+    _, frequences = np.unique(depart * nombre_villes + arrivee, return_counts=True)
+    proportions = frequences / taille_population
+    entropie = float(np.sum(proportions * np.log(1 / proportions)))
+    return entropie / (nombre_villes * math.log(taille_population))
+
+
+class DiversitePopulation:
+    """
+    Réglages et mesures de diversité d'un algorithme génétique.
+    - 'rejeter_doublons' : perturber les enfants déjà présents dans la nouvelle population ;
+    - 'tentatives_max' : nombre maximal de déplacements Or-opt tentés pour rendre un doublon nouveau ;
+    - 'seuil_entropie' : entropie des arêtes sous laquelle une immigration est déclenchée (0 : jamais) ;
+    - 'part_immigration' : part des enfants remplacés par des immigrants ;
+    - 'periode_min' : nombre minimal de générations entre deux immigrations ;
+    - 'part_construite' : part des immigrants construits par heuristiques (voir construction.population_initiale) ;
+    - 'graine' : graine des valeurs de Zobrist.
+    Après l'exécution, 'historique' contient les mesures de chaque génération ; etat et restaurer les transmettent,
+    avec les compteurs, au point de reprise de l'algorithme génétique (voir reprise.py).
+    """
+
+    def __init__(self, rejeter_doublons=True, tentatives_max=5, seuil_entropie=0.1, part_immigration=0.5,
+                 periode_min=10, part_construite=0.0, graine=0):
+        self.rejeter_doublons = rejeter_doublons
+        self.tentatives_max = tentatives_max
+        self.seuil_entropie = seuil_entropie
+        self.part_immigration = part_immigration
+        self.periode_min = periode_min
+        self.part_construite = part_construite
+        self.graine = graine
+
+    def demarrer(self, matrice):
+        """
+        (Ré)initialise les clés et les mesures ; appelée par l'algorithme génétique au début de l'exécution.
+        """
+        self.matrice = matrice
+        self.symetrique = est_symetrique(matrice)
+        self.hachage = HachageZobrist(len(matrice), self.symetrique, self.graine)
+        self.historique = []
+        self._derniere_immigration = 0
+        self.doublons_rejetes = 0
+        self.doublons_conserves = 0
+        self.immigrants_introduits = 0
+        self.immigrations = 0
+
+    def cle(self, solution):
+        return self.hachage.cle(solution)
+
+    def cles_lot(self, population):
+        return self.hachage.cles_lot(population)
+
+    # --- Rejet des Doublons ---
+
+    def inserer(self, solution, cle, cles, rng=random):
+        """
+        Ajoute la clé d'un enfant à 'cles' (ensemble des clés de la nouvelle population) et retourne (solution, cle).
+        Si l'enfant est un doublon, une copie en est perturbée par des déplacements Or-opt aléatoires,
+        dont la clé est mise à jour en O(1), jusqu'à obtenir un parcours absent de 'cles'.
+        """
+        if self.rejeter_doublons and cle in cles and len(solution) >= 5:
+            self.doublons_rejetes += 1
+            solution = list(solution)
+            for _ in range(self.tentatives_max):
+                i, longueur, j = tirer_or_opt(len(solution), rng)
+                retirees, ajoutees = _aretes_deplacement(solution, i, longueur, j)
+                appliquer_or_opt(solution, i, longueur, j)
+                cle = self.hachage.actualiser(cle, retirees, ajoutees)
+                if cle not in cles:
+                    break
+            else:
+                self.doublons_conserves += 1
+        cles.add(cle)
+        return solution, cle
+
+    # --- Mesures et Immigration ---
+
+    def mesurer(self, generation, population, cles):
+        """
+        Mesure la diversité de la population évaluée à la génération 'generation' et l'ajoute à l'historique.
+        """
+        mesure = {"generation": generation, "parcours_uniques": len(np.unique(cles)),
+                  "entropie_aretes": entropie_aretes(population, self.symetrique)}
+        self.historique.append(mesure)
+        return mesure
+
+    def doit_immigrer(self, generation, mesure):
+        """
+        Indique si une immigration doit avoir lieu : entropie sous le seuil et au moins
+        'periode_min' générations depuis la précédente.
+        """
+        if self.seuil_entropie <= 0 or self.part_immigration <= 0:
+            return False
+        if mesure["entropie_aretes"] >= self.seuil_entropie:
+            return False
+        if generation - self._derniere_immigration < self.periode_min:
+            return False
+        self._derniere_immigration = generation
+        self.immigrations += 1
+        return True
+
+    def immigrants(self, nombre_enfants, rng=random):
+        """
+        Nouveaux parcours qui remplacent 'part_immigration' des 'nombre_enfants' enfants.
+        """
+        nombre = min(nombre_enfants, max(1, round(self.part_immigration * nombre_enfants)))
+        self.immigrants_introduits += nombre
+        return population_initiale(self.matrice, nombre, self.part_construite, rng)
+
+    def renouveler(self, generation, mesure, cles_elite, enfants, rng=random):
+        """
+        Remplacement de génération : chaque enfant dont la clé est celle d'une élite ou d'un enfant précédent
+        est perturbé (voir inserer) ; puis, si doit_immigrer, les derniers enfants sont remplacés par des immigrants.
+        'enfants' est une liste de parcours (copiée) ou un tableau NumPy (modifié sur place).
+        Retourne (enfants, clés de la nouvelle population : élites puis enfants).
+        """
+        liste = not hasattr(enfants, "shape")
+        enfants = np.array(enfants, dtype=np.int64).reshape(-1, len(self.matrice)) if liste else enfants
+        nombre_enfants = len(enfants)
+        cles_enfants = self.cles_lot(enfants)
+        if self.rejeter_doublons:
+            cles_presentes = set(cles_elite.tolist())
+            for k in range(nombre_enfants):
+                cle = cles_enfants[k].item()
+                enfant, nouvelle_cle = self.inserer(enfants[k], cle, cles_presentes, rng)
+                if nouvelle_cle != cle:
+                    enfants[k] = enfant
+                    cles_enfants[k] = nouvelle_cle
+        if nombre_enfants > 0 and self.doit_immigrer(generation, mesure):
+            immigrants = self.immigrants(nombre_enfants, rng)
+            enfants[nombre_enfants - len(immigrants):] = immigrants
+            cles_enfants[nombre_enfants - len(immigrants):] = self.cles_lot(immigrants)
+        cles = np.concatenate((cles_elite, cles_enfants))
+        return (enfants.tolist() if liste else enfants), cles
+
+    # --- Point de Reprise ---
+
+    def etat(self):
+        """
+        État interne à sauvegarder avec un point de reprise (nombres et tableaux uniquement) :
+        compteurs, génération de la dernière immigration et historique des mesures.
+        """
+        return {"derniere_immigration": self._derniere_immigration, "doublons_rejetes": self.doublons_rejetes,
+                "doublons_conserves": self.doublons_conserves, "immigrants_introduits": self.immigrants_introduits,
+                "immigrations": self.immigrations,
+                "historique_generation": np.array([m["generation"] for m in self.historique], dtype=np.int64),
+                "historique_parcours_uniques": np.array([m["parcours_uniques"] for m in self.historique],
+                                                        dtype=np.int64),
+                "historique_entropie": np.array([m["entropie_aretes"] for m in self.historique], dtype=np.float64)}
+
+    def restaurer(self, etat):
+        """
+        Restaure l'état écrit par etat ; appelée après demarrer lors d'une reprise.
+        """
+        self._derniere_immigration = int(etat["derniere_immigration"])
+        self.doublons_rejetes = int(etat["doublons_rejetes"])
+        self.doublons_conserves = int(etat["doublons_conserves"])
+        self.immigrants_introduits = int(etat["immigrants_introduits"])
+        self.immigrations = int(etat["immigrations"])
+        self.historique = [{"generation": generation, "parcours_uniques": uniques, "entropie_aretes": entropie}
+                           for generation, uniques, entropie in zip(etat["historique_generation"].tolist(),
+                                                                    etat["historique_parcours_uniques"].tolist(),
+                                                                    etat["historique_entropie"].tolist())]
+
+    def rapport(self):
+        derniere = self.historique[-1] if self.historique else {}
+        return {"doublons_rejetes": self.doublons_rejetes, "doublons_conserves": self.doublons_conserves,
+                "immigrations": self.immigrations, "immigrants": self.immigrants_introduits,
+                "parcours_uniques": derniere.get("parcours_uniques"),
+                "entropie_aretes": derniere.get("entropie_aretes")}
@@ -0,0 +1,275 @@
+# Fichier: exact.py
+
+import math
+
+import numpy as np
+
+from mouvements import calculer_distance_totale
+
+# --- Résolution Exacte et Bornes Inférieures ---
+# Les métaheuristiques ne disent pas à quelle distance de l'optimum se trouve leur résultat.
+# Ce module fournit :
+# - held_karp : la programmation dynamique de Held et Karp sur les sous-ensembles de villes,
+#   vectorisée avec NumPy (une couche de sous-ensembles de même taille à la fois) :
+#   O(2^n n²) opérations et O(2^n n) mémoire, soit une solution exacte jusqu'à environ 20 villes
+#   (matrices symétriques ou non). La même programmation dynamique, sur un chemin aux extrémités
+#   fixées, réoptimise exactement des fenêtres d'un parcours (ameliorer_par_fenetres) ;
+# - borne_un_arbre : la borne de Held et Karp par 1-arbres (arbre couvrant minimal des villes
+#   1..n-1, plus les deux arêtes les moins chères de la ville 0), resserrée par optimisation
+#   sous-gradient des pénalités de villes. Elle est en général à 1 ou 2 % de l'optimum.
+#   Pour une matrice asymétrique, elle est calculée sur min(d(i, j), d(j, i)) ;
+# - borne_inferieure : l'optimum exact pour les petites instances, la borne par 1-arbres au-delà.
+# Une borne passée à un CriteresArret (voir arret.py) donne l'écart d'optimalité de n'importe quel
+# algorithme et l'arrête dès que sa meilleure distance atteint la borne (optimum prouvé).
+
+VILLES_MAX_HELD_KARP = 23  # 2^22 sous-ensembles x 22 villes : environ 750 Mo de tableaux
+VILLES_MAX_BORNE_EXACTE = 15  # Jusque-là, la borne inférieure est l'optimum (Held-Karp en moins d'une seconde)
+
+
+def _tableau(matrice):
+    """
+    Matrice des distances sous forme de tableau NumPy (n x n) en double précision.
+    """
+    if hasattr(matrice, "tableau"):
+        return np.asarray(matrice.tableau, dtype=np.float64)
+    return np.array([np.asarray(ligne, dtype=np.float64) for ligne in matrice]).reshape(len(matrice), len(matrice))
+
+
+def _entiere(matrice, tableau):
+    if hasattr(matrice, "tableau"):
+        return np.issubdtype(matrice.tableau.dtype, np.integer)
+    return bool(np.array_equal(tableau, np.round(tableau)))
+
+
+def ecart_optimalite(distance, borne):
+    """
+    Écart relatif (distance - borne) / borne : l'optimum est au plus à cet écart de 'distance'.
+    """
+    if borne <= 0:
+        return 0.0 if distance <= borne else float('inf')
+    return max(0.0, (distance - borne) / borne)
+
+
+# --- Programmation Dynamique de Held et Karp ---
+
+def _programmation_dynamique(distances, retour):
+    """
+    Plus court chemin partant de la ville 0 de 'distances' ((m+1) x (m+1)), passant une fois par chacune
+    des villes 1..m et se terminant par le coût 'retour[j]' depuis la dernière ville j (tableau de m coûts).
+    La ville j est le bit j-1 des sous-ensembles. cout[S, j] : plus court chemin depuis 0 qui visite
+    exactement S et se termine en j. Les sous-ensembles sont traités couche par couche (même nombre de villes) :
+    pour chaque ville finale j, toute la couche est calculée en une opération vectorisée.
+    Retourne (longueur, ordre des villes 1..m).
+    """
+    m = len(distances) - 1
+    taille = 1 << m
+    internes = distances[1:, 1:]
+    cout = np.full((taille, m), np.inf)
+    parent = np.zeros((taille, m), dtype=np.int8)
+    cout[1 << np.arange(m), np.arange(m)] = distances[0, 1:]
+
+    sous_ensembles = np.arange(taille)
+    cardinaux = np.zeros(taille, dtype=np.int8)
+    for bit in range(m):
+        cardinaux += ((sous_ensembles >> bit) & 1).astype(np.int8)
+    ordre = np.argsort(cardinaux, kind="stable")
+    debuts = np.searchsorted(cardinaux[ordre], np.arange(m + 2))
+
+    for cardinal in range(2, m + 1):
+        couche = ordre[debuts[cardinal]:debuts[cardinal + 1]]
+        for j in range(m):
+            avec_j = couche[(couche >> j) & 1 == 1]
+            # cout[S - {j}, k] est infini pour k hors de S - {j} : le minimum ne retient que les k valides
+            candidats = cout[avec_j ^ (1 << j)] + internes[:, j]
+            meilleurs = candidats.argmin(axis=1)
+            cout[avec_j, j] = candidats[np.arange(len(avec_j)), meilleurs]
+            parent[avec_j, j] = meilleurs
+
+    # Fermeture, puis reconstruction du chemin depuis la fin
+    complet = taille - 1
+    totaux = cout[complet] + retour
+    derniere = int(totaux.argmin())
+    chemin = []
+    sous_ensemble = complet
+    while sous_ensemble:
+        chemin.append(derniere + 1)
+        precedente = int(parent[sous_ensemble, derniere])
+        sous_ensemble ^= 1 << derniere
+        derniere = precedente
+    return float(totaux.min()), chemin[::-1]
+
+
+def held_karp(matrice):
+    """
+    Parcours optimal par programmation dynamique (Held-Karp), pour au plus VILLES_MAX_HELD_KARP villes.
+    Retourne (solution, distance), comme les algorithmes approchés ; la solution commence par la ville 0.
+    """
+    nombre_villes = len(matrice)
+    if nombre_villes > VILLES_MAX_HELD_KARP:
+        raise ValueError(f"Held-Karp est limité à {VILLES_MAX_HELD_KARP} villes ({nombre_villes} demandées)")
+    if nombre_villes <= 2:
+        solution = list(range(nombre_villes))
+    else:
+        distances = _tableau(matrice)
+        _, chemin = _programmation_dynamique(distances, distances[1:, 0])
+        solution = [0] + chemin
+    return solution, calculer_distance_totale(solution, matrice)
+
+
+def ameliorer_par_fenetres(solution, matrice, largeur=10, pas=None):
+    """
+    Réoptimise exactement des fenêtres du parcours : pour chaque fenêtre de 'largeur' villes consécutives,
+    les extrémités qui l'encadrent restent fixes et Held-Karp donne le meilleur ordre des villes internes.
+    Les fenêtres avancent de 'pas' positions (par défaut, la moitié de la largeur) et se chevauchent.
+    Retourne (solution_amelioree, distance) ; la solution d'entrée n'est pas modifiée.
+    """
+    parcours = list(solution)
+    nombre_villes = len(parcours)
+    largeur = min(largeur, nombre_villes - 2, VILLES_MAX_HELD_KARP - 1)
+    pas = pas or max(1, largeur // 2)
+    if largeur >= 2:
+        for debut in range(0, nombre_villes, pas):
+            # Villes de la fenêtre, encadrées par leurs deux extrémités fixes
+            positions = [(debut + decalage) % nombre_villes for decalage in range(largeur + 2)]
+            villes = [parcours[position] for position in positions]
+            distances = np.array([[matrice[a][b] for b in villes[:-1]] for a in villes[:-1]], dtype=np.float64)
+            retour = np.array([matrice[ville][villes[-1]] for ville in villes[1:-1]], dtype=np.float64)
+            actuelle = sum(matrice[villes[k]][villes[k + 1]] for k in range(largeur + 1))
+            longueur, chemin = _programmation_dynamique(distances, retour)
+            if longueur < actuelle - 1e-9:
+                for position, indice in zip(positions[1:-1], chemin):
+                    parcours[position] = villes[indice]
+    return parcours, calculer_distance_totale(parcours, matrice)
+
+
+# --- Borne Inférieure par 1-Arbres (Held-Karp) ---
+
+def _un_arbre(couts):
+    """
+    1-arbre minimal : arbre couvrant minimal (Prim, vectorisé) des villes 1..n-1, plus les deux arêtes
+    les moins chères de la ville 0. Retourne (longueur, degré de chaque ville).
+    """
+    nombre_villes = len(couts)
+    degres = np.zeros(nombre_villes, dtype=np.int64)
+    dans_arbre = np.zeros(nombre_villes, dtype=bool)
+    dans_arbre[:2] = True
+    meilleurs = couts[1].copy()
+    meilleurs[:2] = np.inf
+    peres = np.ones(nombre_villes, dtype=np.int64)
+    longueur = 0.0
+    for _ in range(nombre_villes - 2):
+        ville = int(meilleurs.argmin())
+        longueur += meilleurs[ville]
+        degres[ville] += 1
+        degres[peres[ville]] += 1
+        dans_arbre[ville] = True
+        meilleurs[ville] = np.inf
+        plus_proches = (couts[ville] < meilleurs) & ~dans_arbre
+        meilleurs[plus_proches] = couts[ville][plus_proches]
+        peres[plus_proches] = ville
+    deux = np.argpartition(couts[0, 1:], 1)[:2] + 1
+    longueur += couts[0, deux].sum()
+    degres[0] = 2
+    degres[deux] += 1
+    return longueur, degres
+
+
+def _plus_proche_voisin(distances):
+    """
+    Longueur du parcours du plus proche voisin depuis la ville 0 (borne supérieure pour le sous-gradient).
+    """
+    nombre_villes = len(distances)
+    visitees = np.zeros(nombre_villes, dtype=bool)
+    ville = 0
+    longueur = 0.0
+    for _ in range(nombre_villes - 1):
+        visitees[ville] = True
+        suivante = int(np.where(visitees, np.inf, distances[ville]).argmin())
+        longueur += distances[ville, suivante]
+        ville = suivante
+    return longueur + distances[ville, 0]
+
+
+def borne_un_arbre(matrice, iterations_max=1000, borne_superieure=None, pas_initial=2.0, periode=10):
+    """
+    Borne inférieure de Held-Karp : maximum, sur les pénalités pi, de
+    L(1-arbre des coûts d(i, j) + pi_i + pi_j) - 2 Σ pi.
+    Optimisation sous-gradient : pi_i augmente avec l'excès de degré (deg_i - 2) de la ville i, d'un pas
+    pas * (borne_superieure - borne) / ||deg - 2||², le pas étant divisé par deux après 'periode' itérations
+    sans progrès (une période courte converge plus vite, vers la même borne, qu'une période en O(n)).
+    'borne_superieure' : longueur d'un parcours connu (par défaut, celui du plus proche voisin).
+    Si le 1-arbre devient un parcours, ou si la borne atteint la borne supérieure, la borne est l'optimum.
+    Pour des distances entières, la borne est arrondie à l'entier supérieur.
+    Mémoire et temps en O(n²) par itération : quelques milliers de villes au plus.
+    """
+    nombre_villes = len(matrice)
+    distances = _tableau(matrice)
+    entiere = _entiere(matrice, distances)
+    if nombre_villes <= 3:
+        return held_karp(matrice)[1]
+    distances = np.minimum(distances, distances.T)  # Sans effet si la matrice est symétrique
+    if borne_superieure is None:
+        borne_superieure = _plus_proche_voisin(distances)
+
+    penalites = np.zeros(nombre_villes)
+    meilleure = -np.inf
+    pas = pas_initial
+    sans_progres = 0
+    for _ in range(iterations_max):
+        longueur, degres = _un_arbre(distances + penalites[:, None] + penalites[None, :])
+        borne = longueur - 2 * penalites.sum()
+        if borne > meilleure + 1e-12:
+            meilleure = borne
+            sans_progres = 0
+        else:
+            sans_progres += 1
+            if sans_progres >= periode:
+                pas /= 2
+                sans_progres = 0
+        sous_gradient = degres - 2
+        norme = int(sous_gradient @ sous_gradient)
+        if norme == 0 or borne_superieure - meilleure <= 1e-9 or pas < 1e-6:
+            break
+        penalites += pas * (borne_superieure - borne) / norme * sous_gradient
+
+    if entiere:
+        return math.ceil(meilleure - 1e-6)
+    return meilleure * (1 - 1e-12)  # Marge pour les arrondis du calcul en flottants
+
+
+def borne_inferieure(matrice, **options):
+    """
+    Borne inférieure de la distance optimale : l'optimum lui-même jusqu'à VILLES_MAX_BORNE_EXACTE villes
+    (Held-Karp), la borne par 1-arbres au-delà ('options' sont transmises à borne_un_arbre).
+    """
+    if len(matrice) <= VILLES_MAX_BORNE_EXACTE:
+        return held_karp(matrice)[1]
+    return borne_un_arbre(matrice, **options)
+
+
+# --- Bloc d'Exécution ---
+
+if __name__ == "__main__":
+    from algorithme_recuit_simulé import matrice_distances, recuit_simule
+    from algorithme_tabou import tabu_search
+    from algorithme_genetique_rang import algorithme_genetique
+    from arret import CriteresArret
+
+    solution, distance = held_karp(matrice_distances)
+    print(f"Solution optimale (Held-Karp): {solution}")
+    print(f"Distance optimale: {distance}")
+    print(f"Borne par 1-arbres (matrice symétrisée): {borne_un_arbre(matrice_distances)}")
+
+    # Les algorithmes approchés s'arrêtent dès qu'ils atteignent l'optimum prouvé
+    executions = {
+        "Recuit Simulé": lambda arret: recuit_simule(matrice_distances, 10000, 0.9995, 100000, arret=arret),
+        "Recherche Tabou": lambda arret: tabu_search(matrice_distances, 1000, 50, arret=arret),
+        "Génétique (Rang)": lambda arret: algorithme_genetique(matrice_distances, 100, 500, 0.8, 0.02, 5,
+                                                               arret=arret),
+    }
+    for nom, executer in executions.items():
+        arret = CriteresArret(borne_inferieure=distance, intervalle_verification=100)
+        _, distance_trouvee = executer(arret)
+        rapport = arret.rapport()
+        print(f"{nom}: distance {distance_trouvee}, écart {100 * ecart_optimalite(distance_trouvee, distance):.1f} %, "
+              f"arrêt '{rapport['critere']}' à l'étape {rapport['etape']}")
@@ -0,0 +1,405 @@
+# Fichier: instances.py
+
+import math
+
+import numpy as np
+
+# --- Instances du Problème et Stockage des Distances ---
+# Les algorithmes n'utilisent la matrice que par len(matrice) et matrice[i][j].
+# Ce module fournit, en plus des listes de listes, trois façons de stocker les distances
+# qui respectent cette interface :
+# - MatriceCompacte : un tableau NumPy contigu en float32 / int32 (4 octets par distance) ;
+# - MatriceMemmap : le même tableau, mais projeté depuis un fichier sur disque (np.memmap) ;
+# - MatriceCoordonnees : aucune matrice stockée, les distances sont calculées à la volée
+#   depuis les coordonnées des villes (mémoire en O(n)).
+# Chaque ligne est exposée comme une memoryview : matrice[i][j] retourne un nombre Python,
+# ce qui évite les scalaires NumPy (lents, et en simple précision) dans les boucles des algorithmes.
+# Les instances peuvent être lues au format TSPLIB (.tsp).
+
+TAILLE_BLOC = 512  # Nombre de lignes calculées à la fois lors de la construction d'une matrice
+PI = 3.141592  # Valeur de pi fixée par TSPLIB pour les distances GEO (math.pi décale certains arrondis)
+
+
+# --- Fonctions de Distance TSPLIB ---
+
+def _nint(x):
+    """
+    Arrondi à l'entier le plus proche, comme défini par TSPLIB.
+    """
+    return np.floor(x + 0.5)
+
+
+def _latitude_longitude_geo(coordonnees):
+    """
+    Convertit des coordonnées GEO (DDD.MM : degrés et minutes) en radians.
+    """
+    degres = np.trunc(coordonnees)
+    minutes = coordonnees - degres
+    return PI * (degres + 5.0 * minutes / 3.0) / 180.0
+
+
+def distances_coordonnees(type_distance, depart, arrivee):
+    """
+    Calcule, de façon vectorisée, les distances entre les points 'depart' et 'arrivee'
+    (tableaux de forme (..., 2) diffusables l'un contre l'autre).
+    - "EUC_2D" : distance euclidienne arrondie à l'entier le plus proche ;
+    - "CEIL_2D" : distance euclidienne arrondie à l'entier supérieur ;
+    - "ATT" : distance pseudo-euclidienne ;
+    - "GEO" : distance géographique (en km, sur la sphère terrestre) ;
+    - "EXACT_2D" : distance euclidienne sans arrondi (instances générées).
+    """
+    if type_distance == "GEO":
+        depart = _latitude_longitude_geo(depart)
+        arrivee = _latitude_longitude_geo(arrivee)
+        q1 = np.cos(depart[..., 1] - arrivee[..., 1])
+        q2 = np.cos(depart[..., 0] - arrivee[..., 0])
+        q3 = np.cos(depart[..., 0] + arrivee[..., 0])
+        cosinus = np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0)
+        distances = np.floor(6378.388 * np.arccos(cosinus) + 1.0)
+        # La distance d'une ville à elle-même est nulle
+        return np.where(np.all(depart == arrivee, axis=-1), 0.0, distances)
+
+    ecart = depart - arrivee
+    carres = (ecart * ecart).sum(axis=-1)
+    if type_distance == "EUC_2D":
+        return _nint(np.sqrt(carres))
+    if type_distance == "CEIL_2D":
+        return np.ceil(np.sqrt(carres))
+    if type_distance == "ATT":
+        r = np.sqrt(carres / 10.0)
+        t = _nint(r)
+        return np.where(t < r, t + 1.0, t)
+    if type_distance == "EXACT_2D":
+        return np.sqrt(carres)
+    raise ValueError(f"Type de distance non pris en charge : {type_distance}")
+
+
+def type_stockage(type_distance):
+    """
+    Les distances TSPLIB sont entières (int32) ; les distances exactes sont en float32.
+    """
+    return np.float32 if type_distance == "EXACT_2D" else np.int32
+
+
+# --- Instance du Problème ---
+
+class InstanceTSP:
+    """
+    Une instance du problème : soit des coordonnées et un type de distance,
+    soit une matrice explicite des poids (type "EXPLICIT").
+    """
+
+    def __init__(self, nom, type_distance, coordonnees=None, poids=None):
+        self.nom = nom
+        self.type_distance = type_distance
+        self.coordonnees = None if coordonnees is None else np.asarray(coordonnees, dtype=np.float64)
+        self.poids = None if poids is None else np.asarray(poids)
+
+    def __len__(self):
+        return len(self.poids) if self.poids is not None else len(self.coordonnees)
+
+    def lignes_distances(self, debut, fin):
+        """
+        Retourne les lignes [debut, fin) de la matrice des distances, sous forme de tableau NumPy.
+        """
+        if self.poids is not None:
+            return self.poids[debut:fin]
+        return distances_coordonnees(self.type_distance, self.coordonnees[debut:fin, None, :],
+                                     self.coordonnees[None, :, :])
+
+
+# --- Lecture au Format TSPLIB ---
+
+def _poids_explicites(valeurs, dimension, format_poids):
+    """
+    Reconstruit la matrice complète à partir de la section EDGE_WEIGHT_SECTION.
+    """
+    valeurs = np.asarray(valeurs, dtype=np.float64)
+    # Les formats par colonnes sont les transposés des formats par lignes
+    equivalents = {"UPPER_COL": "LOWER_ROW", "LOWER_COL": "UPPER_ROW",
+                   "UPPER_DIAG_COL": "LOWER_DIAG_ROW", "LOWER_DIAG_COL": "UPPER_DIAG_ROW"}
+    format_poids = equivalents.get(format_poids, format_poids)
+
+    if format_poids == "FULL_MATRIX":
+        return valeurs[:dimension * dimension].reshape(dimension, dimension)
+
+    poids = np.zeros((dimension, dimension), dtype=np.float64)
+    if format_poids == "UPPER_ROW":
+        lignes, colonnes = np.triu_indices(dimension, k=1)
+    elif format_poids == "LOWER_ROW":
+        lignes, colonnes = np.tril_indices(dimension, k=-1)
+    elif format_poids == "UPPER_DIAG_ROW":
+        lignes, colonnes = np.triu_indices(dimension)
+    elif format_poids == "LOWER_DIAG_ROW":
+        lignes, colonnes = np.tril_indices(dimension)
+    else:
+        raise ValueError(f"Format de poids TSPLIB non pris en charge : {format_poids}")
+    poids[lignes, colonnes] = valeurs[:len(lignes)]
+    poids[colonnes, lignes] = valeurs[:len(lignes)]
+    return poids
+
+
+def lire_tsplib(chemin):
+    """
+    Lit une instance TSPLIB (.tsp) de type EUC_2D, CEIL_2D, ATT, GEO ou EXPLICIT.
+    """
+    entetes = {}
+    coordonnees = []
+    valeurs_poids = []
+    section = None
+
+    with open(chemin, encoding="utf-8") as fichier:
+        for ligne in fichier:
+            ligne = ligne.strip()
+            if not ligne:
+                continue
+            # Les lignes qui commencent par une lettre sont des entêtes ou des débuts de section
+            if ligne[0].isalpha():
+                if ":" in ligne:
+                    cle, valeur = ligne.split(":", 1)
+                    entetes[cle.strip().upper()] = valeur.strip()
+                    section = None
+                else:
+                    section = ligne.split()[0].upper()
+                continue
+            if section == "NODE_COORD_SECTION":
+                _, x, y = ligne.split()[:3]
+                coordonnees.append((float(x), float(y)))
+            elif section == "EDGE_WEIGHT_SECTION":
+                valeurs_poids.extend(float(v) for v in ligne.split())
+
+    nom = entetes.get("NAME", chemin)
+    dimension = int(entetes["DIMENSION"])
+    type_distance = entetes.get("EDGE_WEIGHT_TYPE", "EUC_2D").upper()
+
+    if type_distance == "EXPLICIT":
+        format_poids = entetes.get("EDGE_WEIGHT_FORMAT", "FULL_MATRIX").upper()
+        poids = _poids_explicites(valeurs_poids, dimension, format_poids).astype(np.int32)
+        return InstanceTSP(nom, type_distance, poids=poids)
+    return InstanceTSP(nom, type_distance, coordonnees=coordonnees[:dimension])
+
+
+# --- Plus Proches Voisins ---
+
+def k_plus_proches_par_blocs(bloc_distances, nombre_villes, k):
+    """
+    Calcule les k plus proches voisines de chaque ville (de la plus proche à la plus lointaine),
+    par blocs de lignes : mémoire en O(TAILLE_BLOC x n) au lieu de O(n²).
+    'bloc_distances(debut, fin)' retourne les lignes [debut, fin) de la matrice.
+    """
+    k = min(k, nombre_villes - 1)
+    voisins = []
+    for debut in range(0, nombre_villes, TAILLE_BLOC):
+        fin = min(debut + TAILLE_BLOC, nombre_villes)
+        bloc = np.array(bloc_distances(debut, fin), dtype=np.float64)
+        bloc[np.arange(fin - debut), np.arange(debut, fin)] = np.inf
+        proches = np.argpartition(bloc, k - 1, axis=1)[:, :k]
+        ordre = np.argsort(np.take_along_axis(bloc, proches, axis=1), axis=1, kind="stable")
+        voisins.extend(np.take_along_axis(proches, ordre, axis=1).tolist())
+    return voisins
+
+
+# --- Stockages de la Matrice des Distances ---
+
+class _MatriceTableau:
+    """
+    Base commune des matrices stockées dans un tableau NumPy (n x n) contigu.
+    """
+
+    def __init__(self, tableau):
+        self.tableau = tableau
+        # Une memoryview par ligne : matrice[i][j] retourne un nombre Python, sans copie
+        self._lignes = [memoryview(tableau[i]) for i in range(len(tableau))]
+        self._symetrique = None
+
+    def __len__(self):
+        return len(self._lignes)
+
+    def __getitem__(self, i):
+        return self._lignes[i]
+
+    def __iter__(self):
+        return iter(self._lignes)
+
+    def distances_lot(self, villes_depart, villes_arrivee):
+        """
+        Distances (vectorisées) entre des tableaux de villes de même forme.
+        """
+        return self.tableau[villes_depart, villes_arrivee]
+
+    def plus_proches_voisins(self, k):
+        """
+        Les k plus proches voisines de chaque ville (voir k_plus_proches_par_blocs).
+        """
+        return k_plus_proches_par_blocs(lambda debut, fin: self.tableau[debut:fin], len(self), k)
+
+    @property
+    def symetrique(self):
+        """
+        Vrai si tableau[i, j] == tableau[j, i] partout ; comparé par blocs de lignes, puis mémorisé.
+        """
+        if self._symetrique is None:
+            self._symetrique = all(
+                np.array_equal(self.tableau[debut:debut + TAILLE_BLOC], self.tableau[:, debut:debut + TAILLE_BLOC].T)
+                for debut in range(0, len(self), TAILLE_BLOC)
+            )
+        return self._symetrique
+
+
+class MatriceCompacte(_MatriceTableau):
+    """
+    Matrice des distances en mémoire, dans un tableau NumPy float32 ou int32.
+    """
+
+
+class MatriceMemmap(_MatriceTableau):
+    """
+    Matrice des distances projetée depuis un fichier binaire brut (n x n) sur disque.
+    Seules les pages effectivement lues sont chargées en mémoire.
+    """
+
+    def __init__(self, chemin, nombre_villes, dtype=np.int32, mode="r"):
+        self.chemin = chemin
+        super().__init__(np.memmap(chemin, dtype=dtype, mode=mode, shape=(nombre_villes, nombre_villes)))
+
+
+class _LigneCoordonnees:
+    """
+    Ligne "virtuelle" de la matrice : ligne[j] calcule la distance de la ville i à la ville j.
+    """
+
+    def __init__(self, matrice, i):
+        self._matrice = matrice
+        self._distance = matrice.distance
+        self._i = i
+
+    def __getitem__(self, j):
+        return self._distance(self._i, j)
+
+    def __len__(self):
+        return len(self._matrice)
+
+
+class MatriceCoordonnees:
+    """
+    Distances calculées à la volée depuis les coordonnées : aucun stockage en O(n²).
+    """
+
+    symetrique = True  # Toutes les distances TSPLIB sur coordonnées sont symétriques
+
+    def __init__(self, coordonnees, type_distance="EUC_2D"):
+        self.coordonnees = np.asarray(coordonnees, dtype=np.float64)
+        self.type_distance = type_distance
+        self._x = self.coordonnees[:, 0].tolist()
+        self._y = self.coordonnees[:, 1].tolist()
+        if type_distance == "GEO":
+            latitude_longitude = _latitude_longitude_geo(self.coordonnees)
+            self._x = latitude_longitude[:, 0].tolist()
+            self._y = latitude_longitude[:, 1].tolist()
+        self._lignes = [_LigneCoordonnees(self, i) for i in range(len(self.coordonnees))]
+
+    def __len__(self):
+        return len(self._lignes)
+
+    def __getitem__(self, i):
+        return self._lignes[i]
+
+    def __iter__(self):
+        for i in range(len(self._lignes)):
+            yield self.distances_lot(np.full(len(self._lignes), i), np.arange(len(self._lignes))).tolist()
+
+    def distance(self, i, j):
+        """
+        Distance entre les villes i et j, calculée en arithmétique Python (rapide pour un seul couple).
+        """
+        if self.type_distance == "GEO":
+            if i == j:
+                return 0
+            q1 = math.cos(self._y[i] - self._y[j])
+            q2 = math.cos(self._x[i] - self._x[j])
+            q3 = math.cos(self._x[i] + self._x[j])
+            cosinus = min(1.0, max(-1.0, 0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3)))
+            return int(6378.388 * math.acos(cosinus) + 1.0)
+        dx = self._x[i] - self._x[j]
+        dy = self._y[i] - self._y[j]
+        if self.type_distance == "EUC_2D":
+            return int(math.sqrt(dx * dx + dy * dy) + 0.5)
+        if self.type_distance == "CEIL_2D":
+            return math.ceil(math.sqrt(dx * dx + dy * dy))
+        if self.type_distance == "ATT":
+            r = math.sqrt((dx * dx + dy * dy) / 10.0)
+            t = int(r + 0.5)
+            return t + 1 if t < r else t
+        if self.type_distance == "EXACT_2D":
+            return math.sqrt(dx * dx + dy * dy)
+        raise ValueError(f"Type de distance non pris en charge : {self.type_distance}")
+
+    def distances_lot(self, villes_depart, villes_arrivee):
+        """
+        Distances (vectorisées) entre des tableaux de villes de même forme.
+        """
+        resultat = distances_coordonnees(self.type_distance, self.coordonnees[villes_depart],
+                                         self.coordonnees[villes_arrivee])
+        return resultat if self.type_distance == "EXACT_2D" else resultat.astype(np.int64)
+
+    def plus_proches_voisins(self, k):
+        """
+        Les k plus proches voisines de chaque ville (voir k_plus_proches_par_blocs).
+        """
+        return k_plus_proches_par_blocs(self._bloc_distances, len(self), k)
+
+    def _bloc_distances(self, debut, fin):
+        return distances_coordonnees(self.type_distance, self.coordonnees[debut:fin, None, :],
+                                     self.coordonnees[None, :, :])
+
+
+# --- Construction d'une Matrice à partir d'une Instance ---
+
+def creer_matrice(instance, stockage="compacte", chemin_memmap=None):
+    """
+    Construit la matrice des distances d'une instance selon le stockage choisi :
+    - "liste" : liste de listes Python (comme la matrice d'exemple des scripts) ;
+    - "compacte" : MatriceCompacte (tableau NumPy en mémoire) ;
+    - "memmap" : MatriceMemmap écrite dans 'chemin_memmap', par blocs de lignes ;
+    - "coordonnees" : MatriceCoordonnees, sans aucun stockage en O(n²).
+    """
+    nombre_villes = len(instance)
+    dtype = np.int32 if instance.poids is not None else type_stockage(instance.type_distance)
+
+    if stockage == "coordonnees":
+        if instance.coordonnees is None:
+            raise ValueError("Une instance à poids explicites ne peut pas être calculée à la volée")
+        return MatriceCoordonnees(instance.coordonnees, instance.type_distance)
+
+    if stockage == "memmap":
+        if chemin_memmap is None:
+            raise ValueError("Le stockage 'memmap' nécessite un chemin de fichier")
+        tableau = np.memmap(chemin_memmap, dtype=dtype, mode="w+", shape=(nombre_villes, nombre_villes))
+    elif stockage == "compacte":
+        tableau = np.empty((nombre_villes, nombre_villes), dtype=dtype)
+    elif stockage == "liste":
+        # Les listes Python gardent les distances exactes en double précision
+        tableau = np.empty((nombre_villes, nombre_villes), dtype=np.float64 if dtype == np.float32 else dtype)
+    else:
+        raise ValueError(f"Stockage de matrice inconnu : {stockage}")
+
+    # Calcul par blocs de lignes pour ne jamais créer de temporaire de taille n² en float64
+    for debut in range(0, nombre_villes, TAILLE_BLOC):
+        fin = min(debut + TAILLE_BLOC, nombre_villes)
+        tableau[debut:fin] = instance.lignes_distances(debut, fin)
+
+    if stockage == "liste":
+        return tableau.tolist()
+    if stockage == "memmap":
+        tableau.flush()
+        return MatriceMemmap(chemin_memmap, nombre_villes, dtype)
+    return MatriceCompacte(tableau)
+
+
+def distances_lot(matrice, villes_depart, villes_arrivee):
+    """
+    Distances (vectorisées) entre des tableaux de villes, quel que soit le stockage de la matrice.
+    """
+    if hasattr(matrice, "distances_lot"):
+        return matrice.distances_lot(villes_depart, villes_arrivee)
+    return np.asarray(matrice)[villes_depart, villes_arrivee]
@@ -0,0 +1,150 @@
+# Fichier: instrumentation.py
+
+import json
+import os
+import time
+
+# --- Instrumentation des Algorithmes (Chronomètres de Phases et Compteurs) ---
+# Un objet Instrumentation, passé en paramètre 'instrumentation' à un algorithme, mesure
+# le temps passé dans chaque phase (évaluation, sélection, croisement, mutation, génération
+# des voisins, filtrage tabou...) et compte les opérations (évaluations de distance,
+# mouvements proposés et acceptés, succès du cache).
+# Sans instrumentation, les algorithmes utilisent SANS_INSTRUMENTATION, dont les méthodes
+# ne font rien : le coût se limite à un appel de méthode par phase, hors des boucles internes.
+# Les résultats s'exportent en tableau récapitulatif (tableau) et en chronologie au format
+# Chrome Trace (ecrire_chronologie), lisible dans chrome://tracing ou Perfetto.
+
+
+class _Phase:
+    """
+    Chronomètre réutilisable d'une phase, utilisé comme gestionnaire de contexte (with).
+    Un seul objet par nom de phase : aucune allocation à chaque mesure.
+    """
+    __slots__ = ("instrumentation", "nom", "appels", "duree_ns", "_debut")
+
+    def __init__(self, instrumentation, nom):
+        self.instrumentation = instrumentation
+        self.nom = nom
+        self.appels = 0
+        self.duree_ns = 0
+        self._debut = 0
+
+    def __enter__(self):
+        self._debut = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exception):
+        fin = time.perf_counter_ns()
+        self.appels += 1
+        self.duree_ns += fin - self._debut
+        self.instrumentation._noter(self.nom, self._debut, fin)
+        return False
+
+
+class _PhaseInactive:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        return False
+
+
+_PHASE_INACTIVE = _PhaseInactive()
+
+
+class InstrumentationInactive:
+    """
+    Instrumentation désactivée : rien n'est mesuré ni compté.
+    """
+    actif = False
+
+    def phase(self, nom):
+        return _PHASE_INACTIVE
+
+    def compter(self, nom, nombre=1):
+        pass
+
+
+SANS_INSTRUMENTATION = InstrumentationInactive()
+
+
+class Instrumentation:
+    """
+    Chronomètres de phases et compteurs d'opérations d'une exécution.
+    Avec chronologie=True, chaque mesure est aussi conservée comme événement de la chronologie,
+    dans la limite de 'evenements_max' (au-delà, seuls les totaux sont tenus à jour).
+    """
+    actif = True
+
+    def __init__(self, chronologie=True, evenements_max=200000):
+        self.chronologie = chronologie
+        self.evenements_max = evenements_max
+        self.compteurs = {}
+        self._phases = {}
+        self._evenements = []
+        self._origine = time.perf_counter_ns()
+
+    def phase(self, nom):
+        """
+        Chronomètre de la phase 'nom' : with instrumentation.phase("evaluation"): ...
+        """
+        phase = self._phases.get(nom)
+        if phase is None:
+            phase = self._phases[nom] = _Phase(self, nom)
+        return phase
+
+    def compter(self, nom, nombre=1):
+        self.compteurs[nom] = self.compteurs.get(nom, 0) + nombre
+
+    def _noter(self, nom, debut, fin):
+        if self.chronologie and len(self._evenements) < self.evenements_max:
+            self._evenements.append((nom, debut, fin))
+
+    def resume(self):
+        """
+        Totaux par phase (appels, durée en secondes) et compteurs, sous forme de dictionnaire.
+        """
+        return {
+            "phases": {nom: {"appels": phase.appels, "duree": phase.duree_ns / 1e9}
+                       for nom, phase in self._phases.items()},
+            "compteurs": dict(self.compteurs),
+        }
+
+    def tableau(self):
+        """
+        Tableau récapitulatif : temps par phase (total, moyenne, part du temps mesuré), puis compteurs.
+        """
+        total_ns = sum(phase.duree_ns for phase in self._phases.values()) or 1
+        lignes = [f"{'Phase':<24}{'Appels':>10}{'Total (ms)':>14}{'Moyenne (µs)':>15}{'Part (%)':>10}"]
+        for phase in sorted(self._phases.values(), key=lambda p: p.duree_ns, reverse=True):
+            moyenne_us = phase.duree_ns / phase.appels / 1e3 if phase.appels else 0.0
+            lignes.append(f"{phase.nom:<24}{phase.appels:>10}{phase.duree_ns / 1e6:>14.2f}{moyenne_us:>15.2f}"
+                          f"{100 * phase.duree_ns / total_ns:>10.1f}")
+        if self.compteurs:
+            lignes.append("")
+            lignes.append(f"{'Compteur':<24}{'Valeur':>10}")
+            for nom, valeur in sorted(self.compteurs.items()):
+                lignes.append(f"{nom:<24}{valeur:>10}")
+        return "\n".join(lignes)
+
+    def chronologie_chrome(self):
+        """
+        Chronologie au format Chrome Trace : un événement complet ("X") par mesure de phase,
+        et la valeur finale des compteurs ("C"). Les temps sont en microsecondes.
+        """
+        pid = os.getpid()
+        evenements = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "TSP"}}]
+        for nom, debut, fin in self._evenements:
+            evenements.append({"name": nom, "ph": "X", "pid": pid, "tid": 0,
+                               "ts": (debut - self._origine) / 1e3, "dur": (fin - debut) / 1e3})
+        fin_ns = max((fin for _, _, fin in self._evenements), default=self._origine)
+        for nom, valeur in self.compteurs.items():
+            evenements.append({"name": nom, "ph": "C", "pid": pid, "tid": 0,
+                               "ts": (fin_ns - self._origine) / 1e3, "args": {nom: valeur}})
+        return {"traceEvents": evenements, "displayTimeUnit": "ms"}
+
+    def ecrire_chronologie(self, chemin):
+        with open(chemin, "w", encoding="utf-8") as fichier:
+            json.dump(self.chronologie_chrome(), fichier)
@@ -0,0 +1,71 @@
+# Fichier: memoire_partagee.py
+
+import numbers
+from array import array
+from multiprocessing import shared_memory
+
+# --- Matrice des Distances en Mémoire Partagée ---
+# Les algorithmes parallèles (modèle en îles, recuit parallèle) placent la matrice
+# une seule fois dans un segment de mémoire partagée. Chaque processus du pool s'y
+# attache à son démarrage (initialiser_travailleur) au lieu de la recevoir, sérialisée,
+# avec chaque tâche.
+
+# Matrice du processus travailleur (attachée une seule fois par processus)
+_memoire_travailleur = None
+_matrice_travailleur = None
+
+
+def _format_matrice(matrice):
+    """
+    Choisit le format de stockage : entiers 64 bits si toutes les distances sont entières, flottants sinon.
+    Pour un tableau NumPy (ou un stockage de instances.py qui en contient un), le type du tableau décide.
+    """
+    dtype = getattr(getattr(matrice, "tableau", matrice), "dtype", None)
+    if dtype is not None:
+        import numpy as np
+        return "q" if np.issubdtype(dtype, np.integer) else "d"
+    if all(isinstance(valeur, numbers.Integral) for ligne in matrice for valeur in ligne):
+        return "q"
+    return "d"
+
+
+def creer_matrice_partagee(matrice):
+    """
+    Copie la matrice (n x n) dans un segment de mémoire partagée, ligne par ligne.
+    Retourne le segment et son format ; l'appelant est responsable de close() et unlink().
+    """
+    nombre_villes = len(matrice)
+    format_valeurs = _format_matrice(matrice)
+    taille_valeur = array(format_valeurs).itemsize
+    memoire = shared_memory.SharedMemory(create=True, size=max(1, nombre_villes * nombre_villes * taille_valeur))
+    vue = memoire.buf.cast(format_valeurs)
+    for i, ligne in enumerate(matrice):
+        vue[i * nombre_villes:(i + 1) * nombre_villes] = array(format_valeurs, ligne)
+    vue.release()
+    return memoire, format_valeurs
+
+
+def ouvrir_matrice_partagee(memoire, nombre_villes, format_valeurs):
+    """
+    Construit une vue de la matrice partagée utilisable comme matrice[i][j], sans copie :
+    chaque ligne est une tranche de memoryview sur le segment.
+    """
+    vue = memoire.buf.cast(format_valeurs)
+    return [vue[i * nombre_villes:(i + 1) * nombre_villes] for i in range(nombre_villes)]
+
+
+def initialiser_travailleur(nom_memoire, nombre_villes, format_valeurs):
+    """
+    Initialisation d'un processus du pool : s'attacher une seule fois à la matrice partagée.
+    À passer comme 'initializer' d'un ProcessPoolExecutor.
+    """
+    global _memoire_travailleur, _matrice_travailleur
+    _memoire_travailleur = shared_memory.SharedMemory(name=nom_memoire)
+    _matrice_travailleur = ouvrir_matrice_partagee(_memoire_travailleur, nombre_villes, format_valeurs)
+
+
+def matrice_travailleur():
+    """
+    Retourne la matrice partagée du processus travailleur courant.
+    """
+    return _matrice_travailleur
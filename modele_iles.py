@@ -0,0 +1,166 @@
+# Fichier: modele_iles.py
+
+import importlib
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from memoire_partagee import creer_matrice_partagee, initialiser_travailleur, matrice_travailleur
+
+# --- Modèle en Îles : Algorithme Génétique Multi-Cœurs ---
+# Plusieurs populations indépendantes ("îles") évoluent en parallèle, chacune dans
+# un processus du pool. Toutes les 'intervalle_migration' générations, chaque île
+# envoie ses meilleurs individus à ses voisines selon une topologie (anneau ou complète),
+# où ils remplacent les moins bons individus.
+# La matrice des distances est placée une seule fois en mémoire partagée (voir memoire_partagee.py).
+
+VARIANTES = {
+    "rang": "algorithme_genetique_rang",
+    "roulette": "algorithme_genetique_roulette",
+}
+
+
+# --- Évolution d'une Île (exécutée dans un processus du pool) ---
+
+def _evoluer_ile(variante, population, nombre_generations, parametres, graine):
+    """
+    Fait évoluer la population d'une île pendant une époque, à l'aide des opérateurs
+    du module génétique choisi. Retourne la population finale triée (meilleurs en tête),
+    les distances correspondantes et le meilleur individu rencontré pendant l'époque.
+    """
+    module = importlib.import_module(VARIANTES[variante])
+    matrice = matrice_travailleur()
+    random.seed(graine)
+
+    population, meilleure_solution, meilleure_distance = module.evoluer_population(
+        population, matrice, nombre_generations, **parametres
+    )
+
+    # La population finale n'a pas encore été évaluée : on la trie pour la migration
+    distances = [module.calculer_distance_totale(individu, matrice) for individu in population]
+    ordre = sorted(range(len(population)), key=distances.__getitem__)
+    population = [population[i] for i in ordre]
+    distances = [distances[i] for i in ordre]
+    if distances[0] < meilleure_distance:
+        meilleure_solution, meilleure_distance = population[0], distances[0]
+    return population, distances, meilleure_solution, meilleure_distance
+
+
+# --- Migration ---
+
+def ile_sources(index_ile, nombre_iles, topologie):
+    """
+    Retourne les îles qui envoient leurs migrants vers l'île 'index_ile'.
+    - "anneau" : la précédente seulement ;
+    - "complet" : toutes les autres.
+    """
+    if topologie == "anneau":
+        return [(index_ile - 1) % nombre_iles] if nombre_iles > 1 else []
+    if topologie == "complet":
+        return [autre for autre in range(nombre_iles) if autre != index_ile]
+    raise ValueError(f"Topologie de migration inconnue : {topologie}")
+
+
+def migrer(populations, distances, nombre_migrants, topologie):
+    """
+    Chaque île reçoit les meilleurs individus de ses îles sources ('nombre_migrants' au total),
+    qui remplacent ses moins bons individus. Les populations sont supposées triées.
+    """
+    nombre_iles = len(populations)
+    emigrants = [list(zip(distances[k][:nombre_migrants], populations[k][:nombre_migrants]))
+                 for k in range(nombre_iles)]
+    for index_ile in range(nombre_iles):
+        candidats = [migrant for source in ile_sources(index_ile, nombre_iles, topologie)
+                     for migrant in emigrants[source]]
+        candidats.sort(key=lambda migrant: migrant[0])
+        arrivants = [individu[:] for _, individu in candidats[:nombre_migrants]]
+        if arrivants:
+            populations[index_ile][-len(arrivants):] = arrivants
+
+
+# --- Algorithme Principal : Modèle en Îles ---
+
+def algorithme_genetique_iles(matrice, nombre_iles, taille_population, nombre_generations, taux_croisement,
+                              taux_mutation, taille_elite, intervalle_migration=20, nombre_migrants=2,
+                              topologie="anneau", variante="rang", operateur_croisement="ox1",
+                              nombre_processus=None, graine=None, taux_recherche_locale=0.0):
+    """
+    Algorithme génétique en îles : 'nombre_iles' populations de 'taille_population' individus
+    évoluent en parallèle, par époques de 'intervalle_migration' générations séparées par une migration.
+    Le résultat ne dépend que de la graine, pas de la répartition des îles entre les processus.
+    Retourne (meilleure_solution, meilleure_distance, statistiques_par_ile).
+    """
+    if variante not in VARIANTES:
+        raise ValueError(f"Variante d'algorithme génétique inconnue : {variante}")
+    generateur = random.Random(graine)
+    nombre_villes = len(matrice)
+    parametres = {
+        "taux_croisement": taux_croisement,
+        "taux_mutation": taux_mutation,
+        "taille_elite": taille_elite,
+        "operateur_croisement": operateur_croisement,
+        "taux_recherche_locale": taux_recherche_locale,
+    }
+
+    # 1. Populations initiales aléatoires, une par île
+    populations = [[generateur.sample(range(nombre_villes), nombre_villes) for _ in range(taille_population)]
+                   for _ in range(nombre_iles)]
+    statistiques = [{"ile": k, "meilleure_distance": float('inf'), "distance_moyenne": None,
+                     "generations": 0, "migrations": 0} for k in range(nombre_iles)]
+    meilleure_solution_globale = None
+    meilleure_distance_globale = float('inf')
+
+    # 2. La matrice est copiée une seule fois en mémoire partagée pour tout le pool
+    memoire, format_valeurs = creer_matrice_partagee(matrice)
+    try:
+        with ProcessPoolExecutor(max_workers=nombre_processus, initializer=initialiser_travailleur,
+                                 initargs=(memoire.name, nombre_villes, format_valeurs)) as pool:
+            generations_restantes = nombre_generations
+            while generations_restantes > 0:
+                duree_epoque = min(intervalle_migration, generations_restantes)
+                generations_restantes -= duree_epoque
+
+                # 3. Une époque : chaque île évolue dans un processus, avec sa propre graine
+                taches = [pool.submit(_evoluer_ile, variante, populations[k], duree_epoque, parametres,
+                                      generateur.getrandbits(64))
+                          for k in range(nombre_iles)]
+                resultats = [tache.result() for tache in taches]
+
+                distances = []
+                for k, (population, distances_ile, meilleure_solution, meilleure_distance) in enumerate(resultats):
+                    populations[k] = population
+                    distances.append(distances_ile)
+                    stats = statistiques[k]
+                    stats["generations"] += duree_epoque
+                    stats["distance_moyenne"] = sum(distances_ile) / len(distances_ile)
+                    if meilleure_distance < stats["meilleure_distance"]:
+                        stats["meilleure_distance"] = meilleure_distance
+                    if meilleure_distance < meilleure_distance_globale:
+                        meilleure_solution_globale = meilleure_solution
+                        meilleure_distance_globale = meilleure_distance
+
+                # 4. Migration des élites entre les îles (sauf après la dernière époque)
+                if generations_restantes > 0 and nombre_migrants > 0:
+                    migrer(populations, distances, nombre_migrants, topologie)
+                    for stats in statistiques:
+                        stats["migrations"] += 1
+    finally:
+        memoire.close()
+        memoire.unlink()
+
+    return meilleure_solution_globale, meilleure_distance_globale, statistiques
+
+
+# --- Bloc d'Exécution ---
+
+if __name__ == "__main__":
+    from algorithme_genetique_rang import matrice_distances
+
+    meilleure_solution, meilleure_distance, statistiques = algorithme_genetique_iles(
+        matrice_distances, nombre_iles=4, taille_population=50, nombre_generations=200,
+        taux_croisement=0.8, taux_mutation=0.02, taille_elite=5, intervalle_migration=20, graine=42
+    )
+
+    print(f"Meilleure solution trouvée (Modèle en Îles): {meilleure_solution}")
+    print(f"Distance minimale: {meilleure_distance}")
+    for stats in statistiques:
+        print(stats)
@@ -0,0 +1,146 @@
+# Fichier: mouvements.py
+
+import heapq
+import random
+
+# --- Évaluation Incrémentale des Mouvements ---
+# Un mouvement est décrit par un couple de positions (i, j) dans le parcours.
+# Au lieu de copier le parcours puis de recalculer sa distance totale en O(n),
+# on calcule en O(1) la variation de distance (delta) produite par le mouvement,
+# et on ne modifie le parcours (sur place) que si le mouvement est accepté.
+
+
+def calculer_distance_totale(solution, matrice):
+    """
+    Calcule la distance totale d'un parcours (solution), retour au départ inclus.
+    """
+    distance_totale = 0
+    for i in range(len(solution) - 1):
+        distance_totale += matrice[solution[i]][solution[i + 1]]
+    distance_totale += matrice[solution[-1]][solution[0]]
+    return distance_totale
+
+
+def tirer_echange(nombre_villes, rng=random):
+    """
+    Tire au hasard un mouvement d'échange (i, j) avec i != j.
+    """
+    i = rng.randrange(nombre_villes)
+    j = rng.randrange(nombre_villes - 1)
+    if j >= i:
+        j += 1
+    return i, j
+
+
+def _delta_generique(solution, matrice, i, j):
+    """
+    Calcule le delta d'un échange en ne considérant que les arêtes touchées.
+    Utilisé pour les cas particuliers (villes adjacentes, petits parcours).
+    """
+    n = len(solution)
+
+    def ville_apres_echange(position):
+        if position == i:
+            return solution[j]
+        if position == j:
+            return solution[i]
+        return solution[position]
+
+    # Les arêtes (p, p + 1) modifiées partent de i - 1, i, j - 1 ou j
+    positions_aretes = {(i - 1) % n, i, (j - 1) % n, j}
+    delta = 0
+    for p in positions_aretes:
+        q = (p + 1) % n
+        delta += matrice[ville_apres_echange(p)][ville_apres_echange(q)]
+        delta -= matrice[solution[p]][solution[q]]
+    return delta
+
+
+def delta_echange(solution, matrice, i, j):
+    """
+    Calcule en O(1) la variation de distance totale si l'on échange
+    les villes situées aux positions i et j du parcours.
+    La matrice peut être asymétrique : chaque arête est lue dans son sens de parcours.
+    """
+    if i == j:
+        return 0
+    if i > j:
+        i, j = j, i
+    n = len(solution)
+
+    # Villes adjacentes (y compris via le retour au départ) : cas particulier
+    if n <= 3 or j - i == 1 or (i == 0 and j == n - 1):
+        return _delta_generique(solution, matrice, i, j)
+
+    a = solution[i]
+    b = solution[j]
+    precedent_a = solution[i - 1]
+    suivant_a = solution[i + 1]
+    precedent_b = solution[j - 1]
+    suivant_b = solution[(j + 1) % n]
+
+    ancien = (matrice[precedent_a][a] + matrice[a][suivant_a]
+              + matrice[precedent_b][b] + matrice[b][suivant_b])
+    nouveau = (matrice[precedent_a][b] + matrice[b][suivant_a]
+               + matrice[precedent_b][a] + matrice[a][suivant_b])
+    return nouveau - ancien
+
+
+def appliquer_echange(solution, i, j, positions=None):
+    """
+    Applique sur place l'échange des villes aux positions i et j.
+    Si l'index inverse ville -> position est fourni, il est tenu à jour en O(1).
+    """
+    solution[i], solution[j] = solution[j], solution[i]
+    if positions is not None:
+        positions[solution[i]] = i
+        positions[solution[j]] = j
+
+
+# --- Listes de Candidats (k plus proches voisins) ---
+
+def calculer_plus_proches_voisins(matrice, k):
+    """
+    Pré-calcule, pour chaque ville, la liste de ses k plus proches voisines
+    (au sens de la ligne correspondante de la matrice), de la plus proche à la plus lointaine.
+    Coût O(n² log k) une seule fois, puis O(k) par ville à chaque itération.
+    Les stockages de instances.py fournissent leur propre calcul, vectorisé et par blocs.
+    """
+    if hasattr(matrice, "plus_proches_voisins"):
+        return matrice.plus_proches_voisins(k)
+    nombre_villes = len(matrice)
+    k = min(k, nombre_villes - 1)
+    voisins = []
+    for ville in range(nombre_villes):
+        ligne = matrice[ville]
+        proches = heapq.nsmallest(k + 1, range(nombre_villes), key=lambda autre: ligne[autre])
+        voisins.append([autre for autre in proches if autre != ville][:k])
+    return voisins
+
+
+def calculer_positions(solution):
+    """
+    Construit l'index inverse ville -> position dans le parcours.
+    """
+    positions = [0] * len(solution)
+    for position, ville in enumerate(solution):
+        positions[ville] = position
+    return positions
+
+
+def generer_echanges_candidats(solution, positions, plus_proches_voisins):
+    """
+    Génère les mouvements d'échange (i, j) qui rendent une ville adjacente
+    (juste après ou juste avant) à l'une de ses k plus proches voisines.
+    Le voisinage ne contient que O(n.k) mouvements au lieu de O(n²) parcours copiés.
+    """
+    n = len(solution)
+    for p, ville in enumerate(solution):
+        suivant = (p + 1) % n
+        precedent = (p - 1) % n
+        for voisine in plus_proches_voisins[ville]:
+            q = positions[voisine]
+            if q != suivant:
+                yield suivant, q
+            if q != precedent:
+                yield precedent, q
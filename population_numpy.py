@@ -0,0 +1,291 @@
+# Fichier: population_numpy.py
+
+import random
+
+import numpy as np
+
+from croisements import obtenir_operateur_croisement
+from instances import distances_lot
+from mouvements import calculer_plus_proches_voisins
+from recherche_locale import recherche_locale, est_symetrique, mutation_or_opt, OPERATEURS_MUTATION
+from instrumentation import SANS_INSTRUMENTATION
+from construction import construire_population
+from reprise import etat_aleatoire, restaurer_aleatoire
+
+# --- Moteur de Population Vectorisé (NumPy) ---
+# Toute la génération est stockée dans un seul tableau contigu d'entiers
+# de forme (taille_population, nombre_villes) : une ligne par individu.
+# L'évaluation, la sélection, le croisement et la mutation opèrent sur
+# toute la population à la fois, sans boucle Python par individu.
+
+
+def creer_population(taille_population, nombre_villes, rng):
+    """
+    Crée une population de permutations aléatoires (une par ligne).
+    """
+    base = np.tile(np.arange(nombre_villes, dtype=np.int32), (taille_population, 1))
+    return rng.permuted(base, axis=1)
+
+
+def evaluer_population(population, matrice):
+    """
+    Calcule en un seul lot la distance totale de chaque individu :
+    on rassemble les arêtes (ville, ville suivante) de toutes les lignes
+    dans la matrice des distances, puis on somme par ligne.
+    Le retour à la ville de départ est inclus grâce au décalage circulaire.
+    La matrice peut être un tableau NumPy ou l'un des stockages de instances.py.
+    """
+    villes_suivantes = np.roll(population, -1, axis=1)
+    return distances_lot(matrice, population, villes_suivantes).sum(axis=1)
+
+
+def probabilites_selection(distances, methode):
+    """
+    Calcule les probabilités de sélection de chaque individu.
+    - "rang" : proportionnelle au rang (1 pour le moins bon, N pour le meilleur).
+    - "roulette" : proportionnelle à la fitness, c'est-à-dire à l'inverse de la distance.
+    """
+    taille = len(distances)
+    if methode == "rang":
+        rangs = np.empty(taille, dtype=np.float64)
+        rangs[np.argsort(-distances, kind="stable")] = np.arange(1, taille + 1)
+        return rangs / rangs.sum()
+    if methode == "roulette":
+        with np.errstate(divide="ignore"):
+            fitnesses = 1.0 / distances.astype(np.float64)
+        infinies = np.isinf(fitnesses)
+        # Une distance nulle donne une fitness infinie : ces individus se partagent la roue
+        if infinies.any():
+            return infinies / infinies.sum()
+        return fitnesses / fitnesses.sum()
+    raise ValueError(f"Méthode de sélection inconnue : {methode}")
+
+
+def tirer_parents_lot(distances, nombre, methode, rng, taille_tournoi=3):
+    """
+    Tire en un seul lot les indices de 'nombre' parents.
+    - "rang" / "roulette" : tirage pondéré (table cumulative + recherche dichotomique).
+    - "tournoi" : meilleur de 'taille_tournoi' individus tirés au hasard, pour tous les tirages à la fois.
+    - "sus" : échantillonnage universel stochastique (pointeurs régulièrement espacés), puis mélange.
+    """
+    taille = len(distances)
+    if methode == "tournoi":
+        participants = rng.integers(0, taille, (nombre, taille_tournoi))
+        gagnants = np.argmin(distances[participants], axis=1)
+        return participants[np.arange(nombre), gagnants]
+    if methode == "sus":
+        cumuls = np.cumsum(probabilites_selection(distances, "roulette"))
+        pointeurs = (rng.random() + np.arange(nombre)) / nombre
+        indices = np.minimum(np.searchsorted(cumuls, pointeurs), taille - 1)
+        return rng.permutation(indices)
+    return rng.choice(taille, size=nombre, p=probabilites_selection(distances, methode))
+
+
+def croisement_ox1_lot(parents1, parents2, rng):
+    """
+    Effectue en lot le croisement Ordered Crossover (OX1) de chaque paire de lignes.
+    - Le segment [debut, fin] de parent1 est recopié aux mêmes positions.
+    - Les positions restantes reçoivent, dans l'ordre, les villes de parent2 absentes du segment.
+    L'appartenance au segment est testée par un masque booléen (ville -> présente ?).
+    """
+    nombre_paires, taille = parents1.shape
+
+    # 1. Choisir une sous-séquence aléatoire (deux bornes distinctes) pour chaque paire
+    a = rng.integers(0, taille, nombre_paires)
+    b = rng.integers(0, taille - 1, nombre_paires)
+    b += b >= a
+    debut = np.minimum(a, b)[:, None]
+    fin = np.maximum(a, b)[:, None]
+    positions = np.arange(taille)
+    dans_segment = (positions >= debut) & (positions <= fin)
+
+    # 2. Copier le segment de parent1 dans l'enfant
+    enfants = np.empty_like(parents1)
+    enfants[dans_segment] = parents1[dans_segment]
+
+    # 3. Masque des villes déjà présentes dans le segment, puis villes de parent2 à conserver
+    villes_segment = np.zeros((nombre_paires, taille), dtype=bool)
+    np.put_along_axis(villes_segment, parents1, dans_segment, axis=1)
+    a_conserver = ~np.take_along_axis(villes_segment, parents2, axis=1)
+
+    # 4. Chaque ligne a autant de positions libres que de villes à conserver :
+    # le parcours ligne par ligne des deux masques les associe dans l'ordre.
+    enfants[~dans_segment] = parents2[a_conserver]
+    return enfants
+
+
+def mutation_lot(population, taux_mutation, rng):
+    """
+    Effectue sur place une mutation par échange (Swap Mutation) sur toutes les lignes.
+    Comme dans la version séquentielle, chaque gène i est échangé avec probabilité
+    'taux_mutation' avec un gène j choisi au hasard ; les gènes sont traités dans l'ordre.
+    """
+    taille_population, taille = population.shape
+    mutations = rng.random((taille_population, taille)) < taux_mutation
+    cibles = rng.integers(0, taille, (taille_population, taille))
+
+    # Une seule opération vectorisée par colonne concernée, sur toutes les lignes à la fois
+    for i in np.flatnonzero(mutations.any(axis=0)):
+        lignes = np.flatnonzero(mutations[:, i])
+        j = cibles[lignes, i]
+        villes_i = population[lignes, i].copy()
+        population[lignes, i] = population[lignes, j]
+        population[lignes, j] = villes_i
+    return population
+
+
+# --- Algorithme Génétique Vectorisé ---
+
+def algorithme_genetique_numpy(matrice, taille_population, nombre_generations, taux_croisement,
+                               taux_mutation, taille_elite, selection="rang", graine=None,
+                               operateur_croisement="ox1", taux_recherche_locale=0.0, suivi=None, arret=None,
+                               reprise=None, instrumentation=None, part_construite=0.0,
+                               operateur_mutation="echange", diversite=None):
+    """
+    Algorithme génétique pour le TSP dont la population est un tableau NumPy (taille_population x n).
+    Même schéma que la version à listes : élitisme, sélection ("rang", "roulette", "tournoi" ou "sus"),
+    croisement et mutation par échange, mais chaque étape traite toute la génération en lot.
+    Le croisement OX1 est vectorisé ; les autres opérateurs (voir croisements.py)
+    sont appliqués paire par paire sur les lignes du tableau.
+    Avec 'taux_recherche_locale' > 0, les enfants tirés avec cette probabilité sont
+    améliorés un par un par 2-opt et Or-opt (voir recherche_locale.py).
+    'suivi' (optionnel) est appelé à chaque nouvelle meilleure solution avec (generation, meilleure_distance).
+    'arret' (optionnel) : un CriteresArret (voir arret.py), vérifié après l'évaluation de chaque génération.
+    'reprise' (optionnel) : un PointReprise (voir reprise.py) ; le tableau de population est écrit tel quel,
+    avec l'état du générateur NumPy et celui des générateurs qui en sont dérivés.
+    'instrumentation' (optionnel) : une Instrumentation (voir instrumentation.py), qui chronomètre chaque étape.
+    'part_construite' : part des lignes initiales remplacées par des parcours construits (voir construction.py).
+    'operateur_mutation' : "echange" (mutation vectorisée, par défaut) ou "oropt" (déplacement de segments
+    sans inversion, appliqué ligne par ligne, voir recherche_locale.mutation_or_opt).
+    'diversite' (optionnel) : une DiversitePopulation (voir diversite.py) ; les clés de Zobrist de toutes
+    les lignes sont calculées en lot, seuls les doublons sont perturbés ligne par ligne.
+    """
+    if operateur_mutation not in OPERATEURS_MUTATION:
+        raise ValueError(f"Opérateur de mutation inconnu : {operateur_mutation}")
+    if instrumentation is None:
+        instrumentation = SANS_INSTRUMENTATION
+    if arret is not None:
+        arret.demarrer()
+    rng = np.random.default_rng(graine)
+    operateur = None if operateur_croisement == "ox1" else obtenir_operateur_croisement(operateur_croisement)
+    if not hasattr(matrice, "distances_lot"):
+        matrice = np.asarray(matrice)
+    nombre_villes = len(matrice)
+    nombre_enfants = taille_population - taille_elite
+    if taux_recherche_locale > 0:
+        plus_proches_voisins = calculer_plus_proches_voisins(matrice, 8)
+        symetrique = est_symetrique(matrice)
+
+    # 1. Création de la population initiale de solutions aléatoires
+    population = creer_population(taille_population, nombre_villes, rng)
+    nombre_construits = min(taille_population, round(part_construite * taille_population))
+    if nombre_construits > 0:
+        # Les variantes aléatoires des constructions tirent leurs nombres d'un générateur dérivé de 'rng'
+        population[:nombre_construits] = construire_population(matrice, nombre_construits,
+                                                               random.Random(int(rng.integers(2 ** 32))))
+    nouvelle_population = np.empty_like(population)
+    if operateur_mutation == "oropt":
+        # Générateur dérivé de 'rng', créé seulement pour cet opérateur (le flux par défaut est inchangé)
+        rng_mutation = random.Random(int(rng.integers(2 ** 32)))
+    if diversite is not None:
+        rng_diversite = random.Random(int(rng.integers(2 ** 32)))
+
+    meilleure_solution_globale = None
+    meilleure_distance_globale = float('inf')
+
+    # Reprise d'une exécution interrompue : la population sauvegardée remplace la population initiale
+    debut = 0
+    etat = reprise.charger("algorithme_genetique_numpy", rng) if reprise is not None else None
+    if etat is not None:
+        debut = etat["generation"].item()
+        population = etat["population"]
+        meilleure_solution_globale = etat["meilleure_solution"].tolist()
+        meilleure_distance_globale = etat["meilleure_distance"].item()
+        if operateur_mutation == "oropt":
+            restaurer_aleatoire(etat, rng_mutation, "mutation_")
+    if diversite is not None:
+        diversite.demarrer(matrice)
+        if etat is not None:
+            restaurer_aleatoire(etat, rng_diversite, "diversite_")
+            diversite.restaurer({nom[len("diversite_"):]: valeur for nom, valeur in etat.items()
+                                 if nom.startswith("diversite_") and not nom.startswith("diversite_rng_")})
+        cles_population = diversite.cles_lot(population)
+
+    # 2. Boucle principale sur les générations
+    for generation in range(debut, nombre_generations):
+        # 3. Évaluation de toute la population en un seul lot
+        with instrumentation.phase("evaluation"):
+            distances = evaluer_population(population, matrice)
+        instrumentation.compter("evaluations", len(population))
+
+        # Mettre à jour la meilleure solution trouvée jusqu'à présent
+        index_meilleur_gen = int(np.argmin(distances))
+        if distances[index_meilleur_gen] < meilleure_distance_globale:
+            meilleure_solution_globale = population[index_meilleur_gen].tolist()
+            meilleure_distance_globale = distances[index_meilleur_gen].item()
+            if suivi is not None:
+                suivi(generation + 1, meilleure_distance_globale)
+        if arret is not None and arret.verifier(generation + 1, meilleure_distance_globale):
+            break
+        if diversite is not None:
+            with instrumentation.phase("diversite"):
+                mesure = diversite.mesurer(generation + 1, population, cles_population)
+
+        # 4. Élitisme : conserver les 'taille_elite' meilleurs individus
+        with instrumentation.phase("selection"):
+            ordre = np.argsort(distances, kind="stable")
+            nouvelle_population[:taille_elite] = population[ordre[:taille_elite]]
+
+            # 5. Tirer en une fois tous les parents de la génération
+            parents = tirer_parents_lot(distances, 2 * nombre_enfants, selection, rng)
+            parents1 = population[parents[:nombre_enfants]]
+            parents2 = population[parents[nombre_enfants:]]
+
+        # 6. Croisement des paires retenues (les autres enfants sont des copies de parent1)
+        with instrumentation.phase("croisement"):
+            enfants = parents1
+            croiser = rng.random(nombre_enfants) < taux_croisement
+            if operateur is None and croiser.any():
+                enfants[croiser] = croisement_ox1_lot(parents1[croiser], parents2[croiser], rng)
+            elif operateur is not None:
+                for k in np.flatnonzero(croiser):
+                    enfants[k] = operateur(parents1[k].tolist(), parents2[k].tolist(), matrice)
+
+        # 7. Mutation de tous les enfants
+        with instrumentation.phase("mutation"):
+            if operateur_mutation == "oropt":
+                for k in range(nombre_enfants):
+                    enfants[k] = mutation_or_opt(enfants[k].tolist(), taux_mutation, rng_mutation)
+            else:
+                mutation_lot(enfants, taux_mutation, rng)
+        if taux_recherche_locale > 0:
+            with instrumentation.phase("recherche_locale"):
+                for k in np.flatnonzero(rng.random(nombre_enfants) < taux_recherche_locale):
+                    enfant, _ = recherche_locale(enfants[k].tolist(), matrice, plus_proches_voisins,
+                                                 symetrique=symetrique)
+                    enfants[k] = enfant
+        if diversite is not None:
+            # Rejet des doublons (clés des élites et des enfants déjà insérés), puis immigration éventuelle
+            doublons_avant, immigrants_avant = diversite.doublons_rejetes, diversite.immigrants_introduits
+            with instrumentation.phase("diversite"):
+                _, cles_population = diversite.renouveler(generation + 1, mesure, cles_population[ordre[:taille_elite]],
+                                                          enfants, rng_diversite)
+            instrumentation.compter("doublons_rejetes", diversite.doublons_rejetes - doublons_avant)
+            instrumentation.compter("immigrants", diversite.immigrants_introduits - immigrants_avant)
+        nouvelle_population[taille_elite:] = enfants
+
+        # 8. Remplacer l'ancienne population par la nouvelle (double tampon, sans réallocation)
+        population, nouvelle_population = nouvelle_population, population
+
+        if reprise is not None and reprise.doit_ecrire():
+            etat_derives = etat_aleatoire(rng_mutation, "mutation_") if operateur_mutation == "oropt" else {}
+            if diversite is not None:
+                etat_derives.update(etat_aleatoire(rng_diversite, "diversite_"))
+                etat_derives.update({"diversite_" + nom: valeur for nom, valeur in diversite.etat().items()})
+            reprise.ecrire("algorithme_genetique_numpy", rng, generation=generation + 1, population=population,
+                           meilleure_solution=meilleure_solution_globale, meilleure_distance=meilleure_distance_globale,
+                           **etat_derives)
+
+    if arret is not None:
+        arret.conclure(nombre_generations)
+    return meilleure_solution_globale, meilleure_distance_globale
@@ -0,0 +1,84 @@
+# Fichier: progression.py
+
+import time
+
+# --- Événements de Progression des Algorithmes ---
+# Les variantes "iterer_*" des algorithmes (recuit_simule, tabu_search, algorithme_genetique)
+# sont des générateurs : elles produisent, au fil de l'exécution, de petits dictionnaires
+# décrivant la progression (itération, distance courante et meilleure distance, température,
+# taille de la liste tabou ou statistiques de la génération...).
+# Le meilleur parcours n'est transmis que lorsqu'il s'améliore, et seulement sous forme de
+# modifications [(position, ville), ...] par rapport au dernier parcours transmis : le
+# consommateur le reconstruit avec appliquer_modifications, sans que l'algorithme garde d'historique.
+# Le consommateur peut arrêter l'exécution à tout moment en cessant d'itérer (break).
+
+
+def modifications_parcours(ancien, nouveau):
+    """
+    Liste des (position, ville) qui transforment le parcours 'ancien' en 'nouveau'
+    (tout le parcours si 'ancien' est None).
+    """
+    if ancien is None or len(ancien) != len(nouveau):
+        return list(enumerate(nouveau))
+    return [(position, ville) for position, (avant, ville) in enumerate(zip(ancien, nouveau)) if avant != ville]
+
+
+def appliquer_modifications(parcours, modifications):
+    """
+    Reconstruit, côté consommateur, le meilleur parcours à partir des modifications reçues.
+    'parcours' est une liste (vide au départ), modifiée sur place et retournée.
+    """
+    for position, ville in modifications:
+        if position >= len(parcours):
+            parcours.extend([None] * (position + 1 - len(parcours)))
+        parcours[position] = ville
+    return parcours
+
+
+class SuiviProgression:
+    """
+    Construit les événements de progression et en limite la fréquence :
+    un événement au plus toutes les 'intervalle' étapes et toutes les 'periode' secondes
+    (l'événement final est toujours émis).
+    Seule une copie du dernier meilleur parcours transmis est conservée.
+    """
+
+    def __init__(self, intervalle=1, periode=0.0):
+        self.intervalle = max(1, intervalle)
+        self.periode = periode
+        self._derniere_etape = None
+        self._dernier_temps = None
+        self._parcours_transmis = None
+        self._distance_transmise = float('inf')
+
+    def doit_emettre(self, etape, final=False):
+        """
+        Indique si un événement doit être émis à cette étape (et le note comme émis).
+        """
+        maintenant = time.perf_counter()
+        if not final and self._derniere_etape is not None:
+            if etape - self._derniere_etape < self.intervalle:
+                return False
+            if self.periode > 0 and maintenant - self._dernier_temps < self.periode:
+                return False
+        self._derniere_etape = etape
+        self._dernier_temps = maintenant
+        return True
+
+    def evenement(self, distance_actuelle, meilleure_distance, meilleure_solution, final=False, **details):
+        """
+        Construit un événement : les 'details' (itération, température...), les distances et,
+        si le meilleur parcours s'est amélioré depuis le dernier événement, ses modifications.
+        L'événement final contient en plus le meilleur parcours complet.
+        """
+        evenement = dict(details)
+        evenement["distance_actuelle"] = distance_actuelle
+        evenement["meilleure_distance"] = meilleure_distance
+        if meilleure_distance < self._distance_transmise:
+            evenement["amelioration"] = modifications_parcours(self._parcours_transmis, meilleure_solution)
+            self._parcours_transmis = list(meilleure_solution)
+            self._distance_transmise = meilleure_distance
+        if final:
+            evenement["termine"] = True
+            evenement["meilleure_solution"] = list(meilleure_solution)
+        return evenement
@@ -0,0 +1,477 @@
+# Fichier: recherche_locale.py
+
+import random
+from collections import deque
+
+from mouvements import (tirer_echange, delta_echange, appliquer_echange, calculer_plus_proches_voisins,
+                        calculer_positions, calculer_distance_totale)
+from structure_parcours import ParcoursDeuxNiveaux
+
+# --- Recherche Locale : 2-opt et Or-opt ---
+# - 2-opt : on retire deux arêtes et on reconnecte le parcours en inversant le segment entre elles.
+# - Or-opt : on déplace un segment de 1 à 3 villes consécutives entre deux autres villes.
+# Chaque mouvement est évalué par son delta, sans copier le parcours.
+# La recherche locale complète n'examine que les mouvements qui relient une ville à l'une
+# de ses k plus proches voisines, et utilise des "don't-look bits" : une ville n'est
+# réexaminée que si l'une de ses arêtes a changé depuis son dernier examen.
+#
+# Matrices asymétriques (ATSP, détectées par est_symetrique) : inverser un segment change le sens
+# (donc le coût) de toutes ses arêtes internes. Le delta 2-opt ajoute alors le coût de l'inversion,
+# lu en O(1) dans les sommes préfixes des coûts d'arêtes du parcours, dans les deux sens (CoutsInversion),
+# recalculées en O(n) après chaque mouvement appliqué. Les mouvements sans inversion (Or-opt, et l'échange
+# de segments "or3opt", le 3-opt qui déplace un segment sans le retourner) restent en O(1) dans tous les cas.
+#
+# Les mouvements s'appliquent aussi bien à une liste qu'à un ParcoursDeuxNiveaux
+# (voir structure_parcours.py), dont les inversions coûtent O(√n) au lieu de O(n).
+
+EPSILON = 1e-9  # Amélioration minimale pour qu'un mouvement soit appliqué (évite les boucles d'arrondi)
+LONGUEUR_MAX_OR_OPT = 3
+
+
+def est_symetrique(matrice):
+    """
+    Indique si matrice[i][j] == matrice[j][i] pour tout couple de villes.
+    Les stockages de instances.py fournissent directement cette information.
+    """
+    if hasattr(matrice, "symetrique"):
+        return matrice.symetrique
+    if hasattr(matrice, "shape"):  # Tableau NumPy
+        return bool((matrice == matrice.T).all())
+    nombre_villes = len(matrice)
+    return all(matrice[i][j] == matrice[j][i] for i in range(nombre_villes) for j in range(i + 1, nombre_villes))
+
+
+# --- Mouvement 2-opt ---
+
+def _cout_inversion(solution, matrice, debut, fin):
+    """
+    Variation du coût des arêtes internes du segment solution[debut..fin] lorsqu'on l'inverse.
+    Toujours nulle pour une matrice symétrique.
+    """
+    delta = 0
+    for k in range(debut, fin):
+        a, b = solution[k], solution[k + 1]
+        delta += matrice[b][a] - matrice[a][b]
+    return delta
+
+
+class CoutsInversion:
+    """
+    Sommes préfixes des coûts des arêtes d'un parcours, dans le sens de parcours (avant) et dans le sens
+    inverse (arriere) : avant[k] = somme des d(s_t, s_t+1) pour t < k. Le coût d'inversion d'un segment
+    s'en déduit en O(1) au lieu de O(longueur du segment). Le parcours ne doit être modifié que par des
+    mouvements suivis d'un appel à actualiser (appliquer_2opt s'en charge si on lui passe cet objet).
+    """
+
+    def __init__(self, solution, matrice):
+        self.solution = solution
+        self.matrice = matrice
+        self.avant = [0] * len(solution)
+        self.arriere = [0] * len(solution)
+        self.actualiser(solution)
+
+    def actualiser(self, solution, debut=0):
+        """
+        Recalcule les sommes à partir de la position 'debut' (les arêtes qui précèdent n'ont pas changé).
+        """
+        self.solution = solution
+        matrice = self.matrice
+        avant, arriere = self.avant, self.arriere
+        somme_avant, somme_arriere = avant[debut], arriere[debut]
+        a = solution[debut]
+        for k in range(debut + 1, len(solution)):
+            b = solution[k]
+            somme_avant += matrice[a][b]
+            somme_arriere += matrice[b][a]
+            avant[k] = somme_avant
+            arriere[k] = somme_arriere
+            a = b
+
+    def cout(self, debut, fin):
+        """
+        Même résultat que _cout_inversion(solution, matrice, debut, fin), en O(1).
+        """
+        return (self.arriere[fin] - self.arriere[debut]) - (self.avant[fin] - self.avant[debut])
+
+
+def tirer_2opt(nombre_villes, rng=random):
+    """
+    Tire au hasard un mouvement 2-opt (p, q) : les arêtes retirées sont celles qui partent
+    des positions p et q (p < q, arêtes non adjacentes).
+    """
+    while True:
+        p, q = sorted(rng.sample(range(nombre_villes), 2))
+        if q - p >= 2 and not (p == 0 and q == nombre_villes - 1):
+            return p, q
+
+
+def delta_2opt(solution, matrice, p, q, symetrique=True, couts_inversion=None):
+    """
+    Variation de distance si l'on inverse le segment solution[p+1..q] :
+    les arêtes (a, b) et (c, d) sont remplacées par (a, c) et (b, d).
+    O(1) pour une matrice symétrique ; sinon O(q - p), ou O(1) avec les CoutsInversion du parcours.
+    """
+    n = len(solution)
+    a, b = solution[p], solution[p + 1]
+    c, d = solution[q], solution[(q + 1) % n]
+    delta = matrice[a][c] + matrice[b][d] - matrice[a][b] - matrice[c][d]
+    if not symetrique:
+        if couts_inversion is not None:
+            delta += couts_inversion.cout(p + 1, q)
+        else:
+            delta += _cout_inversion(solution, matrice, p + 1, q)
+    return delta
+
+
+def appliquer_2opt(solution, p, q, positions=None, symetrique=True, couts_inversion=None):
+    """
+    Applique sur place le mouvement 2-opt (p, q).
+    Pour une matrice symétrique, on inverse le plus court des deux segments équivalents
+    (le segment lui-même ou son complémentaire), soit au plus n/2 échanges.
+    Un ParcoursDeuxNiveaux inverse le segment lui-même, en O(√n), et tient ses positions à jour.
+    Les 'couts_inversion' (optionnels, matrice asymétrique) sont recalculés à partir de la position p.
+    """
+    if isinstance(solution, ParcoursDeuxNiveaux):
+        solution.inverser(p + 1, q)
+        if couts_inversion is not None:
+            couts_inversion.actualiser(solution, p)
+        return
+    n = len(solution)
+    i, j = p + 1, q
+    longueur = j - i + 1
+    if symetrique and longueur > n // 2:
+        i, j = q + 1, p + n
+        longueur = n - longueur
+    for _ in range(longueur // 2):
+        ii, jj = i % n, j % n
+        solution[ii], solution[jj] = solution[jj], solution[ii]
+        if positions is not None:
+            positions[solution[ii]] = ii
+            positions[solution[jj]] = jj
+        i += 1
+        j -= 1
+    if couts_inversion is not None:
+        couts_inversion.actualiser(solution, p)
+
+
+def generer_2opt_candidats(solution, positions, plus_proches_voisins):
+    """
+    Génère les mouvements 2-opt (p, q) qui rendent chaque ville adjacente à l'une de ses k plus proches voisines.
+    """
+    n = len(solution)
+    for i, ville in enumerate(solution):
+        for voisine in plus_proches_voisins[ville]:
+            j = positions[voisine]
+            for p, q in ((i, j), ((i - 1) % n, (j - 1) % n)):
+                if p > q:
+                    p, q = q, p
+                if q - p >= 2 and not (p == 0 and q == n - 1):
+                    yield p, q
+
+
+# --- Mouvement Or-opt ---
+
+def tirer_or_opt(nombre_villes, rng=random):
+    """
+    Tire au hasard un mouvement Or-opt (i, longueur, j) : le segment de 'longueur' villes qui
+    commence à la position i est déplacé entre les positions j et j + 1.
+    """
+    longueur = rng.randint(1, min(LONGUEUR_MAX_OR_OPT, nombre_villes - 3))
+    i = rng.randrange(nombre_villes)
+    j = (i + longueur + rng.randrange(nombre_villes - longueur - 1)) % nombre_villes
+    return i, longueur, j
+
+
+def delta_or_opt(solution, matrice, i, longueur, j):
+    """
+    Variation de distance (en O(1)) du déplacement du segment solution[i..i+longueur-1]
+    entre solution[j] et solution[j+1], sans l'inverser (valable aussi pour une matrice asymétrique).
+    """
+    n = len(solution)
+    premiere = solution[i]
+    derniere = solution[(i + longueur - 1) % n]
+    precedente = solution[(i - 1) % n]
+    suivante = solution[(i + longueur) % n]
+    c, e = solution[j], solution[(j + 1) % n]
+    return (matrice[precedente][suivante] - matrice[precedente][premiere] - matrice[derniere][suivante]
+            + matrice[c][premiere] + matrice[derniere][e] - matrice[c][e])
+
+
+def appliquer_or_opt(solution, i, longueur, j, positions=None):
+    """
+    Applique sur place le mouvement Or-opt (i, longueur, j), en O(n).
+    Sur un ParcoursDeuxNiveaux, le déplacement est fait par trois inversions en O(√n) :
+    [segment][reste] -> [reste inversé][segment inversé] -> [reste][segment],
+    ce qui préserve le sens de parcours de chaque partie (matrices asymétriques comprises).
+    """
+    n = len(solution)
+    if isinstance(solution, ParcoursDeuxNiveaux):
+        premiere, derniere = solution[i], solution[(i + longueur - 1) % n]
+        debut_reste, fin_reste = solution[(i + longueur) % n], solution[j]
+        solution.inverser(solution.position(premiere), solution.position(fin_reste))
+        solution.inverser(solution.position(fin_reste), solution.position(debut_reste))
+        solution.inverser(solution.position(derniere), solution.position(premiere))
+        return
+    segment = [solution[(i + k) % n] for k in range(longueur)]
+    ville_avant = solution[j]
+    reste = [ville for k, ville in enumerate(solution) if (k - i) % n >= longueur]
+    index = reste.index(ville_avant) + 1
+    solution[:] = reste[:index] + segment + reste[index:]
+    if positions is not None:
+        for position, ville in enumerate(solution):
+            positions[ville] = position
+
+
+def _or_opt_valide(n, i, longueur, j):
+    """
+    Le point d'insertion ne doit être ni dans le segment, ni juste avant lui.
+    """
+    return (j - i) % n >= longueur and (j - i) % n != n - 1
+
+
+def generer_or_opt_candidats(solution, positions, plus_proches_voisins):
+    """
+    Génère les mouvements Or-opt (i, longueur, j) qui insèrent un segment commençant à une ville
+    juste avant ou juste après l'une de ses k plus proches voisines.
+    """
+    n = len(solution)
+    for i, ville in enumerate(solution):
+        for longueur in range(1, min(LONGUEUR_MAX_OR_OPT, n - 3) + 1):
+            for voisine in plus_proches_voisins[ville]:
+                position_voisine = positions[voisine]
+                for j in (position_voisine, (position_voisine - 1) % n):
+                    if _or_opt_valide(n, i, longueur, j):
+                        yield i, longueur, j
+
+
+# --- Échange de Segments (3-opt sans inversion, "or3opt") ---
+
+def tirer_or3opt(nombre_villes, rng=random):
+    """
+    Tire au hasard un échange de segments (i, j, k), 0 <= i < j < k < n : les segments consécutifs
+    solution[i+1..j] et solution[j+1..k] échangent leurs places. C'est le seul 3-opt pur qui ne retourne
+    aucun segment : il généralise Or-opt à des segments de toute longueur.
+    """
+    i, j, k = sorted(rng.sample(range(nombre_villes), 3))
+    return i, j, k
+
+
+def delta_or3opt(solution, matrice, i, j, k):
+    """
+    Variation de distance (en O(1)) de l'échange de segments (i, j, k) : les arêtes
+    (s_i, s_i+1), (s_j, s_j+1), (s_k, s_k+1) sont remplacées par (s_i, s_j+1), (s_k, s_i+1), (s_j, s_k+1).
+    Aucune arête n'est parcourue à l'envers : valable pour une matrice asymétrique.
+    """
+    n = len(solution)
+    a, b = solution[i], solution[i + 1]
+    c, d = solution[j], solution[j + 1]
+    e, f = solution[k], solution[(k + 1) % n]
+    return matrice[a][d] + matrice[e][b] + matrice[c][f] - matrice[a][b] - matrice[c][d] - matrice[e][f]
+
+
+def appliquer_or3opt(solution, i, j, k, positions=None):
+    """
+    Applique sur place l'échange de segments (i, j, k), en O(k - i).
+    """
+    solution[i + 1:k + 1] = solution[j + 1:k + 1] + solution[i + 1:j + 1]
+    if positions is not None:
+        for position in range(i + 1, k + 1):
+            positions[solution[position]] = position
+
+
+# --- Mutation par Déplacement de Segments (Algorithmes Génétiques) ---
+
+OPERATEURS_MUTATION = ("echange", "oropt")
+
+
+def mutation_or_opt(solution, taux_mutation, rng=random):
+    """
+    Mutation sans inversion : chaque position i est, avec la probabilité 'taux_mutation', le début d'un
+    segment de 1 à 3 villes déplacé (dans le même sens) à une position tirée au hasard.
+    Contrairement à l'échange, le mouvement ne modifie que trois arêtes et garde leur sens (matrices asymétriques).
+    """
+    solution_mutee = solution[:]
+    n = len(solution_mutee)
+    if n < 4:
+        return solution_mutee
+    for i in range(n):
+        if rng.random() < taux_mutation:
+            longueur = rng.randint(1, min(LONGUEUR_MAX_OR_OPT, n - i))
+            segment = solution_mutee[i:i + longueur]
+            del solution_mutee[i:i + longueur]
+            j = rng.randint(0, len(solution_mutee))
+            solution_mutee[j:j] = segment
+    return solution_mutee
+
+
+# --- Types de Mouvements pour les Métaheuristiques ---
+
+TYPES_MOUVEMENT = ("echange", "2opt", "oropt", "or3opt")
+
+
+def fonctions_mouvement(type_mouvement, symetrique=True):
+    """
+    Retourne le triplet (tirer, evaluer, appliquer) d'un type de mouvement :
+    - tirer(nombre_villes, rng) -> mouvement (tuple) ;
+    - evaluer(solution, matrice, *mouvement) -> delta ;
+    - appliquer(solution, *mouvement) -> None (sur place).
+    Pour le 2-opt sur une matrice asymétrique, les fonctions partagent des CoutsInversion, construits
+    pour la solution reçue (et reconstruits si l'on passe une autre liste) : le parcours ne doit
+    alors être modifié que par 'appliquer'.
+    """
+    if type_mouvement == "echange":
+        return tirer_echange, delta_echange, appliquer_echange
+    if type_mouvement == "2opt":
+        if symetrique:
+            def evaluer(solution, matrice, p, q):
+                return delta_2opt(solution, matrice, p, q)
+
+            def appliquer(solution, p, q):
+                appliquer_2opt(solution, p, q)
+
+            return tirer_2opt, evaluer, appliquer
+
+        couts = [None]
+
+        def evaluer(solution, matrice, p, q):
+            if couts[0] is None or couts[0].solution is not solution:
+                couts[0] = CoutsInversion(solution, matrice)
+            return delta_2opt(solution, matrice, p, q, False, couts[0])
+
+        def appliquer(solution, p, q):
+            if couts[0] is not None and couts[0].solution is not solution:
+                couts[0] = None  # Sommes d'un autre parcours : reconstruites à la prochaine évaluation
+            appliquer_2opt(solution, p, q, None, False, couts[0])
+
+        return tirer_2opt, evaluer, appliquer
+    if type_mouvement == "oropt":
+        return tirer_or_opt, delta_or_opt, appliquer_or_opt
+    if type_mouvement == "or3opt":
+        return tirer_or3opt, delta_or3opt, appliquer_or3opt
+    raise ValueError(f"Type de mouvement inconnu : {type_mouvement}")
+
+
+# --- Recherche Locale avec Listes de Voisins et Don't-Look Bits ---
+
+def _ameliorer_2opt(ville, parcours, positions, matrice, plus_proches_voisins, symetrique, couts_inversion=None):
+    """
+    Cherche un mouvement 2-opt améliorant qui relie 'ville' à l'une de ses voisines.
+    Retourne les villes dont les arêtes ont changé, ou None.
+    """
+    n = len(parcours)
+    i = positions[ville]
+    for sens in (1, -1):
+        autre = parcours[(i + sens) % n]
+        cout_actuel = matrice[ville][autre] if sens == 1 else matrice[autre][ville]
+        for voisine in plus_proches_voisins[ville]:
+            # Les voisines sont triées : au-delà, la nouvelle arête coûte plus que celle retirée
+            if (matrice[ville][voisine] if sens == 1 else matrice[voisine][ville]) >= cout_actuel:
+                break
+            j = positions[voisine]
+            p, q = (i, j) if sens == 1 else ((i - 1) % n, (j - 1) % n)
+            if p > q:
+                p, q = q, p
+            if q - p < 2 or (p == 0 and q == n - 1):
+                continue
+            if delta_2opt(parcours, matrice, p, q, symetrique, couts_inversion) < -EPSILON:
+                touchees = [parcours[p], parcours[p + 1], parcours[q], parcours[(q + 1) % n]]
+                appliquer_2opt(parcours, p, q, positions, symetrique, couts_inversion)
+                return touchees
+    return None
+
+
+def _ameliorer_or_opt(ville, parcours, positions, matrice, plus_proches_voisins, couts_inversion=None):
+    """
+    Cherche un mouvement Or-opt améliorant : un segment qui commence à 'ville' est inséré
+    juste avant ou juste après l'une de ses voisines. Retourne les villes touchées, ou None.
+    """
+    n = len(parcours)
+    i = positions[ville]
+    for longueur in range(1, min(LONGUEUR_MAX_OR_OPT, n - 3) + 1):
+        for voisine in plus_proches_voisins[ville]:
+            position_voisine = positions[voisine]
+            for j in (position_voisine, (position_voisine - 1) % n):
+                if not _or_opt_valide(n, i, longueur, j):
+                    continue
+                if delta_or_opt(parcours, matrice, i, longueur, j) < -EPSILON:
+                    touchees = [parcours[(i - 1) % n], parcours[i], parcours[(i + longueur - 1) % n],
+                                parcours[(i + longueur) % n], parcours[j], parcours[(j + 1) % n]]
+                    appliquer_or_opt(parcours, i, longueur, j, positions)
+                    if couts_inversion is not None:
+                        couts_inversion.actualiser(parcours)
+                    return touchees
+    return None
+
+
+def recherche_locale(solution, matrice, plus_proches_voisins=None, k_voisins=8, voisinages=("2opt", "oropt"),
+                     symetrique=None, structure="liste", villes_a_examiner=None):
+    """
+    Améliore une solution par 2-opt et Or-opt jusqu'à un optimum local.
+    Retourne (solution_amelioree, distance) ; la solution d'entrée n'est pas modifiée.
+    Les listes de voisins et la symétrie peuvent être fournies pour éviter de les recalculer
+    à chaque appel (par exemple dans un algorithme mémétique).
+    'structure' : "liste" (par défaut) ou "deux_niveaux" (ParcoursDeuxNiveaux, pour les grandes instances).
+    'villes_a_examiner' (optionnel) : les seules villes examinées au départ (par défaut, toutes) ;
+    les autres ne le sont que si l'une de leurs arêtes change. Utile pour réparer localement
+    un parcours déjà bon ailleurs.
+    """
+    parcours = solution[:]
+    nombre_villes = len(parcours)
+    if nombre_villes < 5:
+        return parcours, calculer_distance_totale(parcours, matrice)
+    if plus_proches_voisins is None:
+        plus_proches_voisins = calculer_plus_proches_voisins(matrice, k_voisins)
+    if symetrique is None:
+        symetrique = est_symetrique(matrice)
+    if structure == "deux_niveaux":
+        parcours = ParcoursDeuxNiveaux(parcours)
+        positions = parcours.positions
+    elif structure == "liste":
+        positions = calculer_positions(parcours)
+    else:
+        raise ValueError(f"Structure de parcours inconnue : {structure}")
+    # Matrice asymétrique : coûts d'inversion en O(1) pour le 2-opt
+    couts_inversion = CoutsInversion(parcours, matrice) if not symetrique and "2opt" in voisinages else None
+
+    # File des villes à examiner : une ville hors de la file a son "don't-look bit" levé
+    if villes_a_examiner is None:
+        file_villes = deque(parcours)
+        dans_file = [True] * nombre_villes
+    else:
+        file_villes = deque(dict.fromkeys(villes_a_examiner))
+        dans_file = [False] * nombre_villes
+        for ville in file_villes:
+            dans_file[ville] = True
+    while file_villes:
+        ville = file_villes.popleft()
+        dans_file[ville] = False
+
+        touchees = None
+        if "2opt" in voisinages:
+            touchees = _ameliorer_2opt(ville, parcours, positions, matrice, plus_proches_voisins, symetrique,
+                                       couts_inversion)
+        if touchees is None and "oropt" in voisinages:
+            touchees = _ameliorer_or_opt(ville, parcours, positions, matrice, plus_proches_voisins, couts_inversion)
+
+        # Les extrémités des arêtes modifiées (et la ville elle-même) sont réexaminées
+        if touchees is not None:
+            for autre in touchees + [ville]:
+                if not dans_file[autre]:
+                    dans_file[autre] = True
+                    file_villes.append(autre)
+
+    parcours = list(parcours)
+    return parcours, calculer_distance_totale(parcours, matrice)
+
+
+# --- Bloc d'Exécution ---
+
+if __name__ == "__main__":
+    from algorithme_recuit_simulé import matrice_distances
+
+    depart = list(range(len(matrice_distances)))
+    random.shuffle(depart)
+    solution, distance = recherche_locale(depart, matrice_distances)
+    print(f"Solution de départ: {depart} (distance {calculer_distance_totale(depart, matrice_distances)})")
+    print(f"Optimum local (2-opt + Or-opt): {solution}")
+    print(f"Distance minimale: {distance}")
@@ -0,0 +1,193 @@
+# Fichier: recuit_parallele.py
+
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithme_recuit_simulé import calculer_distance_totale, palier_recuit
+from memoire_partagee import creer_matrice_partagee, initialiser_travailleur, matrice_travailleur
+
+# --- Recuit Simulé Parallèle ---
+# Deux façons d'exécuter plusieurs chaînes de recuit sur plusieurs cœurs :
+# - multi-départ : N chaînes indépendantes, chacune depuis sa propre solution aléatoire ;
+# - parallel tempering (échange de répliques) : N chaînes à températures fixes et étagées,
+#   qui échangent périodiquement leurs solutions entre températures voisines.
+# Chaque chaîne possède son propre générateur aléatoire, dérivé de la graine : le résultat
+# est reproductible et ne dépend pas du nombre de processus.
+# La matrice est placée une seule fois en mémoire partagée (voir memoire_partagee.py).
+
+
+# --- Tâches Exécutées dans les Processus du Pool ---
+
+def _executer_chaine(graine, temperature_initiale, taux_refroidissement, iterations_max, intervalle_trace):
+    """
+    Exécute une chaîne de recuit complète depuis une solution aléatoire.
+    La trace contient (iteration, distance_actuelle, meilleure_distance) toutes les 'intervalle_trace' itérations.
+    """
+    rng = random.Random(graine)
+    matrice = matrice_travailleur()
+    solution = list(range(len(matrice)))
+    rng.shuffle(solution)
+    distance = calculer_distance_totale(solution, matrice)
+    meilleure_solution, meilleure_distance = solution[:], distance
+
+    trace = [(0, distance, meilleure_distance)]
+    temperature = temperature_initiale
+    iterations_faites = 0
+    while iterations_faites < iterations_max:
+        iterations = min(intervalle_trace, iterations_max - iterations_faites)
+        distance, temperature, solution_palier, distance_palier = palier_recuit(
+            solution, distance, matrice, temperature, taux_refroidissement, iterations, rng
+        )
+        iterations_faites += iterations
+        if distance_palier < meilleure_distance:
+            meilleure_solution, meilleure_distance = solution_palier, distance_palier
+        trace.append((iterations_faites, distance, meilleure_distance))
+    return meilleure_solution, meilleure_distance, trace
+
+
+def _executer_replique(solution, distance, temperature, iterations, etat_rng):
+    """
+    Exécute 'iterations' itérations d'une réplique à température fixe.
+    L'état du générateur aléatoire fait l'aller-retour avec la tâche pour que la chaîne soit reproductible.
+    """
+    rng = random.Random()
+    rng.setstate(etat_rng)
+    distance, _, meilleure_solution, meilleure_distance = palier_recuit(
+        solution, distance, matrice_travailleur(), temperature, 1.0, iterations, rng
+    )
+    return solution, distance, meilleure_solution, meilleure_distance, rng.getstate()
+
+
+def _creer_pool(matrice, nombre_processus):
+    """
+    Place la matrice en mémoire partagée et crée le pool de processus qui s'y attachent.
+    """
+    memoire, format_valeurs = creer_matrice_partagee(matrice)
+    pool = ProcessPoolExecutor(max_workers=nombre_processus, initializer=initialiser_travailleur,
+                               initargs=(memoire.name, len(matrice), format_valeurs))
+    return memoire, pool
+
+
+# --- Multi-Départ ---
+
+def recuit_multi_depart(matrice, nombre_chaines, temperature_initiale, taux_refroidissement, iterations_max,
+                        graine=None, nombre_processus=None, intervalle_trace=1000):
+    """
+    Lance 'nombre_chaines' recuits indépendants en parallèle et retourne le meilleur.
+    Retourne (meilleure_solution, meilleure_distance, chaines), où chaque élément de 'chaines'
+    décrit une chaîne : sa graine, sa meilleure distance et sa trace.
+    """
+    generateur = random.Random(graine)
+    graines = [generateur.getrandbits(64) for _ in range(nombre_chaines)]
+
+    memoire, pool = _creer_pool(matrice, nombre_processus)
+    try:
+        with pool:
+            taches = [pool.submit(_executer_chaine, graine_chaine, temperature_initiale, taux_refroidissement,
+                                  iterations_max, intervalle_trace)
+                      for graine_chaine in graines]
+            resultats = [tache.result() for tache in taches]
+    finally:
+        memoire.close()
+        memoire.unlink()
+
+    meilleure_solution, meilleure_distance = None, float('inf')
+    chaines = []
+    for graine_chaine, (solution, distance, trace) in zip(graines, resultats):
+        chaines.append({"graine": graine_chaine, "meilleure_distance": distance, "trace": trace})
+        if distance < meilleure_distance:
+            meilleure_solution, meilleure_distance = solution, distance
+    return meilleure_solution, meilleure_distance, chaines
+
+
+# --- Parallel Tempering (Échange de Répliques) ---
+
+def temperatures_geometriques(temperature_min, temperature_max, nombre_repliques):
+    """
+    Échelonne les températures des répliques selon une progression géométrique.
+    """
+    if nombre_repliques == 1:
+        return [temperature_min]
+    raison = (temperature_max / temperature_min) ** (1.0 / (nombre_repliques - 1))
+    return [temperature_min * raison ** k for k in range(nombre_repliques)]
+
+
+def recuit_parallel_tempering(matrice, nombre_repliques, temperature_min, temperature_max, iterations_par_echange,
+                              nombre_echanges, graine=None, nombre_processus=None):
+    """
+    Recuit par échange de répliques : chaque réplique reste à sa température et effectue
+    'iterations_par_echange' itérations par tour ; entre deux tours, les répliques voisines
+    (alternativement les paires paires et impaires) échangent leurs solutions avec la probabilité
+    min(1, exp((1/T_i - 1/T_j) * (E_i - E_j))).
+    Retourne (meilleure_solution, meilleure_distance, chaines), une entrée par température.
+    """
+    generateur = random.Random(graine)
+    temperatures = temperatures_geometriques(temperature_min, temperature_max, nombre_repliques)
+    nombre_villes = len(matrice)
+
+    # 1. Une solution aléatoire et un générateur propre à chaque réplique
+    solutions, distances, etats_rng = [], [], []
+    for _ in range(nombre_repliques):
+        rng = random.Random(generateur.getrandbits(64))
+        solution = list(range(nombre_villes))
+        rng.shuffle(solution)
+        solutions.append(solution)
+        distances.append(calculer_distance_totale(solution, matrice))
+        etats_rng.append(rng.getstate())
+
+    meilleure_index = min(range(nombre_repliques), key=distances.__getitem__)
+    meilleure_solution, meilleure_distance = solutions[meilleure_index][:], distances[meilleure_index]
+    chaines = [{"temperature": temperature, "meilleure_distance": distances[k], "echanges_acceptes": 0,
+                "trace": [(0, distances[k], distances[k])]}
+               for k, temperature in enumerate(temperatures)]
+
+    memoire, pool = _creer_pool(matrice, nombre_processus)
+    try:
+        with pool:
+            for tour in range(nombre_echanges):
+                # 2. Chaque réplique avance à sa température, en parallèle
+                taches = [pool.submit(_executer_replique, solutions[k], distances[k], temperatures[k],
+                                      iterations_par_echange, etats_rng[k])
+                          for k in range(nombre_repliques)]
+                for k, tache in enumerate(taches):
+                    solutions[k], distances[k], solution_k, distance_k, etats_rng[k] = tache.result()
+                    chaine = chaines[k]
+                    chaine["meilleure_distance"] = min(chaine["meilleure_distance"], distance_k)
+                    chaine["trace"].append(((tour + 1) * iterations_par_echange, distances[k],
+                                            chaine["meilleure_distance"]))
+                    if distance_k < meilleure_distance:
+                        meilleure_solution, meilleure_distance = solution_k, distance_k
+
+                # 3. Échanges entre températures voisines (critère de Metropolis sur la paire)
+                for k in range(tour % 2, nombre_repliques - 1, 2):
+                    exposant = (1.0 / temperatures[k] - 1.0 / temperatures[k + 1]) * (distances[k] - distances[k + 1])
+                    if exposant >= 0 or generateur.random() < math.exp(exposant):
+                        solutions[k], solutions[k + 1] = solutions[k + 1], solutions[k]
+                        distances[k], distances[k + 1] = distances[k + 1], distances[k]
+                        chaines[k]["echanges_acceptes"] += 1
+    finally:
+        memoire.close()
+        memoire.unlink()
+
+    return meilleure_solution, meilleure_distance, chaines
+
+
+# --- Bloc d'Exécution ---
+
+if __name__ == "__main__":
+    from algorithme_recuit_simulé import matrice_distances
+
+    solution, distance, chaines = recuit_multi_depart(
+        matrice_distances, nombre_chaines=4, temperature_initiale=10000, taux_refroidissement=0.9995,
+        iterations_max=20000, graine=42
+    )
+    print(f"Meilleure solution trouvée (Recuit Multi-Départ): {solution}")
+    print(f"Distance minimale: {distance}")
+
+    solution, distance, chaines = recuit_parallel_tempering(
+        matrice_distances, nombre_repliques=4, temperature_min=0.5, temperature_max=20,
+        iterations_par_echange=500, nombre_echanges=40, graine=42
+    )
+    print(f"Meilleure solution trouvée (Parallel Tempering): {solution}")
+    print(f"Distance minimale: {distance}")
@@ -0,0 +1,225 @@
+# Fichier: refroidissement.py
+
+import math
+import random
+
+from recherche_locale import est_symetrique, fonctions_mouvement
+
+# --- Programmes de Refroidissement du Recuit Simulé ---
+# Par défaut, recuit_simule multiplie la température par 'taux_refroidissement' à chaque itération.
+# Un programme de refroidissement, passé en paramètre 'refroidissement', procède par paliers :
+# la température reste fixe pendant un palier de L mouvements (L proportionnel au nombre de villes,
+# pour que chaque ville soit concernée par quelques mouvements à chaque température), puis le
+# programme choisit la température du palier suivant à partir de ce qui s'y est passé
+# (taux d'acceptation, amélioration de la meilleure distance). Programmes disponibles :
+# - RefroidissementGeometrique : T <- alpha * T à chaque palier ;
+# - RefroidissementLundyMees : T <- T / (1 + beta * T) (Lundy et Mees, 1986) ;
+# - RefroidissementAdaptatif : ajuste T pour suivre un taux d'acceptation cible décroissant ;
+# - RechauffageStagnation : enveloppe un autre programme et réchauffe quand la recherche stagne.
+# Les coefficients (alpha, beta) sont déduits du budget : on passe de la température initiale
+# à la température finale en exactement le nombre de paliers que permet 'iterations_max'.
+# La température initiale peut être calibrée sur l'instance (calibrer_temperature).
+
+# Au-delà de delta / T = 53 ln 2, exp(-delta / T) < 2^-53 : plus petit que le plus petit tirage
+# non nul de random(), le mouvement ne peut pas être accepté (l'exponentielle est inutile)
+SEUIL_ACCEPTATION = 53 * math.log(2)
+
+
+def calibrer_temperature(matrice, taux_acceptation=0.5, echantillon=1000, type_mouvement="echange", solution=None,
+                         rng=random):
+    """
+    Température initiale pour laquelle un mouvement dégradant moyen est accepté avec la probabilité
+    'taux_acceptation' : T0 = -moyenne(deltas positifs) / ln(taux_acceptation).
+    Les deltas sont ceux de 'echantillon' mouvements tirés au hasard depuis 'solution'
+    (un parcours aléatoire par défaut).
+    """
+    nombre_villes = len(matrice)
+    if solution is None:
+        solution = list(range(nombre_villes))
+        rng.shuffle(solution)
+    if type_mouvement != "echange" and nombre_villes < 5:
+        type_mouvement = "echange"
+    symetrique = est_symetrique(matrice) if type_mouvement == "2opt" else True
+    tirer_mouvement, evaluer_mouvement, _ = fonctions_mouvement(type_mouvement, symetrique)
+
+    deltas = []
+    for _ in range(echantillon):
+        delta = evaluer_mouvement(solution, matrice, *tirer_mouvement(nombre_villes, rng))
+        if delta > 0:
+            deltas.append(delta)
+    if not deltas:
+        return 1.0
+    return -(sum(deltas) / len(deltas)) / math.log(taux_acceptation)
+
+
+# --- Programmes de Refroidissement ---
+
+class Refroidissement:
+    """
+    Base des programmes de refroidissement par paliers.
+    'facteur_palier' : longueur d'un palier, en nombre de mouvements par ville.
+    'temperature_finale' : température visée au dernier palier (par défaut, T0 * rapport_final).
+    """
+    rapport_final = 1e-3
+
+    def __init__(self, facteur_palier=1.0, temperature_finale=None):
+        self.facteur_palier = facteur_palier
+        self.temperature_finale = temperature_finale
+
+    def longueur_palier(self, nombre_villes):
+        return max(1, round(self.facteur_palier * nombre_villes))
+
+    def demarrer(self, temperature_initiale, nombre_paliers):
+        """
+        Appelée au début de l'exécution, avec le nombre de paliers que permet le budget d'itérations.
+        """
+        self.temperature_initiale = temperature_initiale
+        self.nombre_paliers = max(1, nombre_paliers)
+        self.temperature_cible = self.temperature_finale or temperature_initiale * self.rapport_final
+
+    def suivante(self, temperature, palier, taux_acceptation, amelioration):
+        """
+        Température du palier suivant, connaissant le palier qui vient de se terminer (numéroté depuis 1),
+        son taux d'acceptation et s'il a amélioré la meilleure distance.
+        """
+        raise NotImplementedError
+
+    def etat(self):
+        """
+        État interne à sauvegarder avec un point de reprise (nombres uniquement).
+        """
+        return {}
+
+    def restaurer(self, etat):
+        pass
+
+
+class RefroidissementGeometrique(Refroidissement):
+    """
+    T <- alpha * T à chaque palier ; alpha est déduit du budget si 'alpha' n'est pas fixé.
+    """
+
+    def __init__(self, alpha=None, facteur_palier=1.0, temperature_finale=None):
+        super().__init__(facteur_palier, temperature_finale)
+        self.alpha = alpha
+
+    def demarrer(self, temperature_initiale, nombre_paliers):
+        super().demarrer(temperature_initiale, nombre_paliers)
+        self._alpha = self.alpha or (self.temperature_cible / temperature_initiale) ** (1.0 / self.nombre_paliers)
+
+    def suivante(self, temperature, palier, taux_acceptation, amelioration):
+        return temperature * self._alpha
+
+
+class RefroidissementLundyMees(Refroidissement):
+    """
+    T <- T / (1 + beta * T) à chaque palier (Lundy et Mees) : la décroissance est rapide aux hautes
+    températures et lente aux basses, où se joue la qualité finale.
+    beta = (T0 - Tf) / (K * T0 * Tf) amène de T0 à Tf en K paliers. La température passant l'essentiel
+    des paliers près de Tf, celle-ci est par défaut plus haute que pour le refroidissement géométrique.
+    """
+    rapport_final = 1e-2
+
+    def __init__(self, beta=None, facteur_palier=1.0, temperature_finale=None):
+        super().__init__(facteur_palier, temperature_finale)
+        self.beta = beta
+
+    def demarrer(self, temperature_initiale, nombre_paliers):
+        super().demarrer(temperature_initiale, nombre_paliers)
+        self._beta = self.beta or ((temperature_initiale - self.temperature_cible)
+                                   / (self.nombre_paliers * temperature_initiale * self.temperature_cible))
+
+    def suivante(self, temperature, palier, taux_acceptation, amelioration):
+        return temperature / (1.0 + self._beta * temperature)
+
+
+class RefroidissementAdaptatif(Refroidissement):
+    """
+    Suit un taux d'acceptation cible qui décroît géométriquement de 'acceptation_initiale' à
+    'acceptation_finale' au fil des paliers : après chaque palier, T est multipliée par
+    (cible / taux obtenu) ** gain, facteur borné à [1 / 'correction_max', 'correction_max'].
+    La température s'ajuste ainsi d'elle-même à l'échelle des distances de l'instance.
+    """
+
+    def __init__(self, acceptation_initiale=0.5, acceptation_finale=0.001, gain=0.5, correction_max=1.5,
+                 facteur_palier=1.0):
+        super().__init__(facteur_palier)
+        self.acceptation_initiale = acceptation_initiale
+        self.acceptation_finale = acceptation_finale
+        self.gain = gain
+        self.correction_max = correction_max
+
+    def suivante(self, temperature, palier, taux_acceptation, amelioration):
+        avancement = min(1.0, palier / self.nombre_paliers)
+        cible = self.acceptation_initiale * (self.acceptation_finale / self.acceptation_initiale) ** avancement
+        if taux_acceptation == 0:
+            return temperature * self.correction_max  # Aucune acceptation : la température est trop basse
+        correction = (cible / taux_acceptation) ** self.gain
+        return temperature * min(max(correction, 1.0 / self.correction_max), self.correction_max)
+
+
+class RechauffageStagnation(Refroidissement):
+    """
+    Enveloppe un programme de refroidissement ('base', Lundy-Mees par défaut) : quand la recherche est
+    figée (taux d'acceptation du palier sous 'acceptation_gel') et n'a pas amélioré la meilleure distance
+    depuis 'paliers_stagnation' paliers, la température remonte à 'facteur_rechauffage' fois celle du
+    palier de la dernière amélioration (sans dépasser la température initiale), puis le programme
+    de base reprend. Aux hautes températures, la meilleure distance stagne sans que la recherche
+    soit bloquée : le taux d'acceptation y est élevé et aucun réchauffage n'a lieu.
+    """
+
+    def __init__(self, base=None, paliers_stagnation=50, facteur_rechauffage=2.0, acceptation_gel=0.02):
+        self.base = base if base is not None else RefroidissementLundyMees()
+        super().__init__(self.base.facteur_palier, self.base.temperature_finale)
+        self.paliers_stagnation = paliers_stagnation
+        self.facteur_rechauffage = facteur_rechauffage
+        self.acceptation_gel = acceptation_gel
+
+    def longueur_palier(self, nombre_villes):
+        return self.base.longueur_palier(nombre_villes)
+
+    def demarrer(self, temperature_initiale, nombre_paliers):
+        super().demarrer(temperature_initiale, nombre_paliers)
+        self.base.demarrer(temperature_initiale, nombre_paliers)
+        self.rechauffages = 0
+        self._palier_amelioration = 0
+        self._temperature_amelioration = temperature_initiale
+
+    def suivante(self, temperature, palier, taux_acceptation, amelioration):
+        if amelioration:
+            self._palier_amelioration = palier
+            self._temperature_amelioration = temperature
+        elif (palier - self._palier_amelioration >= self.paliers_stagnation
+              and taux_acceptation < self.acceptation_gel):
+            self.rechauffages += 1
+            self._palier_amelioration = palier
+            return min(self.temperature_initiale, self.facteur_rechauffage * self._temperature_amelioration)
+        return self.base.suivante(temperature, palier, taux_acceptation, amelioration)
+
+    def etat(self):
+        return {"rechauffages": self.rechauffages, "palier_amelioration": self._palier_amelioration,
+                "temperature_amelioration": self._temperature_amelioration}
+
+    def restaurer(self, etat):
+        self.rechauffages = int(etat["rechauffages"])
+        self._palier_amelioration = int(etat["palier_amelioration"])
+        self._temperature_amelioration = float(etat["temperature_amelioration"])
+
+
+PROGRAMMES = {
+    "geometrique": RefroidissementGeometrique,
+    "lundy_mees": RefroidissementLundyMees,
+    "adaptatif": RefroidissementAdaptatif,
+    "rechauffage": RechauffageStagnation,
+}
+
+
+def obtenir_refroidissement(refroidissement):
+    """
+    Accepte un programme de refroidissement ou son nom (voir PROGRAMMES, paramètres par défaut).
+    """
+    if isinstance(refroidissement, str):
+        if refroidissement not in PROGRAMMES:
+            raise ValueError(f"Programme de refroidissement inconnu : {refroidissement}")
+        return PROGRAMMES[refroidissement]()
+    return refroidissement
@@ -0,0 +1,491 @@
+# Fichier: reoptimisation.py
+
+import heapq
+import math
+import random
+import time
+
+import numpy as np
+
+from mouvements import calculer_plus_proches_voisins, calculer_distance_totale
+from recherche_locale import (recherche_locale, est_symetrique, delta_or_opt, appliquer_or_opt,
+                              LONGUEUR_MAX_OR_OPT)
+from structure_parcours import ParcoursDeuxNiveaux
+from construction import construire_parcours
+from instances import InstanceTSP, creer_matrice, distances_coordonnees, type_stockage
+
+# --- Réoptimisation Incrémentale d'une Instance Dynamique ---
+# Les arrêts d'une tournée changent au cours de la journée : villes ajoutées ou retirées, temps de trajet
+# modifiés. Plutôt que de relancer un algorithme depuis une permutation aléatoire sur une nouvelle matrice,
+# une InstanceDynamique garde la matrice, le meilleur parcours et les listes de plus proches voisines,
+# et les met à jour modification par modification :
+# - une ville ajoutée est insérée au moindre coût (insertion la moins chère) à côté de l'une de ses
+#   plus proches voisines ; une ville retirée est court-circuitée ;
+# - les listes de voisines ne sont recalculées que pour les villes concernées par la modification ;
+# - la réoptimisation ne part que des villes touchées (recherche locale à "don't-look bits", voir
+#   recherche_locale.py), éventuellement précédée d'une courte rafale de recuit simulé autour d'elles.
+# Une modification de c villes coûte O(c·n) (une ligne et une colonne de la matrice), au lieu de O(n²)
+# pour reconstruire la matrice et les listes de voisines puis tout résoudre à nouveau.
+#
+# Les villes sont désignées par des étiquettes (identifiants d'arrêts) : les indices de la matrice restent
+# contigus (0..n-1), la dernière ville prenant l'indice d'une ville retirée, si bien que 'matrice' et
+# 'solution' peuvent être passées telles quelles aux autres algorithmes (voir solution_initiale de tabu_search).
+
+TAUX_ACCEPTATION_RAFALE = 0.05  # Probabilité d'accepter un mouvement dégradant moyen au début d'une rafale
+TYPES_MODIFICATION = ("ajouter", "supprimer", "distance", "distances")
+
+
+def _copier_matrice(matrice):
+    """
+    Copie modifiable (liste de listes de nombres Python) de n'importe quel stockage de matrice.
+    """
+    return [ligne.tolist() if hasattr(ligne, "tolist") else list(ligne) for ligne in matrice]
+
+
+class InstanceDynamique:
+    """
+    Instance du TSP modifiable, avec son meilleur parcours.
+    - 'solution' : parcours de départ (indices) ; par défaut, construction gloutonne suivie d'une recherche locale ;
+    - 'etiquettes' : identifiants des villes (par défaut 0..n-1) ;
+    - 'coordonnees' et 'type_distance' (optionnels) : permettent d'ajouter ou de déplacer une ville
+      en ne donnant que sa position (voir instances.distances_coordonnees).
+    Attributs : 'matrice', 'solution' (indices), 'distance', 'etiquettes', 'symetrique', 'voisins'.
+    """
+
+    def __init__(self, matrice, solution=None, etiquettes=None, k_voisins=8, coordonnees=None,
+                 type_distance="EUC_2D"):
+        self.symetrique = est_symetrique(matrice)
+        self.voisins = [list(liste) for liste in calculer_plus_proches_voisins(matrice, k_voisins)]
+        self.matrice = _copier_matrice(matrice)
+        nombre_villes = len(self.matrice)
+        self.k_voisins = k_voisins
+        self.etiquettes = list(range(nombre_villes)) if etiquettes is None else list(etiquettes)
+        self._indices = {etiquette: index for index, etiquette in enumerate(self.etiquettes)}
+        if len(self._indices) != nombre_villes:
+            raise ValueError("Les étiquettes des villes doivent être distinctes et une par ville")
+        self._prochaine_etiquette = nombre_villes
+        self.coordonnees = None if coordonnees is None else [tuple(point) for point in coordonnees]
+        self.type_distance = type_distance
+
+        # Index inverse des listes de voisines : _inverses[v] = villes dont la liste contient v
+        self._inverses = [set() for _ in range(nombre_villes)]
+        for ville, liste in enumerate(self.voisins):
+            for voisine in liste:
+                self._inverses[voisine].add(ville)
+
+        if solution is None:
+            solution = construire_parcours(self.matrice) if nombre_villes > 2 else list(range(nombre_villes))
+            solution, _ = recherche_locale(solution, self.matrice, self.voisins, symetrique=self.symetrique)
+        self.solution = list(solution)
+        self.distance = calculer_distance_totale(self.solution, self.matrice) if self.solution else 0
+        self._region = set()
+
+    def __len__(self):
+        return len(self.matrice)
+
+    def parcours(self):
+        """
+        Meilleur parcours courant, en étiquettes.
+        """
+        return [self.etiquettes[ville] for ville in self.solution]
+
+    def index(self, etiquette):
+        if etiquette not in self._indices:
+            raise KeyError(f"Ville inconnue : {etiquette}")
+        return self._indices[etiquette]
+
+    # --- Listes de Voisines ---
+
+    def _calculer_voisins(self, ville):
+        ligne = self.matrice[ville]
+        proches = heapq.nsmallest(self.k_voisins + 1, range(len(ligne)), key=ligne.__getitem__)
+        return [autre for autre in proches if autre != ville][:self.k_voisins]
+
+    def _fixer_voisins(self, ville, liste):
+        for voisine in self.voisins[ville]:
+            self._inverses[voisine].discard(ville)
+        for voisine in liste:
+            self._inverses[voisine].add(ville)
+        self.voisins[ville] = liste
+
+    def _colonne_modifiee(self, ville):
+        """
+        Met à jour les listes des autres villes après un changement des distances vers 'ville'.
+        """
+        for autre in range(len(self.matrice)):
+            if autre == ville:
+                continue
+            liste = self.voisins[autre]
+            ligne = self.matrice[autre]
+            if autre in self._inverses[ville]:
+                self._fixer_voisins(autre, self._calculer_voisins(autre))
+            elif len(liste) < self.k_voisins or ligne[ville] < ligne[liste[-1]]:
+                rang = 0
+                while rang < len(liste) and ligne[liste[rang]] <= ligne[ville]:
+                    rang += 1
+                self._fixer_voisins(autre, (liste[:rang] + [ville] + liste[rang:])[:self.k_voisins])
+
+    # --- Vecteurs de Distances ---
+
+    def _vecteur(self, valeurs):
+        """
+        Distances données dans l'ordre des indices (liste) ou par étiquette (dictionnaire).
+        """
+        if isinstance(valeurs, dict):
+            return [valeurs[etiquette] for etiquette in self.etiquettes]
+        valeurs = list(valeurs)
+        if len(valeurs) != len(self.matrice):
+            raise ValueError(f"{len(valeurs)} distances données pour {len(self.matrice)} villes")
+        return valeurs
+
+    def _distances_point(self, point):
+        """
+        Distances (dans les deux sens) entre 'point' et les villes de l'instance, depuis leurs coordonnées.
+        """
+        if self.coordonnees is None:
+            raise ValueError("L'instance n'a pas de coordonnées : donnez les distances de la ville")
+        dtype = type_stockage(self.type_distance)
+        distances = distances_coordonnees(self.type_distance, np.asarray(self.coordonnees, dtype=np.float64),
+                                          np.asarray(point, dtype=np.float64))
+        return distances.astype(np.float64 if dtype == np.float32 else dtype).tolist()
+
+    def _distances_ville(self, distances_depart, distances_arrivee, coordonnees):
+        if coordonnees is not None:
+            distances = self._distances_point(coordonnees)
+            return distances, distances
+        if distances_depart is None and distances_arrivee is None:
+            raise ValueError("Donnez les distances de la ville ou ses coordonnées")
+        depart = self._vecteur(distances_depart if distances_depart is not None else distances_arrivee)
+        arrivee = self._vecteur(distances_arrivee) if distances_arrivee is not None else depart
+        return depart, arrivee
+
+    def _noter_region(self, ville):
+        """
+        Ajoute une ville et ses deux voisines dans le parcours aux villes à réoptimiser.
+        """
+        self._region.add(ville)
+        if ville in self.solution and len(self.solution) > 1:
+            position = self.solution.index(ville)
+            self._region.add(self.solution[position - 1])
+            self._region.add(self.solution[(position + 1) % len(self.solution)])
+
+    # --- Modifications ---
+
+    def ajouter_ville(self, etiquette=None, distances_depart=None, distances_arrivee=None, coordonnees=None):
+        """
+        Ajoute une ville et l'insère dans le parcours au moindre coût, entre deux villes consécutives
+        dont l'une est parmi ses plus proches voisines. 'distances_depart' (de la ville vers les autres)
+        et 'distances_arrivee' (des autres vers elle) sont des listes dans l'ordre des indices ou des
+        dictionnaires étiquette -> distance ; une seule suffit pour une matrice symétrique.
+        Retourne l'indice de la nouvelle ville.
+        """
+        if etiquette is None:
+            while self._prochaine_etiquette in self._indices:
+                self._prochaine_etiquette += 1
+            etiquette = self._prochaine_etiquette
+        if etiquette in self._indices:
+            raise ValueError(f"Ville déjà présente : {etiquette}")
+        if self.coordonnees is not None and coordonnees is None:
+            raise ValueError("L'instance est définie par coordonnées : donnez celles de la nouvelle ville")
+        depart, arrivee = self._distances_ville(distances_depart, distances_arrivee, coordonnees)
+
+        # 1. Nouvelle ligne et nouvelle colonne de la matrice
+        ville = len(self.matrice)
+        for ligne, distance in zip(self.matrice, arrivee):
+            ligne.append(distance)
+        self.matrice.append(depart + [0])
+        if self.symetrique and depart != arrivee:
+            self.symetrique = False
+        self.etiquettes.append(etiquette)
+        self._indices[etiquette] = ville
+        if self.coordonnees is not None:
+            self.coordonnees.append(tuple(coordonnees))
+
+        # 2. Listes de voisines : la sienne, et celles des villes dont elle devient voisine
+        self.voisins.append([])
+        self._inverses.append(set())
+        self._fixer_voisins(ville, self._calculer_voisins(ville))
+        self._colonne_modifiee(ville)
+
+        # 3. Insertion la moins chère, à côté de l'une de ses voisines (ou partout pour un petit parcours)
+        self._inserer(ville)
+        self._noter_region(ville)
+        return ville
+
+    def _inserer(self, ville):
+        solution, matrice = self.solution, self.matrice
+        n = len(solution)
+        if n < 2:
+            solution.append(ville)
+            self.distance = calculer_distance_totale(solution, matrice)
+            return
+        if n <= 2 * self.k_voisins:
+            positions = range(n)
+        else:
+            positions = set()
+            for voisine in self.voisins[ville]:
+                position = solution.index(voisine)
+                positions.update(((position - 1) % n, position))
+        meilleure_position, meilleur_delta = None, math.inf
+        for position in positions:
+            a, b = solution[position], solution[(position + 1) % n]
+            delta = matrice[a][ville] + matrice[ville][b] - matrice[a][b]
+            if delta < meilleur_delta:
+                meilleure_position, meilleur_delta = position, delta
+        solution.insert(meilleure_position + 1, ville)
+        self.distance += meilleur_delta
+
+    def supprimer_ville(self, etiquette):
+        """
+        Retire une ville de l'instance et du parcours (ses deux voisines de parcours sont reliées).
+        La dernière ville prend son indice, pour que les indices restent contigus.
+        """
+        ville = self.index(etiquette)
+        derniere = len(self.matrice) - 1
+        solution, matrice = self.solution, self.matrice
+
+        # 1. Court-circuiter la ville dans le parcours
+        position = solution.index(ville)
+        n = len(solution)
+        precedente, suivante = solution[position - 1], solution[(position + 1) % n]
+        self.distance += matrice[precedente][suivante] - matrice[precedente][ville] - matrice[ville][suivante]
+        del solution[position]
+        if len(solution) < 2:
+            self.distance = calculer_distance_totale(solution, matrice) if solution else 0
+        concernees = self._inverses[ville] - {ville}
+        for autre in concernees:
+            self.voisins[autre].remove(ville)
+        self._inverses[ville] = set()
+        self._fixer_voisins(ville, [])
+        self._region.discard(ville)
+        if precedente != ville:
+            self._region.update((precedente, suivante))
+
+        # 2. La dernière ville prend l'indice libéré
+        if ville != derniere:
+            matrice[ville] = matrice[derniere]
+            for ligne in matrice:
+                ligne[ville] = ligne[derniere]
+            solution[solution.index(derniere)] = ville
+            self.voisins[ville], self.voisins[derniere] = self.voisins[derniere], []
+            self._inverses[ville], self._inverses[derniere] = self._inverses[derniere], set()
+            for voisine in self.voisins[ville]:
+                self._inverses[voisine].discard(derniere)
+                self._inverses[voisine].add(ville)
+            for autre in self._inverses[ville]:
+                liste = self.voisins[autre]
+                liste[liste.index(derniere)] = ville
+            concernees = {ville if autre == derniere else autre for autre in concernees}
+            if derniere in self._region:
+                self._region.discard(derniere)
+                self._region.add(ville)
+            etiquette_derniere = self.etiquettes[derniere]
+            self.etiquettes[ville] = etiquette_derniere
+            self._indices[etiquette_derniere] = ville
+            if self.coordonnees is not None:
+                self.coordonnees[ville] = self.coordonnees[derniere]
+        del self._indices[etiquette]
+
+        matrice.pop()
+        for ligne in matrice:
+            ligne.pop()
+        self.voisins.pop()
+        self._inverses.pop()
+        self.etiquettes.pop()
+        if self.coordonnees is not None:
+            self.coordonnees.pop()
+
+        # 3. Les villes qui avaient la ville retirée pour voisine recalculent leur liste
+        for autre in concernees:
+            self._fixer_voisins(autre, self._calculer_voisins(autre))
+
+    def modifier_distance(self, depart, arrivee, distance, deux_sens=None):
+        """
+        Change la distance de la ville 'depart' à la ville 'arrivee' (étiquettes) ;
+        dans les deux sens si 'deux_sens' (par défaut : si la matrice est symétrique).
+        """
+        a, b = self.index(depart), self.index(arrivee)
+        if deux_sens is None:
+            deux_sens = self.symetrique
+        for u, v in ((a, b), (b, a)) if deux_sens else ((a, b),):
+            self._modifier_arete(u, v, distance)
+        if self.matrice[a][b] != self.matrice[b][a]:
+            self.symetrique = False
+        self._noter_region(a)
+        self._noter_region(b)
+
+    def _modifier_arete(self, u, v, distance):
+        # Effet sur la longueur du parcours, si l'arête u -> v en fait partie
+        position = self.solution.index(u)
+        if self.solution[(position + 1) % len(self.solution)] == v:
+            self.distance += distance - self.matrice[u][v]
+        self.matrice[u][v] = distance
+        liste = self.voisins[u]
+        if v in liste or len(liste) < self.k_voisins or distance < self.matrice[u][liste[-1]]:
+            self._fixer_voisins(u, self._calculer_voisins(u))
+
+    def modifier_distances(self, etiquette, distances_depart=None, distances_arrivee=None, coordonnees=None):
+        """
+        Remplace toutes les distances d'une ville (sa ligne et sa colonne), ou la déplace à de nouvelles coordonnées.
+        """
+        ville = self.index(etiquette)
+        depart, arrivee = self._distances_ville(distances_depart, distances_arrivee, coordonnees)
+        solution = self.solution
+        position = solution.index(ville)
+        n = len(solution)
+        precedente, suivante = solution[position - 1], solution[(position + 1) % n]
+
+        depart[ville], arrivee[ville] = 0, 0
+        if n > 1:
+            self.distance += (arrivee[precedente] + depart[suivante]
+                              - self.matrice[precedente][ville] - self.matrice[ville][suivante])
+        self.matrice[ville] = list(depart)
+        for ligne, distance in zip(self.matrice, arrivee):
+            ligne[ville] = distance
+        if self.symetrique and depart != arrivee:
+            self.symetrique = False
+        if coordonnees is not None:
+            self.coordonnees[ville] = tuple(coordonnees)
+
+        self._fixer_voisins(ville, self._calculer_voisins(ville))
+        self._colonne_modifiee(ville)
+        self._noter_region(ville)
+
+    def appliquer(self, modifications):
+        """
+        Applique une suite de modifications (dictionnaires, par exemple lus en JSON), sans réoptimiser :
+        - {"type": "ajouter", "ville": e, "distances_depart": ..., "distances_arrivee": ..., "coordonnees": ...} ;
+        - {"type": "supprimer", "ville": e} ;
+        - {"type": "distance", "depart": a, "arrivee": b, "valeur": d, "deux_sens": ...} ;
+        - {"type": "distances", "ville": e, "distances_depart": ..., "distances_arrivee": ..., "coordonnees": ...}.
+        """
+        for modification in modifications:
+            type_modification = modification.get("type")
+            if type_modification not in TYPES_MODIFICATION:
+                raise ValueError(f"Type de modification inconnu : {type_modification}")
+            if type_modification == "ajouter":
+                self.ajouter_ville(modification.get("ville"), modification.get("distances_depart"),
+                                   modification.get("distances_arrivee"), modification.get("coordonnees"))
+            elif type_modification == "supprimer":
+                self.supprimer_ville(modification["ville"])
+            elif type_modification == "distance":
+                self.modifier_distance(modification["depart"], modification["arrivee"], modification["valeur"],
+                                       modification.get("deux_sens"))
+            else:
+                self.modifier_distances(modification["ville"], modification.get("distances_depart"),
+                                        modification.get("distances_arrivee"), modification.get("coordonnees"))
+
+    # --- Réoptimisation ---
+
+    def _rafale_recuit(self, region, iterations, rng):
+        """
+        Courte rafale de recuit simulé autour de la région : déplacements Or-opt d'un segment qui commence
+        à une ville de la région, inséré juste avant ou après l'une de ses plus proches voisines.
+        La température part de celle qui accepte un mouvement dégradant moyen avec la probabilité
+        TAUX_ACCEPTATION_RAFALE et décroît géométriquement d'un facteur 1000 au cours de la rafale.
+        Retourne (parcours, villes dont les arêtes ont changé).
+        """
+        parcours = ParcoursDeuxNiveaux(self.solution)
+        n = len(parcours)
+        matrice = self.matrice
+        region = [ville for ville in region if self.voisins[ville]]
+        touchees = set(region)
+
+        def tirer():
+            ville = rng.choice(region)
+            i = parcours.position(ville)
+            longueur = rng.randint(1, min(LONGUEUR_MAX_OR_OPT, n - 3))
+            j = (parcours.position(rng.choice(self.voisins[ville])) - rng.randint(0, 1)) % n
+            # Le point d'insertion ne doit être ni dans le segment, ni juste avant lui
+            if (j - i) % n < longueur or (j - i) % n == n - 1:
+                return None
+            return i, longueur, j
+
+        deltas = []
+        for _ in range(min(100, iterations)):
+            mouvement = tirer()
+            if mouvement is not None:
+                delta = delta_or_opt(parcours, matrice, *mouvement)
+                if delta > 0:
+                    deltas.append(delta)
+        if not deltas:
+            return parcours.tolist(), touchees
+        temperature = -(sum(deltas) / len(deltas)) / math.log(TAUX_ACCEPTATION_RAFALE)
+        alpha = 0.001 ** (1.0 / iterations)
+
+        for _ in range(iterations):
+            mouvement = tirer()
+            if mouvement is not None:
+                delta = delta_or_opt(parcours, matrice, *mouvement)
+                if delta < 0 or rng.random() < math.exp(-delta / temperature):
+                    i, longueur, j = mouvement
+                    touchees.update((parcours[(i - 1) % n], parcours[(i + longueur) % n], parcours[j],
+                                     parcours[(j + 1) % n]))
+                    appliquer_or_opt(parcours, i, longueur, j)
+            temperature *= alpha
+        return parcours.tolist(), touchees
+
+    def reoptimiser(self, methode="recherche_locale", iterations_par_ville=50, graine=None):
+        """
+        Réoptimise le parcours autour des villes touchées depuis la dernière réoptimisation.
+        - "recherche_locale" : 2-opt et Or-opt (voir recherche_locale.py) en ne partant que de ces villes ;
+        - "recuit" : en plus, une rafale de recuit simulé de 'iterations_par_ville' mouvements par ville
+          touchée, suivie de la même recherche locale ; le meilleur des deux résultats est conservé.
+        Retourne (parcours en étiquettes, distance).
+        """
+        if methode not in ("recherche_locale", "recuit"):
+            raise ValueError(f"Méthode de réoptimisation inconnue : {methode}")
+        region = sorted(self._region)
+        self._region = set()
+        if region and len(self.solution) >= 5:
+            meilleur = recherche_locale(self.solution, self.matrice, self.voisins, symetrique=self.symetrique,
+                                        villes_a_examiner=region)
+            if methode == "recuit":
+                rng = random.Random(graine)
+                parcours, touchees = self._rafale_recuit(region, iterations_par_ville * len(region), rng)
+                candidat = recherche_locale(parcours, self.matrice, self.voisins, symetrique=self.symetrique,
+                                            villes_a_examiner=sorted(touchees))
+                if candidat[1] < meilleur[1]:
+                    meilleur = candidat
+            self.solution, self.distance = meilleur
+        elif region:
+            self.distance = calculer_distance_totale(self.solution, self.matrice)
+        return self.parcours(), self.distance
+
+    def mettre_a_jour(self, modifications, methode="recherche_locale", iterations_par_ville=50, graine=None):
+        """
+        Applique les modifications puis réoptimise (voir appliquer et reoptimiser).
+        """
+        self.appliquer(modifications)
+        return self.reoptimiser(methode, iterations_par_ville, graine)
+
+
+# --- Bloc d'Exécution ---
+if __name__ == "__main__":
+    rng = random.Random(0)
+    nombre_villes = 2000
+    points = [(rng.uniform(0, 10000), rng.uniform(0, 10000)) for _ in range(nombre_villes)]
+    matrice = creer_matrice(InstanceTSP("dynamique", "EUC_2D", coordonnees=points), "liste")
+
+    debut = time.perf_counter()
+    instance = InstanceDynamique(matrice, coordonnees=points)
+    print(f"Résolution initiale ({nombre_villes} villes) : {instance.distance:.0f} "
+          f"en {time.perf_counter() - debut:.2f} s")
+
+    for tour in range(3):
+        # Cinq nouveaux arrêts, cinq arrêts annulés et un trajet ralenti
+        modifications = [{"type": "ajouter", "coordonnees": (rng.uniform(0, 10000), rng.uniform(0, 10000))}
+                         for _ in range(5)]
+        modifications += [{"type": "supprimer", "ville": etiquette}
+                          for etiquette in rng.sample(instance.etiquettes, 5)]
+        a, b = instance.parcours()[:2]
+        modifications.append({"type": "distance", "depart": a, "arrivee": b,
+                              "valeur": 3 * instance.matrice[instance.index(a)][instance.index(b)]})
+        debut = time.perf_counter()
+        parcours, distance = instance.mettre_a_jour(modifications)
+        duree = time.perf_counter() - debut
+
+        debut = time.perf_counter()
+        _, distance_complete = InstanceDynamique(instance.matrice).reoptimiser()
+        print(f"Modification {tour + 1} : réoptimisation incrémentale {distance:.0f} en {duree:.3f} s, "
+              f"résolution complète {distance_complete:.0f} en {time.perf_counter() - debut:.2f} s")
@@ -0,0 +1,110 @@
+# Fichier: reprise.py
+
+import json
+import os
+import random
+import time
+
+import numpy as np
+
+# --- Points de Reprise (Sauvegarde et Reprise d'une Exécution) ---
+# Une longue exécution ne survit pas à un redémarrage : la population, la température,
+# le parcours courant ou la mémoire tabou n'existent que dans les variables locales de l'algorithme.
+# Un objet PointReprise, passé en paramètre 'reprise', écrit périodiquement cet état dans un
+# fichier .npz (tableaux d'entiers 32 bits pour les parcours et les populations, sans pickle),
+# avec l'état du générateur aléatoire. Relancé avec le même fichier, l'algorithme reprend
+# à la dernière étape sauvegardée et poursuit exactement la même exécution, bit pour bit.
+# Le fichier est d'abord écrit à côté puis renommé : une interruption pendant l'écriture
+# laisse intact le point de reprise précédent.
+
+
+def _tableau(valeur):
+    """
+    Convertit une valeur de l'état en tableau : les listes (parcours, populations, attributs tabous)
+    en entiers 32 bits, les nombres en tableaux à zéro dimension (entier ou flottant, sans perte).
+    """
+    if isinstance(valeur, np.ndarray):
+        return valeur
+    if isinstance(valeur, (list, tuple)):
+        return np.asarray(valeur, dtype=np.int32)
+    return np.asarray(valeur)
+
+
+def etat_aleatoire(rng=random, prefixe=""):
+    """
+    État d'un générateur aléatoire (module random ou numpy.random.Generator), sous forme de tableaux.
+    'prefixe' distingue les générateurs secondaires (dérivés du générateur principal) dans un même point de reprise.
+    """
+    if isinstance(rng, np.random.Generator):
+        return {prefixe + "rng_numpy": np.array(json.dumps(rng.bit_generator.state))}
+    version, interne, gauss = rng.getstate()
+    return {
+        prefixe + "rng_version": np.asarray(version),
+        prefixe + "rng_interne": np.asarray(interne, dtype=np.uint32),
+        prefixe + "rng_gauss": np.asarray([] if gauss is None else [gauss], dtype=np.float64),
+    }
+
+
+def restaurer_aleatoire(etat, rng=random, prefixe=""):
+    """
+    Restaure l'état d'un générateur aléatoire sauvegardé par etat_aleatoire (avec le même 'prefixe').
+    """
+    if isinstance(rng, np.random.Generator):
+        rng.bit_generator.state = json.loads(str(etat[prefixe + "rng_numpy"]))
+        return
+    gauss = etat[prefixe + "rng_gauss"].tolist()
+    rng.setstate((etat[prefixe + "rng_version"].item(), tuple(etat[prefixe + "rng_interne"].tolist()),
+                  gauss[0] if gauss else None))
+
+
+class PointReprise:
+    """
+    Sauvegarde périodique de l'état d'un algorithme dans le fichier 'chemin' (.npz), et reprise.
+    Un point de reprise est écrit au plus toutes les 'periode' secondes ; le recuit simulé,
+    dont les itérations sont très courtes, ne consulte l'horloge que toutes les
+    'intervalle_verification' itérations.
+    """
+
+    def __init__(self, chemin, periode=5.0, intervalle_verification=1000):
+        self.chemin = chemin
+        self.periode = periode
+        self.intervalle_verification = intervalle_verification
+        self.ecritures = 0
+        self._dernier_temps = time.perf_counter()
+
+    def doit_ecrire(self):
+        return time.perf_counter() - self._dernier_temps >= self.periode
+
+    def ecrire(self, algorithme, rng=random, **etat):
+        """
+        Écrit l'état de l'algorithme (et de son générateur aléatoire 'rng') dans le fichier.
+        """
+        tableaux = {nom: _tableau(valeur) for nom, valeur in etat.items()}
+        tableaux.update(etat_aleatoire(rng))
+        tableaux["algorithme"] = np.array(algorithme)
+
+        temporaire = self.chemin + ".tmp"
+        with open(temporaire, "wb") as fichier:
+            np.savez(fichier, **tableaux)  # Non compressé : l'écriture reste rapide sur de grandes populations
+        os.replace(temporaire, self.chemin)
+
+        self.ecritures += 1
+        self._dernier_temps = time.perf_counter()
+
+    def charger(self, algorithme, rng=random):
+        """
+        Retourne l'état sauvegardé (dictionnaire de tableaux) et restaure le générateur aléatoire 'rng',
+        ou None s'il n'y a pas encore de point de reprise.
+        """
+        if not os.path.exists(self.chemin):
+            return None
+        with np.load(self.chemin, allow_pickle=False) as donnees:
+            etat = {nom: donnees[nom] for nom in donnees.files}
+
+        ecrit_par = str(etat.pop("algorithme"))
+        if ecrit_par != algorithme:
+            raise ValueError(f"Le point de reprise {self.chemin} a été écrit par {ecrit_par}, pas par {algorithme}")
+        restaurer_aleatoire(etat, rng)
+        for nom in [nom for nom in etat if nom.startswith("rng_")]:
+            del etat[nom]
+        return etat
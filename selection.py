@@ -0,0 +1,178 @@
+# Fichier: selection.py
+
+import bisect
+import math
+import random
+
+# --- Sélection des Parents par Lot ---
+# Au lieu de trier ou de parcourir la population pour chaque enfant, on construit
+# une structure d'échantillonnage une seule fois par génération, puis on tire
+# d'un coup tous les parents de la génération :
+# - table cumulative (sommes préfixes) + recherche dichotomique : O(log P) par tirage ;
+# - table d'alias de Walker : O(1) par tirage ;
+# - tournoi : O(taille du tournoi) par tirage, sans aucune structure ;
+# - échantillonnage universel stochastique (SUS) : un seul passage pour tous les tirages.
+
+
+# --- Poids de Sélection ---
+
+def poids_rang(fitnesses):
+    """
+    Poids de la sélection par rang : 1 pour le moins bon individu, N pour le meilleur.
+    Un seul tri par génération.
+    """
+    ordre = sorted(range(len(fitnesses)), key=fitnesses.__getitem__)
+    poids = [0] * len(fitnesses)
+    for rang, index in enumerate(ordre, start=1):
+        poids[index] = rang
+    return poids
+
+
+def poids_roulette(fitnesses):
+    """
+    Poids de la roue de loterie : la fitness elle-même.
+    Les fitness infinies (distance nulle) se partagent la roue ; si toutes les fitness
+    sont nulles, la sélection devient uniforme.
+    """
+    if any(math.isinf(f) for f in fitnesses):
+        return [1.0 if math.isinf(f) else 0.0 for f in fitnesses]
+    if sum(fitnesses) == 0:
+        return [1.0] * len(fitnesses)
+    return list(fitnesses)
+
+
+# --- Structures d'Échantillonnage ---
+
+def construire_table_cumulative(poids):
+    """
+    Construit la table des sommes préfixes des poids.
+    """
+    cumuls = []
+    somme = 0
+    for p in poids:
+        somme += p
+        cumuls.append(somme)
+    return cumuls
+
+
+def tirer_cumulative(cumuls, nombre, rng=random):
+    """
+    Tire 'nombre' indices proportionnellement aux poids, par recherche dichotomique
+    dans la table cumulative (O(log P) par tirage).
+    """
+    total = cumuls[-1]
+    dernier = len(cumuls) - 1
+    return [min(bisect.bisect_right(cumuls, rng.uniform(0, total)), dernier) for _ in range(nombre)]
+
+
+def construire_table_alias(poids):
+    """
+    Construit la table d'alias de Walker (méthode de Vose) en O(P).
+    Chaque case i contient une probabilité de garder i, sinon on prend alias[i].
+    """
+    taille = len(poids)
+    total = sum(poids)
+    probabilites = [p * taille / total for p in poids]
+    alias = list(range(taille))
+    petits = [i for i, p in enumerate(probabilites) if p < 1.0]
+    grands = [i for i, p in enumerate(probabilites) if p >= 1.0]
+
+    while petits and grands:
+        petit = petits.pop()
+        grand = grands.pop()
+        alias[petit] = grand
+        probabilites[grand] -= 1.0 - probabilites[petit]
+        if probabilites[grand] < 1.0:
+            petits.append(grand)
+        else:
+            grands.append(grand)
+
+    # Les cases restantes (erreurs d'arrondi) sont pleines
+    for i in petits + grands:
+        probabilites[i] = 1.0
+    return probabilites, alias
+
+
+def tirer_alias(table, nombre, rng=random):
+    """
+    Tire 'nombre' indices à l'aide de la table d'alias (O(1) par tirage).
+    """
+    probabilites, alias = table
+    taille = len(probabilites)
+    indices = []
+    for _ in range(nombre):
+        i = int(rng.random() * taille)
+        indices.append(i if rng.random() < probabilites[i] else alias[i])
+    return indices
+
+
+def tirer_sus(poids, nombre, rng=random):
+    """
+    Échantillonnage universel stochastique : 'nombre' pointeurs régulièrement espacés
+    sur la roue, placés en un seul passage. Les indices sont ensuite mélangés pour que
+    les paires de parents soient formées au hasard.
+    """
+    total = sum(poids)
+    pas = total / nombre
+    pointeur = rng.uniform(0, pas)
+    indices = []
+    somme = 0
+    index = 0
+    for i, p in enumerate(poids):
+        somme += p
+        while index < nombre and pointeur <= somme:
+            indices.append(i)
+            index += 1
+            pointeur += pas
+    # Les derniers pointeurs peuvent dépasser la somme à cause des arrondis
+    indices.extend([len(poids) - 1] * (nombre - len(indices)))
+    rng.shuffle(indices)
+    return indices
+
+
+def tirer_tournoi(fitnesses, nombre, taille_tournoi=3, rng=random):
+    """
+    Sélection par tournoi : chaque parent est le meilleur de 'taille_tournoi'
+    individus tirés au hasard.
+    """
+    taille = len(fitnesses)
+    return [max((rng.randrange(taille) for _ in range(taille_tournoi)), key=fitnesses.__getitem__)
+            for _ in range(nombre)]
+
+
+# --- Point d'Entrée ---
+
+METHODES_SELECTION = ("rang", "roulette", "tournoi", "sus")
+
+
+def selectionner_indices(fitnesses, nombre, methode="rang", structure="alias", taille_tournoi=3, rng=random):
+    """
+    Tire en un seul lot les indices de 'nombre' parents.
+    - methode : "rang", "roulette", "tournoi" ou "sus".
+    - structure : "alias" (O(1) par tirage) ou "cumulative" (O(log P) par tirage),
+      utilisée par les méthodes "rang" et "roulette".
+    """
+    if methode == "tournoi":
+        return tirer_tournoi(fitnesses, nombre, taille_tournoi, rng)
+    if methode == "rang":
+        poids = poids_rang(fitnesses)
+    elif methode in ("roulette", "sus"):
+        poids = poids_roulette(fitnesses)
+    else:
+        raise ValueError(f"Méthode de sélection inconnue : {methode}")
+
+    if methode == "sus":
+        return tirer_sus(poids, nombre, rng)
+    if structure == "alias":
+        return tirer_alias(construire_table_alias(poids), nombre, rng)
+    if structure == "cumulative":
+        return tirer_cumulative(construire_table_cumulative(poids), nombre, rng)
+    raise ValueError(f"Structure d'échantillonnage inconnue : {structure}")
+
+
+def selectionner_parents(population, fitnesses, nombre, methode="rang", structure="alias", taille_tournoi=3,
+                         rng=random):
+    """
+    Tire en un seul lot 'nombre' parents de la population (voir selectionner_indices).
+    """
+    return [population[i] for i in selectionner_indices(fitnesses, nombre, methode, structure, taille_tournoi, rng)]
@@ -0,0 +1,281 @@
+# Fichier: service_lots.py
+
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import random
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from arret import CriteresArret
+from instances import InstanceTSP, creer_matrice
+
+# --- Service de Résolution par Lots ---
+# Résout un flux d'instances sans relancer Python (ni réimporter les modules) pour chacune.
+# Les instances arrivent en JSONL, une tâche par ligne, sur l'entrée standard ou dans un fichier :
+#   {"id": "a1", "algorithme": "recuit", "coordonnees": [[x, y], ...], "duree_max": 2.0, "graine": 7}
+# - "algorithme" : "recuit", "tabou", "genetique_rang" ou "genetique_roulette" ;
+# - l'instance : "coordonnees" (avec "type_distance", EUC_2D par défaut) ou "matrice" explicite ;
+# - "parametres" (optionnel) : arguments nommés transmis à l'algorithme, qui remplacent les valeurs
+#   par défaut proportionnées à la taille de l'instance ;
+# - "duree_max" (optionnel) : limite de temps de la tâche, en secondes ; "graine" (optionnel).
+# Une file asyncio bornée alimente des processus démarrés une seule fois ("chauds"), un par travailleur
+# asyncio ; chaque résultat est écrit en JSONL dès que sa tâche se termine, donc pas forcément dans l'ordre
+# d'arrivée.
+#
+# La limite de temps est appliquée dans le processus par un CriteresArret (voir arret.py) :
+# l'algorithme s'arrête proprement et rend sa meilleure solution. Si une tâche dépasse malgré
+# tout sa limite de plus de 'marge' secondes (par exemple une génération trop longue entre deux
+# vérifications), son résultat est rendu avec le statut "delai_depasse" : le processus qui l'exécute
+# est arrêté puis remplacé par un nouveau processus (champ "processus_remplace" du résultat), si bien
+# que les tâches suivantes n'attendent pas la fin d'un calcul dont le résultat ne sera plus rendu.
+
+ALGORITHMES = {
+    "recuit": ("algorithme_recuit_simulé", "recuit_simule"),
+    "tabou": ("algorithme_tabou", "tabu_search"),
+    "genetique_rang": ("algorithme_genetique_rang", "algorithme_genetique"),
+    "genetique_roulette": ("algorithme_genetique_roulette", "algorithme_genetique"),
+}
+
+
+# --- Exécution d'une Tâche (dans un processus du pool) ---
+
+def _initialiser_travailleur():
+    """
+    Initialisation d'un processus du pool : importer une seule fois les modules des algorithmes.
+    """
+    for nom_module, _ in ALGORITHMES.values():
+        importlib.import_module(nom_module)
+
+
+def _pret():
+    return os.getpid()
+
+
+def _matrice_tache(tache):
+    """
+    Construit la matrice des distances de la tâche : la matrice explicite telle quelle, ou les distances
+    calculées depuis les coordonnées (matrice complète jusqu'à 2000 villes, calcul à la volée au-delà).
+    """
+    if "matrice" in tache:
+        return tache["matrice"]
+    instance = InstanceTSP(str(tache.get("id", "")), tache.get("type_distance", "EUC_2D"),
+                           coordonnees=tache["coordonnees"])
+    return creer_matrice(instance, "liste" if len(instance) <= 2000 else "coordonnees")
+
+
+def parametres_algorithme(algorithme, matrice, parametres):
+    """
+    Paramètres par défaut de l'algorithme, proportionnés à la taille de l'instance (comme dans benchmark.py),
+    complétés ou remplacés par ceux de la tâche.
+    """
+    nombre_villes = len(matrice)
+    if algorithme == "recuit":
+        from benchmark import temperature_initiale_estimee
+        iterations = parametres.get("iterations_max", max(10000, 200 * nombre_villes))
+        valeurs = {"iterations_max": iterations,
+                   "temperature_initiale": temperature_initiale_estimee(matrice, random.Random(0)),
+                   # La température est divisée par 10 000 au cours de l'exécution
+                   "taux_refroidissement": 1e-4 ** (1.0 / iterations)}
+    elif algorithme == "tabou":
+        valeurs = {"nombre_iterations": 100, "taille_tabu": 15,
+                   "mode": "complet" if nombre_villes <= 150 else "candidats"}
+    else:
+        valeurs = {"taille_population": 50, "nombre_generations": 100, "taux_croisement": 0.8,
+                   "taux_mutation": 1.0 / nombre_villes, "taille_elite": 2}
+    valeurs.update(parametres)
+    return valeurs
+
+
+def resoudre(tache):
+    """
+    Résout une tâche et retourne son résultat (dictionnaire sérialisable en JSON).
+    Les erreurs (tâche invalide, algorithme inconnu...) sont rendues dans le résultat, sans interrompre le service.
+    """
+    debut = time.perf_counter()
+    resultat = {"id": tache.get("id"), "algorithme": tache.get("algorithme"), "processus": os.getpid()}
+    try:
+        if tache.get("algorithme") not in ALGORITHMES:
+            raise ValueError(f"Algorithme inconnu : {tache.get('algorithme')}")
+        nom_module, nom_fonction = ALGORITHMES[tache["algorithme"]]
+        fonction = getattr(importlib.import_module(nom_module), nom_fonction)
+
+        # 1. Instance, paramètres et limite de temps
+        matrice = _matrice_tache(tache)
+        parametres = parametres_algorithme(tache["algorithme"], matrice, tache.get("parametres", {}))
+        arret = None
+        if tache.get("duree_max") is not None:
+            # Le temps de construction de la matrice est décompté de la limite de la tâche
+            arret = CriteresArret(duree_max=max(0.0, tache["duree_max"] - (time.perf_counter() - debut)),
+                                  intervalle_verification=100)
+
+        # 2. Résolution, avec une graine propre à la tâche
+        random.seed(tache.get("graine"))
+        solution, distance = fonction(matrice, arret=arret, **parametres)
+
+        resultat.update({
+            "statut": "ok",
+            "distance": distance.item() if hasattr(distance, "item") else distance,
+            "solution": [int(ville) for ville in solution],
+            "critere": arret.critere if arret is not None else None,
+        })
+    except Exception as erreur:
+        resultat.update({"statut": "erreur", "erreur": f"{type(erreur).__name__}: {erreur}"})
+    resultat["duree"] = time.perf_counter() - debut
+    return resultat
+
+
+# --- File de Tâches et Processus ---
+
+async def _demarrer_processus(boucle):
+    """
+    Démarre un processus de résolution (pool d'un seul processus) et attend qu'il soit prêt.
+    Retourne (pool, identifiant du processus).
+    """
+    pool = ProcessPoolExecutor(max_workers=1, initializer=_initialiser_travailleur)
+    return pool, await boucle.run_in_executor(pool, _pret)
+
+
+async def _remplacer_processus(boucle, pool, pid, execution):
+    """
+    Arrête le processus 'pid' (qui exécute encore 'execution') et retourne son remplaçant (pool, pid).
+    """
+    os.kill(pid, signal.SIGTERM)
+    try:
+        await execution  # Le pool, dont le processus a disparu, rend une erreur BrokenProcessPool
+    except Exception:
+        pass
+    pool.shutdown(wait=True)
+    return await _demarrer_processus(boucle)
+
+
+async def _lire_taches(entree, file, nombre_travailleurs):
+    """
+    Lit les tâches ligne par ligne (sans bloquer la boucle asyncio) et les place dans la file ;
+    la file étant bornée, la lecture attend que des processus se libèrent.
+    Une ligne illisible devient un résultat d'erreur. La fin du flux est signalée par un None par travailleur.
+    """
+    boucle = asyncio.get_running_loop()
+    numero = 0
+    while True:
+        ligne = await boucle.run_in_executor(None, entree.readline)
+        if not ligne:
+            break
+        numero += 1
+        if not ligne.strip():
+            continue
+        try:
+            tache = json.loads(ligne)
+            if not isinstance(tache, dict):
+                raise ValueError("une tâche doit être un objet JSON")
+        except ValueError as erreur:
+            tache = {"id": numero, "erreur": f"Ligne {numero} illisible : {erreur}"}
+        tache.setdefault("id", numero)
+        await file.put(tache)
+    for _ in range(nombre_travailleurs):
+        await file.put(None)
+
+
+async def _executer_taches(file, processus, index, ecrire, duree_max, marge):
+    """
+    Prend les tâches de la file une par une, les confie au processus processus[index] ((pool, pid), voir
+    _demarrer_processus) et écrit chaque résultat dès qu'il est prêt. Après un dépassement de délai,
+    processus[index] est remplacé.
+    """
+    boucle = asyncio.get_running_loop()
+    while True:
+        tache = await file.get()
+        if tache is None:
+            return
+        pool, pid = processus[index]
+        if "erreur" in tache:
+            ecrire({"id": tache["id"], "statut": "erreur", "erreur": tache["erreur"]})
+            continue
+        if tache.get("duree_max") is None and duree_max is not None:
+            tache["duree_max"] = duree_max
+
+        debut = time.perf_counter()
+        execution = boucle.run_in_executor(pool, resoudre, tache)
+        try:
+            if tache.get("duree_max") is None:
+                resultat = await execution
+            else:
+                resultat = await asyncio.wait_for(asyncio.shield(execution), tache["duree_max"] + marge)
+        except asyncio.TimeoutError:
+            # Le processus ne peut pas être interrompu proprement : il est arrêté et remplacé
+            resultat = {"id": tache["id"], "algorithme": tache.get("algorithme"), "processus": pid,
+                        "statut": "delai_depasse", "duree": time.perf_counter() - debut, "processus_remplace": True}
+            ecrire(resultat)
+            processus[index] = await _remplacer_processus(boucle, pool, pid, execution)
+            continue
+        ecrire(resultat)
+
+
+async def servir(entree, sortie, nombre_processus=None, duree_max=None, marge=1.0):
+    """
+    Résout toutes les tâches JSONL lues dans 'entree' et écrit les résultats JSONL dans 'sortie',
+    au fil de l'eau. 'duree_max' est la limite de temps des tâches qui n'en précisent pas.
+    Retourne le nombre de tâches en erreur ou hors délai.
+    """
+    nombre_processus = nombre_processus or os.cpu_count() or 1
+    file = asyncio.Queue(maxsize=2 * nombre_processus)
+    echecs = 0
+
+    def ecrire(resultat):
+        nonlocal echecs
+        if resultat["statut"] != "ok":
+            echecs += 1
+        sortie.write(json.dumps(resultat, ensure_ascii=False) + "\n")
+        sortie.flush()
+
+    boucle = asyncio.get_running_loop()
+    # 1. Démarrer tous les processus avant la première tâche
+    processus = list(await asyncio.gather(*[_demarrer_processus(boucle) for _ in range(nombre_processus)]))
+    try:
+        # 2. Un lecteur remplit la file, un travailleur asyncio par processus la vide
+        travailleurs = [asyncio.create_task(_executer_taches(file, processus, k, ecrire, duree_max, marge))
+                        for k in range(nombre_processus)]
+        await _lire_taches(entree, file, nombre_processus)
+        await asyncio.gather(*travailleurs)
+    finally:
+        for pool, _ in processus:
+            pool.shutdown(wait=True)
+    return echecs
+
+
+# --- Interface en Ligne de Commande ---
+
+def analyser_arguments(arguments=None):
+    parseur = argparse.ArgumentParser(description="Résolution par lots d'instances du TSP (JSONL).")
+    parseur.add_argument("entree", nargs="?", default="-", help="Fichier JSONL des tâches (- : entrée standard)")
+    parseur.add_argument("--sortie", default="-", help="Fichier JSONL des résultats (- : sortie standard)")
+    parseur.add_argument("--processus", type=int, default=None, help="Nombre de processus (par défaut : un par cœur)")
+    parseur.add_argument("--duree-max", type=float, default=None,
+                         help="Limite de temps par tâche, en secondes, pour les tâches qui n'en précisent pas")
+    parseur.add_argument("--marge", type=float, default=1.0,
+                         help="Dépassement toléré de la limite avant de rendre le statut delai_depasse")
+    return parseur.parse_args(arguments)
+
+
+def main(arguments=None):
+    arguments = analyser_arguments(arguments)
+    entree = sys.stdin if arguments.entree == "-" else open(arguments.entree, encoding="utf-8")
+    sortie = sys.stdout if arguments.sortie == "-" else open(arguments.sortie, "w", encoding="utf-8")
+    try:
+        echecs = asyncio.run(servir(entree, sortie, arguments.processus, arguments.duree_max, arguments.marge))
+    finally:
+        if entree is not sys.stdin:
+            entree.close()
+        if sortie is not sys.stdout:
+            sortie.close()
+    return 1 if echecs else 0
+
+
+# --- Bloc d'Exécution ---
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,260 @@
+# Fichier: structure_parcours.py
+
+import bisect
+import math
+
+# --- Parcours à Deux Niveaux pour les Grandes Instances ---
+# Dans une liste Python, inverser un segment de parcours (2-opt) coûte O(n).
+# Ici, le parcours est découpé en segments d'environ √n villes, chacun portant un
+# indicateur "inversé" : inverser un morceau du parcours revient à couper au plus deux
+# segments, puis à inverser l'ordre des segments concernés et leurs indicateurs, en O(√n).
+# Chaque ville connaît son segment et son indice dans ce segment, ce qui donne
+# suivant, précédent, position et "entre" en O(1).
+#
+# La classe se comporte comme une liste (len, itération, parcours[i], parcours[i] = ville,
+# tranches) et fournit un index ville -> position (attribut 'positions') : elle peut
+# remplacer la liste 'solution' dans calculer_distance_totale, les générateurs de
+# mouvements candidats et la recherche locale.
+
+
+class _Segment:
+    """
+    Suite de villes consécutives du parcours, lue à l'envers si 'inverse' est vrai.
+    'debut' est la position (dans le parcours) de sa première ville, 'rang' son numéro d'ordre.
+    """
+    __slots__ = ("villes", "inverse", "debut", "rang")
+
+    def __init__(self, villes):
+        self.villes = villes
+        self.inverse = False
+        self.debut = 0
+        self.rang = 0
+
+
+class _VuePositions:
+    """
+    Index ville -> position, calculé à la demande par la structure.
+    Les positions sont tenues à jour par la structure elle-même : les affectations
+    faites par les fonctions de mouvements.py sont donc ignorées.
+    """
+
+    def __init__(self, parcours):
+        self._parcours = parcours
+
+    def __getitem__(self, ville):
+        return self._parcours.position(ville)
+
+    def __setitem__(self, ville, position):
+        pass
+
+    def __len__(self):
+        return len(self._parcours)
+
+
+class ParcoursDeuxNiveaux:
+    """
+    Parcours représenté par une liste de segments d'environ √n villes (liste doublement
+    chaînée à deux niveaux). Toutes les opérations sont en O(1) ou O(√n), sauf les tranches
+    et l'itération complète.
+    """
+
+    def __init__(self, solution, taille_segment=None):
+        villes = list(solution)
+        self._nombre_villes = len(villes)
+        self._taille_segment = taille_segment or max(8, int(math.sqrt(self._nombre_villes)))
+        self._segment_de = [None] * self._nombre_villes
+        self._indice_de = [0] * self._nombre_villes
+        self.positions = _VuePositions(self)
+        self._construire(villes)
+
+    # --- Construction et Entretien des Segments ---
+
+    def _construire(self, villes):
+        """
+        (Re)découpe le parcours en segments de taille régulière, en O(n).
+        """
+        taille = self._taille_segment
+        self._segments = [_Segment(villes[debut:debut + taille]) for debut in range(0, len(villes), taille)]
+        for segment in self._segments:
+            self._indexer(segment)
+        self._renumeroter()
+
+    def _indexer(self, segment):
+        """
+        Enregistre, pour chaque ville du segment, son segment et son indice dans celui-ci.
+        """
+        for indice, ville in enumerate(segment.villes):
+            self._segment_de[ville] = segment
+            self._indice_de[ville] = indice
+
+    def _renumeroter(self):
+        """
+        Recalcule le rang et la position de départ de chaque segment, en O(√n).
+        """
+        self._debuts = []
+        debut = 0
+        for rang, segment in enumerate(self._segments):
+            segment.rang = rang
+            segment.debut = debut
+            self._debuts.append(debut)
+            debut += len(segment.villes)
+
+    def _normaliser(self, segment):
+        """
+        Remet physiquement le segment dans le sens du parcours (indicateur 'inverse' à faux).
+        """
+        if segment.inverse:
+            segment.villes.reverse()
+            segment.inverse = False
+            self._indexer(segment)
+
+    def _couper(self, position):
+        """
+        Garantit qu'un segment commence à 'position', en coupant au besoin le segment qui la contient.
+        Ne renumérote pas les segments : l'appelant doit appeler _renumeroter.
+        """
+        if position <= 0 or position >= self._nombre_villes:
+            return
+        segment = self._segments[bisect.bisect_right(self._debuts, position) - 1]
+        decalage = position - segment.debut
+        if decalage == 0:
+            return
+        self._normaliser(segment)
+        nouveau = _Segment(segment.villes[decalage:])
+        del segment.villes[decalage:]
+        self._indexer(nouveau)
+        self._segments.insert(segment.rang + 1, nouveau)
+        self._renumeroter()
+
+    def _tourner(self, position):
+        """
+        Fait tourner le parcours pour que la ville en 'position' devienne la première (même cycle).
+        """
+        self._couper(position)
+        rang = bisect.bisect_left(self._debuts, position)
+        self._segments = self._segments[rang:] + self._segments[:rang]
+        self._renumeroter()
+
+    # --- Accès aux Villes ---
+
+    def __len__(self):
+        return self._nombre_villes
+
+    def __iter__(self):
+        for segment in self._segments:
+            if segment.inverse:
+                yield from reversed(segment.villes)
+            else:
+                yield from segment.villes
+
+    def _localiser(self, position):
+        """
+        Retourne (segment, indice physique dans segment.villes) de la ville en 'position'.
+        """
+        if position < 0:
+            position += self._nombre_villes
+        if not 0 <= position < self._nombre_villes:
+            raise IndexError("Position hors du parcours")
+        segment = self._segments[bisect.bisect_right(self._debuts, position) - 1]
+        decalage = position - segment.debut
+        return segment, (len(segment.villes) - 1 - decalage if segment.inverse else decalage)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return list(self)[position]
+        segment, indice = self._localiser(position)
+        return segment.villes[indice]
+
+    def __setitem__(self, position, ville):
+        segment, indice = self._localiser(position)
+        segment.villes[indice] = ville
+        self._segment_de[ville] = segment
+        self._indice_de[ville] = indice
+
+    def tolist(self):
+        return list(self)
+
+    def _decalage(self, ville):
+        """
+        Rang de la ville à l'intérieur de son segment, dans le sens du parcours.
+        """
+        segment = self._segment_de[ville]
+        indice = self._indice_de[ville]
+        return len(segment.villes) - 1 - indice if segment.inverse else indice
+
+    def position(self, ville):
+        """
+        Position de la ville dans le parcours, en O(1).
+        """
+        return self._segment_de[ville].debut + self._decalage(ville)
+
+    def _ville_a(self, segment, decalage):
+        return segment.villes[len(segment.villes) - 1 - decalage if segment.inverse else decalage]
+
+    def suivant(self, ville):
+        """
+        Ville qui suit 'ville' dans le parcours (la première après la dernière), en O(1).
+        """
+        segment = self._segment_de[ville]
+        decalage = self._decalage(ville)
+        if decalage + 1 < len(segment.villes):
+            return self._ville_a(segment, decalage + 1)
+        return self._ville_a(self._segments[(segment.rang + 1) % len(self._segments)], 0)
+
+    def precedent(self, ville):
+        """
+        Ville qui précède 'ville' dans le parcours (la dernière avant la première), en O(1).
+        """
+        segment = self._segment_de[ville]
+        decalage = self._decalage(ville)
+        if decalage > 0:
+            return self._ville_a(segment, decalage - 1)
+        segment_precedent = self._segments[segment.rang - 1]
+        return self._ville_a(segment_precedent, len(segment_precedent.villes) - 1)
+
+    def entre(self, ville_a, ville_b, ville_c):
+        """
+        Vrai si, en partant de ville_a dans le sens du parcours, on rencontre ville_b avant
+        (ou en même temps que) ville_c.
+        """
+        position_a = self.position(ville_a)
+        position_b = self.position(ville_b)
+        position_c = self.position(ville_c)
+        if position_a <= position_c:
+            return position_a <= position_b <= position_c
+        return position_b >= position_a or position_b <= position_c
+
+    # --- Inversion de Segment ---
+
+    def inverser(self, i, j):
+        """
+        Inverse le morceau de parcours qui va de la position i à la position j (dans le sens
+        du parcours, en repassant par le début si i > j), en O(√n) amorti.
+        """
+        n = self._nombre_villes
+        i %= n
+        j %= n
+        if i > j:
+            # Le morceau passe par le début : on fait d'abord tourner le parcours pour qu'il commence en i
+            self._tourner(i)
+            i, j = 0, (j - i) % n
+        if i == j:
+            return
+
+        # 1. Couper pour que le morceau soit fait de segments entiers
+        self._couper(i)
+        self._couper(j + 1)
+        premier = bisect.bisect_left(self._debuts, i)
+        dernier = bisect.bisect_right(self._debuts, j) - 1
+
+        # 2. Inverser l'ordre des segments et leurs indicateurs
+        segments = self._segments[premier:dernier + 1]
+        segments.reverse()
+        for segment in segments:
+            segment.inverse = not segment.inverse
+        self._segments[premier:dernier + 1] = segments
+        self._renumeroter()
+
+        # 3. Les coupes multiplient les segments : on redécoupe quand ils deviennent trop nombreux
+        if len(self._segments) > 2 * (n // self._taille_segment + 1):
+            self._construire(list(self))
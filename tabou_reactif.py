@@ -0,0 +1,169 @@
+# Fichier: tabou_reactif.py
+
+# --- Recherche Tabou Réactive : Mémoire à Long Terme ---
+# Sans autre réglage, la recherche tabou n'a qu'une mémoire à court terme (les 'taille_tabu'
+# derniers parcours ou attributs) : elle refuse un mouvement tabou même s'il donnerait une
+# nouvelle meilleure solution, s'arrête dès que tous les mouvements sont tabous et, une fois
+# piégée dans un cycle, consomme le reste de son budget sans progresser.
+# Un objet TabouReactif, passé en paramètre 'reactif' à tabu_search, ajoute :
+# - un critère d'aspiration : un mouvement tabou qui bat la meilleure distance est autorisé ;
+#   si tous les mouvements sont tabous, le meilleur d'entre eux est joué (aspiration par défaut) ;
+# - une durée tabou réactive (Battiti et Tecchiolli) : chaque parcours visité est mémorisé par
+#   une clé de hachage ; revisiter un parcours (cycle) allonge la durée tabou, une longue période
+#   sans répétition la raccourcit, et des répétitions trop nombreuses déclenchent une diversification ;
+# - une mémoire des fréquences d'arêtes : après une stagnation, une phase de diversification
+#   pénalise les mouvements qui réintroduisent les arêtes les plus souvent ajoutées ;
+# - une intensification sur un ensemble d'élite : les meilleurs parcours distincts rencontrés,
+#   d'où la recherche repart (mémoire tabou vidée), en alternance avec les diversifications.
+
+
+class TabouReactif:
+    """
+    Réglages et mémoire à long terme d'une recherche tabou réactive.
+    - 'stagnation' : nombre d'itérations sans amélioration avant une relance (par défaut, max(20, n)) ;
+    - 'duree_diversification' : durée d'une phase de diversification (par défaut, la moitié de 'stagnation') ;
+    - 'poids_frequence' : pénalité, en longueurs moyennes d'arête, d'une arête ajoutée de fréquence maximale ;
+    - 'augmentation' / 'diminution' : facteurs appliqués à la durée tabou, bornée à
+      [taille_tabu / 4, 4 * taille_tabu] ;
+    - 'repetitions_max' : nombre de visites d'un même parcours au-delà duquel la recherche est relancée.
+    """
+
+    def __init__(self, aspiration=True, duree_reactive=True, diversification=True, intensification=True,
+                 stagnation=None, duree_diversification=None, poids_frequence=1.0, taille_elite=5,
+                 augmentation=1.2, diminution=0.9, repetitions_max=3):
+        self.aspiration = aspiration
+        self.duree_reactive = duree_reactive
+        self.diversification = diversification
+        self.intensification = intensification
+        self.stagnation = stagnation
+        self.duree_diversification = duree_diversification
+        self.poids_frequence = poids_frequence
+        self.taille_elite = taille_elite
+        self.augmentation = augmentation
+        self.diminution = diminution
+        self.repetitions_max = repetitions_max
+
+    def demarrer(self, nombre_villes, taille_tabu):
+        """
+        (Ré)initialise la mémoire ; appelée par la recherche tabou au début de l'exécution.
+        """
+        self.nombre_villes = nombre_villes
+        self.duree = taille_tabu
+        self.duree_min = max(1, taille_tabu // 4)
+        self.duree_max = max(4 * taille_tabu, taille_tabu + 2)
+        self.stagnation_max = self.stagnation or max(20, nombre_villes)
+        self.longueur_diversification = self.duree_diversification or max(10, self.stagnation_max // 2)
+
+        self._visites = {}  # clé du parcours -> [dernière itération de visite, nombre de visites]
+        self._derniere_modification = 0
+        self._cycle_moyen = float(taille_tabu)
+        self.frequences = {}  # arête -> nombre de fois où elle a été ajoutée
+        self._frequence_max = 0
+        self.elite = []  # [distance, parcours (tuple), utilisations], du meilleur au moins bon
+        self._meilleure_phase = (float('inf'), None)
+        self.fin_diversification = -1
+        self._echelle_penalite = 0.0
+        self._derniere_relance = 0
+        self._prochaine_relance = "diversification"
+
+        self.repetitions = 0
+        self.aspirations = 0
+        self.relances = {"intensification": 0, "diversification": 0}
+
+    # --- Durée Tabou Réactive ---
+
+    def visiter(self, cle, iteration):
+        """
+        Mémorise la visite du parcours de clé 'cle' et adapte la durée tabou.
+        Retourne True si ce parcours a été visité plus de 'repetitions_max' fois : la recherche est piégée.
+        """
+        visite = self._visites.get(cle)
+        if visite is None:
+            self._visites[cle] = [iteration, 1]
+            if self.duree_reactive and iteration - self._derniere_modification > self._cycle_moyen:
+                # Pas de répétition depuis plus d'un cycle moyen : la durée tabou peut être réduite
+                self.duree = max(self.duree_min, int(self.duree * self.diminution))
+                self._derniere_modification = iteration
+            return False
+
+        self.repetitions += 1
+        longueur_cycle = iteration - visite[0]
+        visite[0] = iteration
+        visite[1] += 1
+        if self.duree_reactive:
+            self._cycle_moyen = 0.9 * self._cycle_moyen + 0.1 * longueur_cycle
+            self.duree = min(self.duree_max, int(self.duree * self.augmentation) + 1)
+            self._derniere_modification = iteration
+        return visite[1] > self.repetitions_max
+
+    # --- Fréquences des Arêtes et Diversification ---
+
+    def noter_aretes(self, aretes):
+        for arete in aretes:
+            frequence = self.frequences.get(arete, 0) + 1
+            self.frequences[arete] = frequence
+            if frequence > self._frequence_max:
+                self._frequence_max = frequence
+
+    def en_diversification(self, iteration):
+        return iteration <= self.fin_diversification
+
+    def penalite(self, aretes):
+        """
+        Pénalité (en unités de distance) d'un mouvement qui ajoute les arêtes 'aretes', pendant une diversification.
+        """
+        frequences = self.frequences
+        return self._echelle_penalite * sum(frequences.get(arete, 0) for arete in aretes)
+
+    # --- Ensemble d'Élite et Relances ---
+
+    def noter(self, solution, distance):
+        """
+        Retient la meilleure solution de la phase en cours (proposée à l'élite lors de la prochaine relance).
+        """
+        if distance < self._meilleure_phase[0]:
+            self._meilleure_phase = (distance, tuple(solution))
+
+    def proposer_elite(self, distance, parcours):
+        if parcours is None or any(parcours == autre for _, autre, _ in self.elite):
+            return
+        if len(self.elite) >= self.taille_elite:
+            if distance >= self.elite[-1][0]:
+                return
+            self.elite.pop()
+        self.elite.append([distance, parcours, 0])
+        self.elite.sort(key=lambda membre: membre[0])
+
+    def relance(self, iteration, iteration_amelioration, meilleure_distance, echappement=False):
+        """
+        Décide d'une relance après 'stagnation' itérations sans amélioration (ou immédiatement si la recherche
+        est piégée). Retourne None, ("intensification", parcours d'élite) ou ("diversification", None).
+        """
+        if not echappement and iteration - max(iteration_amelioration, self._derniere_relance) < self.stagnation_max:
+            return None
+        self._derniere_relance = iteration
+        self.proposer_elite(*self._meilleure_phase)
+        self._meilleure_phase = (float('inf'), None)
+
+        intensifier = self.intensification and self.elite and (
+            not self.diversification or (self._prochaine_relance == "intensification" and not echappement))
+        if intensifier:
+            # Repartir du parcours d'élite le moins utilisé (le meilleur, à égalité)
+            membre = min(self.elite, key=lambda membre: membre[2])
+            membre[2] += 1
+            self._prochaine_relance = "diversification"
+            self.relances["intensification"] += 1
+            return "intensification", list(membre[1])
+        if self.diversification:
+            self.fin_diversification = iteration + self.longueur_diversification
+            if self._frequence_max:
+                self._echelle_penalite = (self.poids_frequence * meilleure_distance
+                                          / self.nombre_villes / self._frequence_max)
+            self._prochaine_relance = "intensification"
+            self.relances["diversification"] += 1
+            return "diversification", None
+        return None
+
+    def rapport(self):
+        return {"duree_tabou": self.duree, "repetitions": self.repetitions, "aspirations": self.aspirations,
+                "relances": dict(self.relances), "elite": [membre[0] for membre in self.elite]}